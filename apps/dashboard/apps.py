@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.dashboard'
+
+    def ready(self):
+        from apps.ingest.signals import metric_records_changed
+
+        from .documents import on_metric_records_changed
+
+        metric_records_changed.connect(on_metric_records_changed, dispatch_uid="dashboard_chart_documents")
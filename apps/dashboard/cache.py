@@ -0,0 +1,107 @@
+"""Chart Response Cache - Versioned cache for chart API payloads
+
+Payloads are cached under (data version, filter parameters) as encoded
+bytes by content coding (see encoding.encode_variants), so a hit is
+written to the response as-is. The data
+version comes from apps.ingest.versioning and is bumped on commit of every
+upload, rollback or admin edit, so an old entry is simply never looked up
+again. Nothing has to be deleted, which is what lets every gunicorn worker
+keep its own cache and still never serve stale data.
+
+Example:
+    from apps.dashboard.cache import get_cached_chart, set_cached_chart
+
+    variants = get_cached_chart(version, params)
+    if variants is None:
+        variants = encode_variants(to_chartjs(get_dashboard_data(...)))
+        set_cached_chart(version, params, variants)
+"""
+
+import hashlib
+import os
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+from apps.monitoring import metrics
+
+# Per-process counters (read through cache_stats; /metrics has the sum over all workers)
+_stats = {"hits": 0, "misses": 0}
+
+
+def _cache():
+    return caches[getattr(settings, "CHART_CACHE_ALIAS", "default")]
+
+
+def _params_digest(params: Tuple[Any, ...]) -> str:
+    return hashlib.md5(repr(params).encode("utf-8")).hexdigest()
+
+
+def chart_cache_key(version: int, params: Tuple[Any, ...]) -> str:
+    """Build a backend-safe cache key from the data version and filter parameters."""
+    return f"chart:v{version}:{_params_digest(params)}"
+
+
+def chart_etag(version: int, params: Tuple[Any, ...]) -> str:
+    """Strong ETag for a chart payload: identical for the same data version and filters."""
+    return f'"v{version}-{_params_digest(params)}"'
+
+
+def get_cached_chart(version: int, params: Tuple[Any, ...]) -> Optional[Dict[str, bytes]]:
+    """Return the cached payload variants for this version and filters, or None on a miss."""
+    variants = _cache().get(chart_cache_key(version, params))
+    _count(variants)
+    return variants
+
+
+async def aget_cached_chart(version: int, params: Tuple[Any, ...]) -> Optional[Dict[str, bytes]]:
+    """Async get_cached_chart (the cache backend's aget)."""
+    variants = await _cache().aget(chart_cache_key(version, params))
+    _count(variants)
+    return variants
+
+
+def _count(variants: Optional[Dict[str, bytes]]) -> None:
+    result = "miss" if variants is None else "hit"
+    _stats["misses" if variants is None else "hits"] += 1
+    metrics.inc("cache_lookups_total", cache="chart", result=result)
+
+
+def set_cached_chart(version: int, params: Tuple[Any, ...], variants: Dict[str, bytes]) -> None:
+    """Store the encoded payload variants for this version and filters."""
+    _cache().set(
+        chart_cache_key(version, params),
+        variants,
+        timeout=getattr(settings, "CHART_CACHE_TIMEOUT", 3600),
+    )
+
+
+async def aset_cached_chart(version: int, params: Tuple[Any, ...], variants: Dict[str, bytes]) -> None:
+    """Async set_cached_chart (the cache backend's aset)."""
+    await _cache().aset(
+        chart_cache_key(version, params),
+        variants,
+        timeout=getattr(settings, "CHART_CACHE_TIMEOUT", 3600),
+    )
+
+
+def get_cached_facets(version: int) -> Optional[Dict[str, Any]]:
+    """Return the cached filter options for this data version, or None."""
+    return _cache().get(f"facets:v{version}")
+
+
+def set_cached_facets(version: int, facets: Dict[str, Any]) -> None:
+    """Store filter options for this data version."""
+    _cache().set(f"facets:v{version}", facets, timeout=getattr(settings, "CHART_CACHE_TIMEOUT", 3600))
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters of the current worker process."""
+    total = _stats["hits"] + _stats["misses"]
+    return {
+        "pid": os.getpid(),
+        "hits": _stats["hits"],
+        "misses": _stats["misses"],
+        "hit_ratio": round(_stats["hits"] / total, 4) if total else None,
+    }
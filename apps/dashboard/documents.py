@@ -0,0 +1,155 @@
+"""Chart Documents - Materialized chart payloads per (year, department)
+
+The default chart view (metric_by_year, departments summed, year
+resolution) has few filter combinations: every (year, department) pair plus
+the "all years" / "all departments" variants. Each one is stored as a
+ChartDocument holding the encoded JSON, and regenerated when ingest reports
+the partitions it changed (apps.ingest.signals.metric_records_changed), so
+serving it costs one primary-key lookup regardless of MetricRecord size.
+The gzip / brotli variants are stored alongside (see encoding.py).
+
+Documents are rebuilt from the table inside the writing transaction and
+served without a version check, so two concurrent writers must not
+rebuild the shared partitions ((None, None) is touched by every write)
+from their own snapshots. Writers hold apps.ingest.versioning.lock_data_writes()
+for the whole transaction, so each rebuild reads every earlier commit.
+
+Example:
+    from apps.dashboard.documents import get_document
+
+    document = get_document(year=2024, department=None)
+    if document is not None:
+        variants, etag, updated_at = document
+"""
+
+import hashlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from apps.ingest.models import MetricRecord
+
+from .encoding import (
+    ENCODING_BROTLI,
+    ENCODING_GZIP,
+    ENCODING_IDENTITY,
+    compress_variants,
+    encode_json,
+)
+from .models import ChartDocument
+from .services import AGGREGATION_SUM, get_dashboard_data
+from .utils.chart_builder import SHAPE_METRIC_BY_YEAR, build_chart
+
+ALL = "*"
+
+# (year or None, department or None); None stands for "all"
+Partition = Tuple[Optional[int], Optional[str]]
+
+
+def document_key(year: Optional[int], department: Optional[str]) -> str:
+    """Primary key of the document for a filter combination."""
+    return f"{ALL if year is None else year}|{department or ALL}"
+
+
+def _document_query(year: Optional[int], department: Optional[str]) -> Any:
+    return ChartDocument.objects.filter(pk=document_key(year, department)).values_list(
+        "payload", "payload_gzip", "payload_br", "etag", "updated_at"
+    )
+
+
+def get_document(
+    year: Optional[int], department: Optional[str]
+) -> Optional[Tuple[Dict[str, bytes], str, datetime]]:
+    """Return (variants by content coding, etag, updated_at) of a stored document, or None."""
+    return _document_variants(_document_query(year, department).first())
+
+
+async def aget_document(
+    year: Optional[int], department: Optional[str]
+) -> Optional[Tuple[Dict[str, bytes], str, datetime]]:
+    """Async get_document for async views."""
+    return _document_variants(await _document_query(year, department).afirst())
+
+
+def _document_variants(row: Any) -> Optional[Tuple[Dict[str, bytes], str, datetime]]:
+    if row is None:
+        return None
+    payload, payload_gzip, payload_br, etag, updated_at = row
+    variants = {ENCODING_IDENTITY: bytes(payload)}
+    if payload_gzip is not None:
+        variants[ENCODING_GZIP] = bytes(payload_gzip)
+    if payload_br is not None:
+        variants[ENCODING_BROTLI] = bytes(payload_br)
+    return variants, etag, updated_at
+
+
+def encode_payload(chart: dict) -> bytes:
+    """Compact UTF-8 JSON, the same bytes the API sends."""
+    return encode_json(chart)
+
+
+def partitions_for(keys: Iterable[Tuple[int, str, str]]) -> Set[Partition]:
+    """Every document affected by changes to the given (year, department, metric_type) keys."""
+    partitions: Set[Partition] = set()
+    for year, department, _ in keys:
+        partitions.update({(year, department), (year, None), (None, department)})
+    if partitions:
+        partitions.add((None, None))
+    return partitions
+
+
+def regenerate_documents(partitions: Iterable[Partition]) -> None:
+    """
+    Rebuild the documents of the given partitions; empty ones are deleted.
+
+    The caller's transaction must hold lock_data_writes() (see module docstring).
+
+    Args:
+        partitions: (year, department) pairs, None meaning "all"
+    """
+    documents = []
+    empty = []
+    for year, department in partitions:
+        records = get_dashboard_data(
+            year=year,
+            departments=[department] if department else None,
+            aggregation=AGGREGATION_SUM,
+        )
+        key = document_key(year, department)
+        if not records:
+            empty.append(key)
+            continue
+        payload = encode_payload(build_chart(records, SHAPE_METRIC_BY_YEAR))
+        variants = compress_variants(payload)
+        documents.append(
+            ChartDocument(
+                key=key,
+                payload=payload,
+                payload_gzip=variants.get(ENCODING_GZIP),
+                payload_br=variants.get(ENCODING_BROTLI),
+                etag=f'"{hashlib.md5(payload).hexdigest()}"',
+            )
+        )
+
+    if empty:
+        ChartDocument.objects.filter(pk__in=empty).delete()
+    if documents:
+        ChartDocument.objects.bulk_create(
+            documents,
+            update_conflicts=True,
+            unique_fields=["key"],
+            update_fields=["payload", "payload_gzip", "payload_br", "etag", "updated_at"],
+        )
+
+
+def rebuild_documents() -> int:
+    """Regenerate every document from the current data. Returns the number of partitions."""
+    pairs = MetricRecord.objects.filter(month__isnull=True).values_list("year", "department").distinct()
+    partitions = partitions_for((year, department, None) for year, department in pairs)
+    ChartDocument.objects.all().delete()
+    regenerate_documents(partitions)
+    return len(partitions)
+
+
+def on_metric_records_changed(sender, keys, **kwargs) -> None:
+    """Receiver for apps.ingest.signals.metric_records_changed."""
+    regenerate_documents(partitions_for(keys))
@@ -0,0 +1,136 @@
+"""Chart Payload Encoding - Pre-serialized JSON with compressed variants
+
+Chart payloads are encoded once, when they are built, into compact UTF-8
+JSON bytes plus gzip and (when the brotli package is installed) brotli
+variants. The chart API then only picks the variant the client's
+Accept-Encoding allows and writes the bytes, with no renderer, Decimal
+conversion or compression per request.
+
+orjson is used for serialization when installed; otherwise the standard
+library json module produces the same compact output.
+
+Example:
+    from apps.dashboard.encoding import choose_encoding, encode_variants
+
+    variants = encode_variants(build_chart(records))
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""), variants)
+    body = variants[encoding]
+"""
+
+import gzip
+import json
+from decimal import Decimal
+from typing import Any, Dict, Iterable
+
+try:
+    import orjson
+except ImportError:  # optional, faster serializer
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # optional, "br" variants are skipped without it
+    brotli = None
+
+ENCODING_IDENTITY = "identity"
+ENCODING_GZIP = "gzip"
+ENCODING_BROTLI = "br"
+
+# Server preference when the client accepts several encodings equally
+ENCODING_PREFERENCE = (ENCODING_BROTLI, ENCODING_GZIP, ENCODING_IDENTITY)
+
+# Bodies shorter than this are not worth compressing (same threshold as GZipMiddleware)
+MIN_COMPRESS_SIZE = 200
+
+# Variants are built once per data version, so the slowest (smallest) settings pay off
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+def _default(value: Any) -> Any:
+    """Serialize the Decimal values that can appear in aggregated records."""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_json(payload: Any) -> bytes:
+    """Compact UTF-8 JSON without ASCII escaping."""
+    if orjson is not None:
+        return orjson.dumps(payload, default=_default)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"), default=_default).encode("utf-8")
+
+
+def compress_variants(body: bytes) -> Dict[str, bytes]:
+    """
+    The identity body plus every compressed variant that is actually smaller.
+
+    Args:
+        body: Encoded JSON
+
+    Returns:
+        dict: {'identity': body, 'gzip': ..., 'br': ...}
+    """
+    variants = {ENCODING_IDENTITY: body}
+    if len(body) < MIN_COMPRESS_SIZE:
+        return variants
+
+    # mtime=0 keeps the gzip bytes identical for identical payloads
+    compressed = gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if len(compressed) < len(body):
+        variants[ENCODING_GZIP] = compressed
+    if brotli is not None:
+        compressed = brotli.compress(body, quality=BROTLI_QUALITY)
+        if len(compressed) < len(body):
+            variants[ENCODING_BROTLI] = compressed
+    return variants
+
+
+def encode_variants(payload: Any) -> Dict[str, bytes]:
+    """Encode a payload and build its compressed variants."""
+    return compress_variants(encode_json(payload))
+
+
+def choose_encoding(accept_encoding: str, available: Iterable[str]) -> str:
+    """
+    Pick the best available content coding for an Accept-Encoding header.
+
+    Higher q-values win, ties go to ENCODING_PREFERENCE (compressed first).
+    Codings with q=0 are never chosen; identity is the fallback.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding request header
+        available: Encodings present for the payload (identity always is)
+
+    Returns:
+        str: "br", "gzip" or "identity"
+    """
+    weights: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        weights[coding] = weight
+
+    wildcard = weights.get("*", 0.0)
+    # identity is acceptable unless excluded explicitly (RFC 9110 12.5.3)
+    identity_default = wildcard if "*" in weights else 1.0
+    best, best_weight = ENCODING_IDENTITY, 0.0
+    for coding in ENCODING_PREFERENCE:
+        if coding == ENCODING_IDENTITY:
+            weight = weights.get(coding, identity_default)
+        elif coding in available:
+            weight = weights.get(coding, wildcard)
+        else:
+            continue
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
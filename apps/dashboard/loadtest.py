@@ -0,0 +1,371 @@
+"""Load Test - Virtual dashboard users against a running server
+
+Each virtual user behaves like staff in a browser: it logs in through the
+login form (CSRF token included), loads /dashboard/, reads the filter
+values the page offers (default_filters), renders the default chart and
+then makes a burst of chart-data calls as it changes filters, sending
+If-None-Match for queries it has already seen just like the page script.
+After the burst it reloads the dashboard and starts over until the run
+ends.
+
+Filter changes are drawn from a weighted mix of FILTER_KINDS:
+    default          the page's initial chart (latest year, all departments)
+    year             one of the offered years, all departments
+    department       all years, one of the offered departments
+    year_department  one year and one department
+    all              all years, all departments
+
+Requests run on one keep-alive HTTP connection per virtual user (threads,
+standard library only). The result is a JSON-serializable dict with
+throughput, latency percentiles, error rates and a latency histogram for
+the dashboard and chart requests, and the same per endpoint (login,
+dashboard, chart).
+
+Example:
+    from apps.dashboard.loadtest import LoadTestConfig, run_load_test
+
+    result = run_load_test(LoadTestConfig(base_url="http://127.0.0.1:8000", users=["loadtest-001"],
+                                          password="secret", duration=30))
+"""
+
+import ast
+import http.client
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from http.cookies import SimpleCookie
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode, urlsplit
+
+FILTER_KIND_DEFAULT = "default"
+FILTER_KIND_YEAR = "year"
+FILTER_KIND_DEPARTMENT = "department"
+FILTER_KIND_YEAR_DEPARTMENT = "year_department"
+FILTER_KIND_ALL = "all"
+FILTER_KINDS = (
+    FILTER_KIND_DEFAULT,
+    FILTER_KIND_YEAR,
+    FILTER_KIND_DEPARTMENT,
+    FILTER_KIND_YEAR_DEPARTMENT,
+    FILTER_KIND_ALL,
+)
+DEFAULT_MIX = "default=20,year=30,department=20,year_department=25,all=5"
+
+ENDPOINT_LOGIN = "login"
+ENDPOINT_DASHBOARD = "dashboard"
+ENDPOINT_CHART = "chart"
+
+LOGIN_PATH = "/login/"
+DASHBOARD_PATH = "/dashboard/"
+CHART_PATH = "/api/dashboard/chart-data/"
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open
+HISTOGRAM_BOUNDS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+CSRF_INPUT = re.compile(r'name="csrfmiddlewaretoken" value="([^"]+)"')
+DEFAULT_FILTERS_SCRIPT = re.compile(r'<script id="default-filters" type="application/json">(.*?)</script>', re.S)
+
+
+@dataclass
+class LoadTestConfig:
+    """Parameters of one run (echoed in the result)."""
+
+    base_url: str
+    users: Sequence[str]
+    password: str
+    duration: float = 30.0
+    max_requests: int = 0
+    burst: int = 10
+    think_time: float = 0.0
+    ramp_up: float = 0.0
+    mix: Dict[str, float] = field(default_factory=lambda: parse_mix(DEFAULT_MIX))
+    revalidate: bool = True
+    timeout: float = 30.0
+    seed: int = 0
+
+
+def parse_mix(value: str) -> Dict[str, float]:
+    """Parse 'year=30,department=20,...' into weights by filter kind.
+
+    Raises:
+        ValueError: Unknown filter kind, negative weight or no positive weight
+    """
+    mix: Dict[str, float] = {}
+    for part in value.split(","):
+        if not part.strip():
+            continue
+        kind, _, weight = part.partition("=")
+        kind = kind.strip()
+        if kind not in FILTER_KINDS:
+            raise ValueError(f"Unknown filter kind '{kind}'. Choose from: {', '.join(FILTER_KINDS)}")
+        mix[kind] = float(weight) if weight.strip() else 1.0
+        if mix[kind] < 0:
+            raise ValueError(f"Negative weight for '{kind}'")
+    if not any(weight > 0 for weight in mix.values()):
+        raise ValueError("The mix needs at least one positive weight")
+    return mix
+
+
+def parse_default_filters(html: str) -> Dict[str, Any]:
+    """The default_filters the dashboard page embeds (JSON, or the dict repr older templates render)."""
+    match = DEFAULT_FILTERS_SCRIPT.search(html)
+    if match is None:
+        return {}
+    text = match.group(1).strip()
+    try:
+        return json.loads(text)
+    except ValueError:
+        try:
+            value = ast.literal_eval(text)
+        except (ValueError, SyntaxError):
+            return {}
+        return value if isinstance(value, dict) else {}
+
+
+def chart_filters(kind: str, default_filters: Dict[str, Any], rng: random.Random) -> Dict[str, Any]:
+    """Query parameters the page sends for one filter change of the given kind."""
+    years = default_filters.get("all_years") or []
+    departments = default_filters.get("departments") or []
+    if kind == FILTER_KIND_DEFAULT:
+        year = default_filters.get("default_year")
+        return {"year": year} if year else {}
+    params: Dict[str, Any] = {}
+    if kind in (FILTER_KIND_YEAR, FILTER_KIND_YEAR_DEPARTMENT) and years:
+        params["year"] = rng.choice(years)
+    if kind in (FILTER_KIND_DEPARTMENT, FILTER_KIND_YEAR_DEPARTMENT) and departments:
+        params["department"] = rng.choice(departments)
+    return params
+
+
+class LoginFailed(Exception):
+    """The login form did not produce an authenticated session."""
+
+
+class VirtualUser:
+    """One browser: a keep-alive connection, its cookies and its ETag cache."""
+
+    def __init__(self, config: LoadTestConfig, username: str, index: int, recorder: "Recorder") -> None:
+        self.config = config
+        self.username = username
+        self.recorder = recorder
+        self.rng = random.Random(config.seed * 1000 + index)
+        self.url = urlsplit(config.base_url)
+        self.cookies: Dict[str, str] = {}
+        self.etags: Dict[str, str] = {}
+        self.default_filters: Dict[str, Any] = {}
+        self.connection: Optional[http.client.HTTPConnection] = None
+        self.kinds = [kind for kind, weight in config.mix.items() if weight > 0]
+        self.weights = [config.mix[kind] for kind in self.kinds]
+
+    # --- HTTP -------------------------------------------------------------
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.connection is None:
+            connection_class = (
+                http.client.HTTPSConnection if self.url.scheme == "https" else http.client.HTTPConnection
+            )
+            self.connection = connection_class(self.url.hostname, self.url.port, timeout=self.config.timeout)
+        return self.connection
+
+    def request(
+        self, endpoint: str, method: str, path: str, body: Optional[str] = None, revalidate: bool = False
+    ) -> Tuple[int, str]:
+        """Send one request and record it. Returns (status, body); status 0 on connection errors."""
+        headers = {"Accept-Encoding": "identity"}
+        if self.cookies:
+            headers["Cookie"] = "; ".join(f"{name}={value}" for name, value in self.cookies.items())
+        if body is not None:
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+            headers["Referer"] = f"{self.config.base_url}{path}"
+        if revalidate and path in self.etags:
+            headers["If-None-Match"] = self.etags[path]
+
+        started = time.perf_counter()
+        try:
+            connection = self._connect()
+            connection.request(method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            content = response.read()
+        except (OSError, http.client.HTTPException):
+            self.recorder.add(endpoint, 0, time.perf_counter() - started)
+            self.close()  # reconnect on the next request
+            return 0, ""
+        self.recorder.add(endpoint, response.status, time.perf_counter() - started)
+
+        for header in response.headers.get_all("Set-Cookie") or ():
+            for name, morsel in SimpleCookie(header).items():
+                self.cookies[name] = morsel.value
+        etag = response.headers.get("ETag")
+        if etag and response.status == 200:
+            self.etags[path] = etag
+        return response.status, content.decode("utf-8", "replace")
+
+    def close(self) -> None:
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    # --- scenario ---------------------------------------------------------
+
+    def login(self) -> None:
+        """GET the login form, then POST the credentials with its CSRF token."""
+        status, html = self.request(ENDPOINT_LOGIN, "GET", LOGIN_PATH)
+        match = CSRF_INPUT.search(html)
+        if status != 200 or match is None:
+            raise LoginFailed(f"{self.username}: login form returned {status}")
+        body = urlencode(
+            {"username": self.username, "password": self.config.password, "csrfmiddlewaretoken": match.group(1)}
+        )
+        status, _ = self.request(ENDPOINT_LOGIN, "POST", LOGIN_PATH, body=body)
+        if status != 302:
+            raise LoginFailed(f"{self.username}: login returned {status} (wrong password?)")
+
+    def load_dashboard(self) -> None:
+        status, html = self.request(ENDPOINT_DASHBOARD, "GET", DASHBOARD_PATH, revalidate=self.config.revalidate)
+        if status == 200:
+            self.default_filters = parse_default_filters(html) or self.default_filters
+
+    def change_filters(self, kind: str) -> None:
+        params = chart_filters(kind, self.default_filters, self.rng)
+        path = f"{CHART_PATH}?{urlencode(params)}"
+        self.request(ENDPOINT_CHART, "GET", path, revalidate=self.config.revalidate)
+
+    def run(self, deadline: float, budget: "RequestBudget") -> None:
+        """Dashboard visits (page, default chart, burst of filter changes) until the run ends."""
+
+        def proceed() -> bool:
+            return time.monotonic() < deadline and budget.take()
+
+        try:
+            self.login()
+            while proceed():
+                self.load_dashboard()
+                for position in range(self.config.burst):
+                    if not proceed():
+                        return
+                    if position == 0:
+                        self.change_filters(FILTER_KIND_DEFAULT)
+                        continue
+                    if self.config.think_time:
+                        time.sleep(self.config.think_time)
+                    self.change_filters(self.rng.choices(self.kinds, self.weights)[0])
+        except LoginFailed as error:
+            self.recorder.fail(str(error))
+        finally:
+            self.close()
+
+
+class RequestBudget:
+    """Shared cap on the dashboard and chart requests of a run, logins excluded (0 = unlimited)."""
+
+    def __init__(self, limit: int) -> None:
+        self.remaining = limit if limit > 0 else None
+        self._lock = threading.Lock()
+
+    def take(self) -> bool:
+        if self.remaining is None:
+            return True
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            return True
+
+
+class Recorder:
+    """Samples (endpoint, status, seconds) from every virtual user."""
+
+    def __init__(self) -> None:
+        self.samples: List[Tuple[str, int, float]] = []
+        self.failures: List[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, endpoint: str, status: int, seconds: float) -> None:
+        with self._lock:
+            self.samples.append((endpoint, status, seconds))
+
+    def fail(self, message: str) -> None:
+        with self._lock:
+            self.failures.append(message)
+
+
+def run_load_test(config: LoadTestConfig) -> Dict[str, Any]:
+    """Run the virtual users against config.base_url and summarize the samples."""
+    recorder = Recorder()
+    budget = RequestBudget(config.max_requests)
+    started_at = time.time()
+    started = time.monotonic()
+    deadline = started + config.ramp_up + config.duration
+    threads = []
+    for index, username in enumerate(config.users):
+        user = VirtualUser(config, username, index, recorder)
+        thread = threading.Thread(target=user.run, args=(deadline, budget), name=f"vu-{index}", daemon=True)
+        threads.append(thread)
+        thread.start()
+        if config.ramp_up and len(config.users) > 1:
+            time.sleep(config.ramp_up / (len(config.users) - 1))
+    for thread in threads:
+        thread.join()
+    elapsed = time.monotonic() - started
+
+    result: Dict[str, Any] = {
+        "config": {
+            **{name: value for name, value in asdict(config).items() if name != "password"},
+            "users": len(config.users),
+        },
+        "started_at": started_at,
+        "elapsed_seconds": round(elapsed, 3),
+        "login_failures": recorder.failures,
+    }
+    # Logins (password hashing) happen once per user; the totals describe the dashboard traffic
+    result.update(summarize([sample for sample in recorder.samples if sample[0] != ENDPOINT_LOGIN], elapsed))
+    result["endpoints"] = {
+        endpoint: summarize([sample for sample in recorder.samples if sample[0] == endpoint], elapsed)
+        for endpoint in (ENDPOINT_LOGIN, ENDPOINT_DASHBOARD, ENDPOINT_CHART)
+    }
+    return result
+
+
+def summarize(samples: List[Tuple[str, int, float]], elapsed: float) -> Dict[str, Any]:
+    """Throughput, status counts, error rate, latency percentiles and histogram of samples.
+
+    Errors are connection failures (status 0) and 4xx / 5xx responses; 304
+    answers to revalidations count as successes.
+    """
+    latencies = sorted(seconds * 1000 for _, _, seconds in samples)
+    statuses: Dict[str, int] = {}
+    for _, status, _ in samples:
+        statuses[str(status)] = statuses.get(str(status), 0) + 1
+    errors = sum(1 for _, status, _ in samples if status == 0 or status >= 400)
+
+    histogram = []
+    lower = 0
+    for upper in HISTOGRAM_BOUNDS_MS + (None,):
+        count = sum(1 for value in latencies if value >= lower and (upper is None or value < upper))
+        histogram.append({"from_ms": lower, "to_ms": upper, "count": count})
+        lower = upper
+
+    return {
+        "requests": len(samples),
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed > 0 else 0.0,
+        "status_counts": dict(sorted(statuses.items())),
+        "errors": errors,
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "latency_ms": {
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else None,
+            "p50": _percentile(latencies, 50),
+            "p95": _percentile(latencies, 95),
+            "p99": _percentile(latencies, 99),
+            "max": round(latencies[-1], 2) if latencies else None,
+        },
+        "histogram": histogram,
+    }
+
+
+def _percentile(ordered: List[float], percent: int) -> Optional[float]:
+    if not ordered:
+        return None
+    return round(ordered[min(len(ordered) - 1, len(ordered) * percent // 100)], 2)
@@ -0,0 +1,111 @@
+"""Load-test the dashboard and chart API the way staff use them.
+
+Virtual users log in, load /dashboard/ and make bursts of chart-data calls
+with filters taken from the page's default_filters (see
+apps/dashboard/loadtest.py). Prints the result as JSON so runs can be
+compared.
+
+Run it with the same settings / DB_* environment as the server when using
+--create-users (the accounts are created in that database). Because that
+may be a shared database, --create-users needs DEBUG or --allow-remote-db,
+and the password is always given explicitly.
+
+Usage:
+    python manage.py loadtest --create-users --password "$LOADTEST_PASSWORD" --users 20 --duration 60
+    python manage.py loadtest --base-url http://127.0.0.1:8000 --password "$LOADTEST_PASSWORD" --users 50 \\
+        --burst 15 --think-time 0.2 --mix "year=40,department=30,year_department=30" --output run-a.json
+"""
+
+import json
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from apps.dashboard.loadtest import DEFAULT_MIX, LoadTestConfig, parse_mix, run_load_test
+
+
+class Command(BaseCommand):
+    help = "Run concurrent virtual dashboard users against a running server and report JSON statistics"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="Server to test")
+        parser.add_argument("--users", type=int, default=10, help="Concurrent virtual users")
+        parser.add_argument("--user-prefix", default="loadtest", help="Accounts are <prefix>-001, <prefix>-002, ...")
+        parser.add_argument("--password", required=True, help="Password of the accounts")
+        parser.add_argument(
+            "--create-users", action="store_true", help="Create the accounts (or reset their password) first"
+        )
+        parser.add_argument(
+            "--allow-remote-db",
+            action="store_true",
+            help="Allow --create-users when DEBUG is off (the configured database may be production)",
+        )
+        parser.add_argument("--duration", type=float, default=30.0, help="Seconds to run after the ramp-up")
+        parser.add_argument("--max-requests", type=int, default=0, help="Stop after this many requests (0 = no cap)")
+        parser.add_argument("--burst", type=int, default=10, help="Chart calls per dashboard visit")
+        parser.add_argument("--think-time", type=float, default=0.0, help="Seconds between filter changes")
+        parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds over which the users start")
+        parser.add_argument("--mix", default=DEFAULT_MIX, help="Weights of the filter kinds")
+        parser.add_argument(
+            "--no-revalidate", action="store_true", help="Do not send If-None-Match for repeated queries"
+        )
+        parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed of the filter choices")
+        parser.add_argument("--output", help="Write the JSON result to this file instead of stdout")
+
+    def handle(self, *args, **options):
+        if options["users"] < 1 or options["burst"] < 1:
+            raise CommandError("--users and --burst must be at least 1")
+        try:
+            mix = parse_mix(options["mix"])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        usernames = [f"{options['user_prefix']}-{number:03d}" for number in range(1, options["users"] + 1)]
+        if options["create_users"]:
+            if not settings.DEBUG and not options["allow_remote_db"]:
+                database = settings.DATABASES[DEFAULT_DB_ALIAS]
+                raise CommandError(
+                    f"--create-users would create or reset accounts in {database.get('HOST') or database['NAME']} "
+                    "with DEBUG off. Pass --allow-remote-db if that is intended."
+                )
+            self._create_users(usernames, options["password"])
+
+        config = LoadTestConfig(
+            base_url=options["base_url"].rstrip("/"),
+            users=usernames,
+            password=options["password"],
+            duration=options["duration"],
+            max_requests=options["max_requests"],
+            burst=options["burst"],
+            think_time=options["think_time"],
+            ramp_up=options["ramp_up"],
+            mix=mix,
+            revalidate=not options["no_revalidate"],
+            timeout=options["timeout"],
+            seed=options["seed"],
+        )
+        result = run_load_test(config)
+
+        output = json.dumps(result, indent=2, ensure_ascii=False)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+        else:
+            self.stdout.write(output)
+
+        self.stderr.write(
+            f"{result['requests']} requests, {result['throughput_rps']} req/s, "
+            f"p95 {result['latency_ms']['p95']} ms, error rate {result['error_rate']:.2%}"
+        )
+        if result["login_failures"] and len(result["login_failures"]) == len(usernames):
+            raise CommandError(f"No virtual user could log in: {result['login_failures'][0]}")
+
+    def _create_users(self, usernames, password):
+        User = get_user_model()
+        for username in usernames:
+            user, _ = User.objects.get_or_create(username=username)
+            user.set_password(password)
+            user.save()
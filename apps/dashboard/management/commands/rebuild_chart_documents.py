@@ -0,0 +1,21 @@
+"""Regenerate every pre-rendered chart document from MetricRecord.
+
+Usage:
+    python manage.py rebuild_chart_documents
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from apps.dashboard.documents import rebuild_documents
+from apps.ingest.versioning import lock_data_writes
+
+
+class Command(BaseCommand):
+    help = "Regenerate the ChartDocument table for every (year, department) combination"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            lock_data_writes()
+            count = rebuild_documents()
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {count} chart documents"))
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0001_chart_document'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='chartdocument',
+            name='payload_br',
+            field=models.BinaryField(null=True),
+        ),
+        migrations.AddField(
+            model_name='chartdocument',
+            name='payload_gzip',
+            field=models.BinaryField(null=True),
+        ),
+    ]
@@ -1,3 +1,23 @@
 from django.db import models
 
-# Create your models here.
+
+class ChartDocument(models.Model):
+    """Ready-to-serve chart JSON for one (year, department) filter combination.
+
+    key is "<year>|<department>" with "*" for "all" (see documents.document_key).
+    Documents are regenerated in the ingest transaction for the partitions it
+    touched, so the chart API answers the default filters with one
+    primary-key lookup and returns payload unchanged. payload_gzip and
+    payload_br hold the pre-compressed variants (NULL when compression does
+    not pay off or brotli is not installed; see encoding.py).
+    """
+
+    key = models.CharField(max_length=150, primary_key=True)
+    payload = models.BinaryField()
+    payload_gzip = models.BinaryField(null=True)
+    payload_br = models.BinaryField(null=True)
+    etag = models.CharField(max_length=40)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return self.key
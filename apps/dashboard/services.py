@@ -8,27 +8,124 @@ Example:
 
     data = get_dashboard_data(year=2024, department="컴퓨터공학")
     chart_json = to_chartjs(data)
+
+    # Monthly resolution (dated sources only)
+    monthly = get_dashboard_data(year=2024, resolution="month")
+
+    # Async views (Django async ORM)
+    data = await aget_dashboard_data(year=2024)
 """
 
-from typing import List, Dict, Any, Optional
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence
 from decimal import Decimal
 
-from apps.ingest.models import MetricRecord
+from django.db.models import (
+    Avg, Case, Count, F, FloatField, Max, Min, Sum, Value, ValueRange, When, Window,
+)
+from django.db.models.functions import Cast, Lag, NullIf
+from django.db.models.lookups import Exact
+
+from apps.ingest.facets import read_facets
+from apps.ingest.models import DepartmentMetricRollup, MetricFacet, MetricRecord, YearMetricRollup
+
+from .cache import get_cached_facets, set_cached_facets
+from .utils.chart_builder import SHAPE_METRIC_BY_YEAR, build_chart
+
+RESOLUTION_YEAR = "year"
+RESOLUTION_MONTH = "month"
+RESOLUTIONS = (RESOLUTION_YEAR, RESOLUTION_MONTH)
+
+# Aggregations across departments, computed by the database
+AGGREGATION_SUM = "sum"
+AGGREGATIONS = {
+    AGGREGATION_SUM: Sum,
+    "avg": Avg,
+    "min": Min,
+    "max": Max,
+    "count": Count,
+}
+
+# Aggregations that can be answered from the SUM / COUNT rollup tables
+ROLLUP_AGGREGATIONS = (AGGREGATION_SUM, "avg", "count")
+
+# Derived series computed with window functions per (department, metric_type)
+DERIVATION_YOY = "yoy"
+DERIVATION_YOY_PCT = "yoy_pct"
+DERIVATION_MOVING_AVG = "moving_avg"
+DERIVATIONS = (DERIVATION_YOY, DERIVATION_YOY_PCT, DERIVATION_MOVING_AVG)
+DEFAULT_MOVING_AVG_WINDOW = 3
+MAX_MOVING_AVG_WINDOW = 10
+
+
+class RecordQuery(NamedTuple):
+    """A lazy records query: the queryset and the function that turns its rows into records.
+
+    The get_* functions below fetch it synchronously; their aget_*
+    counterparts iterate the same queryset with the async ORM, so both
+    paths run identical SQL.
+    """
+
+    queryset: Any
+    convert: Callable[[Iterable[Any]], List[Dict[str, Any]]]
 
+    def fetch(self) -> List[Dict[str, Any]]:
+        return self.convert(self.queryset)
 
-def get_dashboard_data(
-    year: Optional[int] = None, department: Optional[str] = None
-) -> List[Dict[str, Any]]:
-    """Retrieve metric records from database based on filters.
+    async def afetch(self) -> List[Dict[str, Any]]:
+        return self.convert([row async for row in self.queryset])
+
+
+def get_dashboard_data(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Retrieve metric records from database based on filters (see dashboard_query)."""
+    return dashboard_query(*args, **kwargs).fetch()
+
+
+async def aget_dashboard_data(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Async get_dashboard_data: the same query, iterated with the async ORM."""
+    return await dashboard_query(*args, **kwargs).afetch()
+
+
+def dashboard_query(
+    year: Optional[int] = None,
+    department: Optional[str] = None,
+    resolution: str = RESOLUTION_YEAR,
+    aggregation: Optional[str] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    departments: Optional[Sequence[str]] = None,
+    metric_types: Optional[Sequence[str]] = None,
+) -> RecordQuery:
+    """Build the metric records query for the given filters.
+
+    Year resolution reads the yearly rows (month IS NULL) directly; for dated
+    sources those are rollups maintained at ingest time. Month resolution
+    groups the monthly rows by (year, month, metric_type) in the database.
+
+    With an aggregation, the selected departments are combined by a SQL
+    GROUP BY on (year, metric_type), so only one row per period and metric
+    is fetched. All-department sums, counts and averages are read from the
+    YearMetricRollup table instead (see apps/ingest/rollups.py).
+
+    All filters are combined into a single query, so a comparison of several
+    departments over a range of years is one round trip.
 
     Args:
         year: Optional year filter (if None, includes all years)
         department: Optional department filter (if None, includes all departments)
+        resolution: "year" (default) or "month"
+        aggregation: Optional key of AGGREGATIONS ("sum", "avg", "min", "max", "count")
+        year_from: Optional first year (inclusive)
+        year_to: Optional last year (inclusive)
+        departments: Optional list of departments (IN filter)
+        metric_types: Optional list of metric types (IN filter)
 
     Returns:
-        List of dictionaries with metric data: [
+        RecordQuery whose records are dictionaries with metric data: [
             {'year': int, 'department': str, 'metric_type': str, 'metric_value': Decimal}
         ]
+        Aggregated year resolution returns {'year', 'metric_type', 'metric_value'}.
+        Month resolution returns {'year', 'month', 'metric_type', 'metric_value'}
+        aggregated over the selected departments (sum unless given).
     """
     queryset = MetricRecord.objects.all()
 
@@ -38,11 +135,264 @@ def get_dashboard_data(
     if department is not None and department != "":
         queryset = queryset.filter(department=department)
 
-    records = queryset.values("year", "department", "metric_type", "metric_value").order_by(
-        "year", "department", "metric_type"
+    if year_from is not None:
+        queryset = queryset.filter(year__gte=year_from)
+
+    if year_to is not None:
+        queryset = queryset.filter(year__lte=year_to)
+
+    if departments:
+        queryset = queryset.filter(department__in=departments)
+
+    if metric_types:
+        queryset = queryset.filter(metric_type__in=metric_types)
+
+    if resolution == RESOLUTION_MONTH:
+        return _aggregate(
+            queryset.filter(month__isnull=False),
+            ("year", "month", "metric_type"),
+            aggregation or AGGREGATION_SUM,
+        )
+
+    queryset = queryset.filter(month__isnull=True)
+    if aggregation in ROLLUP_AGGREGATIONS and not department and not departments:
+        rollup = YearMetricRollup.objects.all()
+        if year is not None:
+            rollup = rollup.filter(year=year)
+        if year_from is not None:
+            rollup = rollup.filter(year__gte=year_from)
+        if year_to is not None:
+            rollup = rollup.filter(year__lte=year_to)
+        if metric_types:
+            rollup = rollup.filter(metric_type__in=metric_types)
+        return _from_rollup(rollup, ("year", "metric_type"), aggregation)
+
+    if aggregation is not None:
+        return _aggregate(queryset, ("year", "metric_type"), aggregation)
+
+    records = queryset.values(
+        "year", "department", "metric_type", "metric_value"
+    ).order_by("year", "department", "metric_type")
+
+    return RecordQuery(records, list)
+
+
+def _aggregate(queryset: Any, group_by: tuple, aggregation: str) -> RecordQuery:
+    """GROUP BY the given fields and aggregate metric_value into 'metric_value'."""
+    function = AGGREGATIONS[aggregation]
+    rows = (
+        queryset.values(*group_by)
+        .annotate(total=function("metric_value"))
+        .order_by(*group_by)
     )
 
-    return list(records)
+    def convert(rows: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [
+            {**{field: row[field] for field in group_by}, "metric_value": row["total"]}
+            for row in rows
+        ]
+
+    return RecordQuery(rows, convert)
+
+
+def get_department_totals(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Aggregate the yearly rows of each (department, metric_type) across years."""
+    return department_totals_query(*args, **kwargs).fetch()
+
+
+async def aget_department_totals(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Async get_department_totals."""
+    return await department_totals_query(*args, **kwargs).afetch()
+
+
+def department_totals_query(
+    departments: Optional[Sequence[str]] = None,
+    metric_types: Optional[Sequence[str]] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    aggregation: str = AGGREGATION_SUM,
+) -> RecordQuery:
+    """Build the query aggregating each (department, metric_type) across years.
+
+    Without a year range, sums, counts and averages are read from the
+    DepartmentMetricRollup table; otherwise the base table is grouped.
+
+    Args:
+        departments: Optional list of departments (IN filter)
+        metric_types: Optional list of metric types (IN filter)
+        year_from: Optional first year (inclusive)
+        year_to: Optional last year (inclusive)
+        aggregation: Key of AGGREGATIONS (default "sum")
+
+    Returns:
+        RecordQuery of {'department', 'metric_type', 'metric_value'} dictionaries
+    """
+    if aggregation in ROLLUP_AGGREGATIONS and year_from is None and year_to is None:
+        queryset = DepartmentMetricRollup.objects.all()
+    else:
+        queryset = MetricRecord.objects.filter(month__isnull=True)
+        if year_from is not None:
+            queryset = queryset.filter(year__gte=year_from)
+        if year_to is not None:
+            queryset = queryset.filter(year__lte=year_to)
+
+    if departments:
+        queryset = queryset.filter(department__in=departments)
+    if metric_types:
+        queryset = queryset.filter(metric_type__in=metric_types)
+
+    if queryset.model is DepartmentMetricRollup:
+        return _from_rollup(queryset, ("department", "metric_type"), aggregation)
+    return _aggregate(queryset, ("department", "metric_type"), aggregation)
+
+
+def _from_rollup(queryset: Any, group_by: tuple, aggregation: str) -> RecordQuery:
+    """Turn rollup rows (total, row_count) into aggregated records like _aggregate."""
+
+    def convert(rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+        records = []
+        for *key, total, row_count in rows:
+            if aggregation == "count":
+                value = row_count
+            elif aggregation == "avg":
+                value = total / row_count
+            else:
+                value = total
+            records.append({**dict(zip(group_by, key)), "metric_value": value})
+        return records
+
+    return RecordQuery(queryset.order_by(*group_by).values_list(*group_by, "total", "row_count"), convert)
+
+
+def get_derived_series(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Derived yearly series per (department, metric_type) (see derived_series_query)."""
+    return derived_series_query(*args, **kwargs).fetch()
+
+
+async def aget_derived_series(*args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+    """Async get_derived_series."""
+    return await derived_series_query(*args, **kwargs).afetch()
+
+
+def derived_series_query(
+    derivation: str,
+    window: int = DEFAULT_MOVING_AVG_WINDOW,
+    year: Optional[int] = None,
+    year_from: Optional[int] = None,
+    year_to: Optional[int] = None,
+    departments: Optional[Sequence[str]] = None,
+    metric_types: Optional[Sequence[str]] = None,
+) -> RecordQuery:
+    """Derived yearly series per (department, metric_type), computed in the query.
+
+    - yoy: value - value of the previous year
+    - yoy_pct: (value - previous) / previous * 100
+    - moving_avg: AVG over the last `window` years (RANGE frame on year, so
+      missing years shrink the window instead of reaching further back)
+
+    YoY is NULL for the first year and when the previous year is missing or
+    zero (yoy_pct). The window functions run over every year of the
+    partition; the year filters are applied to the windowed result, so the
+    first requested year still sees its predecessors. Works on PostgreSQL and
+    SQLite (window functions with RANGE offsets, SQLite >= 3.28).
+
+    Args:
+        derivation: One of DERIVATIONS
+        window: Moving average width in years (moving_avg only)
+        year: Optional single year
+        year_from: Optional first year (inclusive)
+        year_to: Optional last year (inclusive)
+        departments: Optional list of departments (IN filter)
+        metric_types: Optional list of metric types (IN filter)
+
+    Returns:
+        RecordQuery of {'year', 'department', 'metric_type', 'metric_value'} with
+        the derived value (None where undefined), ordered like get_dashboard_data
+    """
+    queryset = MetricRecord.objects.filter(month__isnull=True)
+    if departments:
+        queryset = queryset.filter(department__in=departments)
+    if metric_types:
+        queryset = queryset.filter(metric_type__in=metric_types)
+
+    first_year = year if year is not None else year_from
+    last_year = year if year is not None else year_to
+    lookback = window - 1 if derivation == DERIVATION_MOVING_AVG else 1
+    if first_year is not None:
+        # Rows older than the lookback can never enter a window
+        queryset = queryset.filter(year__gte=first_year - lookback)
+    if last_year is not None:
+        queryset = queryset.filter(year__lte=last_year)
+
+    partition = [F("department"), F("metric_type")]
+    if derivation == DERIVATION_MOVING_AVG:
+        derived = Window(
+            Avg("metric_value"),
+            partition_by=partition,
+            order_by=F("year").asc(),
+            frame=ValueRange(start=-(window - 1), end=0),
+        )
+    else:
+        previous = Window(Lag("metric_value"), partition_by=partition, order_by=F("year").asc())
+        previous_year = Window(Lag("year"), partition_by=partition, order_by=F("year").asc())
+        if derivation == DERIVATION_YOY:
+            change = F("metric_value") - previous
+        else:
+            # Float division: SQLite would otherwise divide integral values as integers
+            previous_float = Cast(previous, FloatField())
+            change = (
+                (Cast("metric_value", FloatField()) - previous_float)
+                * Value(100.0)
+                / NullIf(previous_float, Value(0.0))
+            )
+        derived = Case(When(Exact(previous_year, F("year") - 1), then=change), default=None)
+
+    rows = queryset.annotate(
+        derived=derived,
+        # The row's own year as a window value, so the year filter below runs on the
+        # windowed result instead of in the WHERE clause that feeds the window
+        row_year=Window(Max("year"), partition_by=[*partition, F("year")]),
+    )
+    if first_year is not None:
+        rows = rows.filter(row_year__gte=first_year)
+
+    def convert(rows: Iterable[tuple]) -> List[Dict[str, Any]]:
+        return [
+            {"year": y, "department": d, "metric_type": m, "metric_value": value}
+            for y, d, m, value in rows
+        ]
+
+    return RecordQuery(
+        rows.order_by("year", "department", "metric_type").values_list(
+            "year", "department", "metric_type", "derived"
+        ),
+        convert,
+    )
+
+
+def get_filter_options(version: int) -> Dict[str, Any]:
+    """Return the dashboard filter options (years, departments, metric types).
+
+    Read from the maintained MetricFacet table in one query and cached per
+    data version, so the cost does not grow with MetricRecord.
+
+    Args:
+        version: Current data version (apps.ingest.versioning.get_data_version)
+
+    Returns:
+        dict: {'years': [int, ...] newest first, 'departments': [str, ...],
+               'metric_types': [str, ...]}
+    """
+    options = get_cached_facets(version)
+    if options is None:
+        facets = read_facets()
+        options = {
+            "years": sorted((int(year) for year in facets[MetricFacet.KIND_YEAR]), reverse=True),
+            "departments": facets[MetricFacet.KIND_DEPARTMENT],
+            "metric_types": facets[MetricFacet.KIND_METRIC_TYPE],
+        }
+        set_cached_facets(version, options)
+    return options
 
 
 def to_chartjs(records: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -50,6 +400,7 @@ def to_chartjs(records: List[Dict[str, Any]]) -> Dict[str, Any]:
 
     This function transforms database records into a format that Chart.js
     can directly render. It groups data by metric_type and creates datasets.
+    Other shapes are available through utils.chart_builder.build_chart.
 
     Args:
         records: List of dictionaries from get_dashboard_data()
@@ -67,66 +418,4 @@ def to_chartjs(records: List[Dict[str, Any]]) -> Dict[str, Any]:
                 ]
             }
     """
-    if not records:
-        return {"labels": [], "datasets": []}
-
-    # Extract unique years and sort them
-    years = sorted(set(record.get("year") for record in records if record.get("year")))
-    labels = [str(year) for year in years]
-
-    if not labels:
-        return {"labels": [], "datasets": []}
-
-    # Group by metric_type and year
-    datasets_map: Dict[str, Dict[str, Any]] = {}
-
-    for record in records:
-        metric_type = record.get("metric_type", "Unknown")
-        year = record.get("year")
-        value = record.get("metric_value", 0)
-
-        if metric_type not in datasets_map:
-            datasets_map[metric_type] = {
-                "label": metric_type,
-                "data": [0] * len(labels),  # Initialize with zeros
-                "backgroundColor": _get_color_for_metric(metric_type),
-            }
-
-        # Find index of the year in labels and set the value
-        year_index = labels.index(str(year))
-        datasets_map[metric_type]["data"][year_index] = float(value)
-
-    datasets = list(datasets_map.values())
-
-    return {"labels": labels, "datasets": datasets}
-
-
-def _get_color_for_metric(metric_type: str) -> str:
-    """Get a color for a given metric type.
-
-    Args:
-        metric_type: The type of metric (e.g., 'PAPER', 'BUDGET', 'STUDENT')
-
-    Returns:
-        str: Hex color code for the metric type
-    """
-    color_map = {
-        # Basic metrics
-        "PAPER": "#4A90E2",  # Blue
-        "BUDGET": "#50E3C2",  # Teal
-        "STUDENT": "#F5A623",  # Orange
-        "PROJECT": "#BD10E0",  # Purple
-        # Department KPI metrics
-        "EMPLOYMENT_RATE": "#7ED321",  # Green
-        "FULL_TIME_FACULTY": "#B8E986",  # Light Green
-        "VISITING_FACULTY": "#A8C959",  # Olive
-        "TECH_TRANSFER_REVENUE": "#F8A623",  # Dark Orange
-        "INTERNATIONAL_CONFERENCE": "#D0021B",  # Red
-        # Publication metrics
-        "PUBLICATION": "#417505",  # Dark Green
-        # Research metrics
-        "RESEARCH_BUDGET": "#FF6B6B",  # Light Red
-        # Student metrics
-        "STUDENT_COUNT": "#4ECDC4",  # Turquoise
-    }
-    return color_map.get(metric_type, "#999999")  # Default gray
+    return build_chart(records, SHAPE_METRIC_BY_YEAR)
@@ -8,16 +8,60 @@ Test Coverage:
   - ChartDataAPIView: Parameter validation and response
   - get_dashboard_data: Filtering logic
   - to_chartjs: Data transformation
+  - Chart shapes: metric_by_year, metric_by_department, grid
+  - Aggregation: SQL GROUP BY across departments (checked against NumPy)
+  - Multi-value filters: year ranges, repeated department / metric_type
+  - Rollup tables: chosen automatically when the filters allow it
+  - Derived series: YoY and moving averages with window functions
+  - Export: Streaming CSV / XLSX of the filtered rows
+  - Chart documents: Pre-rendered payloads regenerated for touched partitions
+  - Content encoding: Pre-encoded gzip / identity chart payloads
+  - Chart response cache: Versioned caching and commit-time invalidation
+  - Query plans: Every chart filter combination uses an index (EXPLAIN)
+  - Read-only views: Exempt from request-wide transactions
+  - Conditional GET: ETag / Last-Modified on chart data and dashboard page
+  - Async chart API: Same responses as the sync view through the async ORM
+  - Load test: Filter mix, summary statistics and the loadtest command against a live server
 """
 
-from django.test import TestCase, Client
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models.query import QuerySet
+from django.test import LiveServerTestCase, SimpleTestCase, TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
-from django.urls import reverse
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import resolve, reverse
 from decimal import Decimal
+import csv
+import gzip
+import io
 import json
+import random
+import zipfile
+from unittest import mock
+from xml.etree import ElementTree
 
-from apps.ingest.models import MetricRecord
-from apps.dashboard.services import get_dashboard_data, to_chartjs
+import numpy as np
+from asgiref.sync import sync_to_async
+
+from apps.ingest.facets import rebuild_facets
+from apps.ingest.rollups import rebuild_rollups
+from apps.ingest.models import MetricRecord, UploadBatch, YearMetricRollup
+from apps.ingest.services import parse_and_save_excel, rollback_batch
+from apps.ingest.versioning import get_data_version, lock_data_writes
+from apps.dashboard import export, loadtest
+from apps.dashboard.documents import document_key, encode_payload, rebuild_documents, regenerate_documents
+from apps.dashboard.models import ChartDocument
+from apps.dashboard.services import (
+    aget_dashboard_data,
+    aget_derived_series,
+    get_dashboard_data,
+    get_department_totals,
+    get_derived_series,
+    to_chartjs,
+)
 
 
 class MetricRecordTestFixture(TestCase):
@@ -25,6 +69,8 @@ class MetricRecordTestFixture(TestCase):
 
     def setUp(self):
         """Create test user and sample data."""
+        # Data versions restart with every test transaction, so cached payloads must not leak
+        cache.clear()
         self.user = User.objects.create_user(
             username="testuser", password="testpass123"
         )
@@ -62,6 +108,9 @@ class MetricRecordTestFixture(TestCase):
                 metric_value=Decimal("20.0000"),
             ),
         ]
+        # Records created directly bypass ingest, so build the facets and rollups here
+        rebuild_facets()
+        rebuild_rollups()
 
 
 class GetDashboardDataTests(MetricRecordTestFixture):
@@ -220,6 +269,31 @@ class DashboardViewTests(MetricRecordTestFixture):
         self.assertIn("컴퓨터공학과", departments)
         self.assertIn("경영학과", departments)
 
+    def test_default_filters_query_count_is_constant(self):
+        """Filter options come from the facet table, cached per data version."""
+        self.client.get("/dashboard/")
+        for i in range(50):
+            MetricRecord.objects.create(
+                year=1900 + i, department=f"학과{i}", metric_type="PAPER", metric_value=Decimal("1")
+            )
+        rebuild_facets()
+        cache.clear()
+
+        with CaptureQueriesContext(connection) as uncached:
+            response = self.client.get("/dashboard/")
+        self.assertEqual(len(response.context["default_filters"]["all_years"]), 53)
+        facet_queries = [q for q in uncached.captured_queries if "ingest_metricrecord" in q["sql"]]
+        self.assertEqual(facet_queries, [])
+
+        with CaptureQueriesContext(connection) as cached:
+            self.client.get("/dashboard/")
+
+        # cache.clear() also dropped the user version tokens, so only the uncached request reloads the user
+        def non_auth(context):
+            return [q for q in context.captured_queries if "auth_user" not in q["sql"]]
+
+        self.assertEqual(len(non_auth(cached)), len(non_auth(uncached)) - 1)
+
 
 class ChartDataAPIViewTests(MetricRecordTestFixture):
     """Test ChartDataAPIView - API endpoint for chart data."""
@@ -287,6 +361,39 @@ class ChartDataAPIViewTests(MetricRecordTestFixture):
         data = response.json()
         self.assertGreater(len(data["labels"]), 0)
 
+    def test_api_department_shape(self):
+        """shape=metric_by_department compares departments within one year."""
+        response = self.client.get("/api/dashboard/chart-data/?year=2024&shape=metric_by_department")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["labels"], ["경영학과", "컴퓨터공학과"])
+        self.assertEqual(data["datasets"][0]["data"], [8.0, 15.0])
+
+    def test_api_grid_shape(self):
+        """shape=grid returns a department × metric matrix."""
+        response = self.client.get("/api/dashboard/chart-data/?year=2023&shape=grid")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(),
+            {
+                "rows": ["컴퓨터공학과"],
+                "columns": ["BUDGET", "PAPER"],
+                "values": [[1000.0, 10.0]],
+                "colors": ["#50E3C2", "#4A90E2"],
+            },
+        )
+
+    def test_api_invalid_shape_returns_400(self):
+        """Unknown shapes, and department shapes at month resolution, return 400."""
+        for query in ("shape=pie", "year=2024&shape=grid&resolution=month"):
+            response = self.client.get(f"/api/dashboard/chart-data/?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_api_invalid_resolution_returns_400(self):
+        """Unknown resolution parameter returns 400."""
+        response = self.client.get("/api/dashboard/chart-data/?resolution=week")
+        self.assertEqual(response.status_code, 400)
+
     def test_api_nonexistent_department_returns_empty(self):
         """TC-26: Non-existent department returns empty chart."""
         response = self.client.get(
@@ -297,3 +404,1068 @@ class ChartDataAPIViewTests(MetricRecordTestFixture):
         self.assertEqual(data["labels"], [])
         self.assertEqual(data["datasets"], [])
 
+
+
+class AggregationTests(MetricRecordTestFixture):
+    """Test database-side aggregation across departments against a NumPy reference."""
+
+    def setUp(self):
+        super().setUp()
+        rng = np.random.default_rng(7)
+        MetricRecord.objects.bulk_create(
+            MetricRecord(
+                year=int(year),
+                department=f"학과{dept}",
+                metric_type=metric_type,
+                metric_value=Decimal(str(round(float(value), 4))),
+            )
+            for dept in range(20)
+            for year in (2023, 2024, 2025)
+            for metric_type, value in (("PAPER", rng.uniform(0, 100)), ("BUDGET", rng.uniform(0, 1e6)))
+        )
+        rebuild_rollups()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def _reference(self, function):
+        """Group (year, metric_type) in NumPy over every yearly row."""
+        rows = list(MetricRecord.objects.values_list("year", "metric_type", "metric_value"))
+        keys = sorted({(year, metric_type) for year, metric_type, _ in rows})
+        values = np.array([float(value) for _, _, value in rows])
+        groups = [(year, metric_type) for year, metric_type, _ in rows]
+        return {
+            key: function(values[[group == key for group in groups]])
+            for key in keys
+        }
+
+    def test_aggregations_match_numpy(self):
+        references = {"sum": np.sum, "avg": np.mean, "min": np.min, "max": np.max, "count": np.size}
+        for aggregation, function in references.items():
+            expected = self._reference(function)
+            rows = get_dashboard_data(aggregation=aggregation)
+
+            self.assertEqual(len(rows), len(expected), aggregation)
+            for row in rows:
+                np.testing.assert_allclose(
+                    float(row["metric_value"]),
+                    expected[(row["year"], row["metric_type"])],
+                    rtol=1e-9,
+                    err_msg=aggregation,
+                )
+
+    def test_aggregation_fetches_one_row_per_year_and_metric(self):
+        with CaptureQueriesContext(connection) as ctx:
+            rows = get_dashboard_data(aggregation="max")
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("GROUP BY", ctx.captured_queries[0]["sql"])
+        self.assertEqual(len(rows), 6)  # 2023-2025 × (PAPER, BUDGET)
+
+    def test_api_defaults_to_sum_across_departments(self):
+        response = self.client.get("/api/dashboard/chart-data/")
+        data = response.json()
+        paper = next(ds for ds in data["datasets"] if ds["label"] == "PAPER")
+        expected = self._reference(np.sum)
+
+        self.assertEqual(data["labels"], ["2023", "2024", "2025"])
+        np.testing.assert_allclose(paper["data"], [expected[(y, "PAPER")] for y in (2023, 2024, 2025)])
+
+    def test_api_aggregation_parameter(self):
+        response = self.client.get("/api/dashboard/chart-data/?aggregation=max")
+        paper = next(ds for ds in response.json()["datasets"] if ds["label"] == "PAPER")
+        expected = self._reference(np.max)
+
+        np.testing.assert_allclose(paper["data"], [expected[(y, "PAPER")] for y in (2023, 2024, 2025)])
+
+    def test_api_invalid_aggregation_returns_400(self):
+        response = self.client.get("/api/dashboard/chart-data/?aggregation=median")
+        self.assertEqual(response.status_code, 400)
+
+
+class MultiValueFilterTests(MetricRecordTestFixture):
+    """Test year ranges and repeated department / metric_type filters."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_year_range_and_lists_in_one_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            records = get_dashboard_data(
+                year_from=2024, year_to=2025, departments=["컴퓨터공학과", "경영학과"], metric_types=["PAPER"]
+            )
+
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertEqual(
+            [(r["year"], r["department"]) for r in records],
+            [(2024, "경영학과"), (2024, "컴퓨터공학과"), (2025, "컴퓨터공학과")],
+        )
+
+    def test_api_groups_series_by_department(self):
+        response = self.client.get(
+            "/api/dashboard/chart-data/?year_from=2023&year_to=2024"
+            "&department=컴퓨터공학과&department=경영학과&metric_type=PAPER"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["labels"], ["2023", "2024"])
+        self.assertEqual(
+            [(ds["department"], ds["metric_type"], ds["data"]) for ds in data["datasets"]],
+            [("경영학과", "PAPER", [0, 8.0]), ("컴퓨터공학과", "PAPER", [10.0, 15.0])],
+        )
+
+    def test_api_comparison_is_one_chart_query(self):
+        url = "/api/dashboard/chart-data/?department=컴퓨터공학과&department=경영학과"
+        with self.assertNumQueries(4):  # session, user, data version, chart query
+            self.client.get(url)
+
+    def test_api_repeated_values_share_a_cache_entry(self):
+        self.client.get("/api/dashboard/chart-data/?department=경영학과&department=컴퓨터공학과")
+        response = self.client.get(
+            "/api/dashboard/chart-data/?department=컴퓨터공학과&department=경영학과&department=경영학과"
+        )
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_api_invalid_range_returns_400(self):
+        for query in ("year_from=abc", "year_from=2025&year_to=2024"):
+            response = self.client.get(f"/api/dashboard/chart-data/?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+
+class RollupQueryTests(MetricRecordTestFixture):
+    """Test that chart queries use the rollup tables when the filters allow it."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def _chart_sql(self, **kwargs):
+        with CaptureQueriesContext(connection) as ctx:
+            records = get_dashboard_data(**kwargs)
+        return records, ctx.captured_queries[-1]["sql"]
+
+    def test_all_department_sum_reads_year_rollup(self):
+        records, sql = self._chart_sql(aggregation="sum", year_from=2024)
+
+        self.assertIn("ingest_yearmetricrollup", sql)
+        self.assertEqual(
+            [(r["year"], r["metric_type"], r["metric_value"]) for r in records],
+            [(2024, "PAPER", Decimal("23")), (2025, "PAPER", Decimal("20"))],
+        )
+
+    def test_rollup_matches_base_table(self):
+        for aggregation in ("sum", "avg", "count"):
+            from_rollup = get_dashboard_data(aggregation=aggregation)
+            from_base = get_dashboard_data(aggregation=aggregation, departments=["컴퓨터공학과", "경영학과"])
+            self.assertEqual(
+                [float(r["metric_value"]) for r in from_rollup],
+                [float(r["metric_value"]) for r in from_base],
+                aggregation,
+            )
+
+    def test_department_filter_and_min_max_use_base_table(self):
+        _, sql = self._chart_sql(aggregation="sum", department="경영학과")
+        self.assertNotIn("rollup", sql)
+        _, sql = self._chart_sql(aggregation="max")
+        self.assertNotIn("rollup", sql)
+
+    def test_department_totals_across_years(self):
+        with CaptureQueriesContext(connection) as ctx:
+            records = get_department_totals()
+
+        self.assertIn("ingest_departmentmetricrollup", ctx.captured_queries[0]["sql"])
+        self.assertEqual(
+            [(r["department"], r["metric_type"], r["metric_value"]) for r in records],
+            [
+                ("경영학과", "PAPER", Decimal("8")),
+                ("컴퓨터공학과", "BUDGET", Decimal("1000")),
+                ("컴퓨터공학과", "PAPER", Decimal("45")),
+            ],
+        )
+        ranged = get_department_totals(year_from=2024, metric_types=["PAPER"])
+        self.assertEqual([r["metric_value"] for r in ranged], [Decimal("8"), Decimal("35")])
+
+    def test_api_grid_without_year_totals_all_years(self):
+        response = self.client.get("/api/dashboard/chart-data/?shape=grid")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["values"], [[None, 8.0], [1000.0, 45.0]])
+
+
+class DerivedSeriesTests(MetricRecordTestFixture):
+    """Test YoY and moving averages computed with window functions.
+
+    Hand-computed fixture (department 전자공학과, PAPER):
+        2020: 10, 2021: 12, 2022: 9, (2023 missing), 2024: 15
+        yoy:        -, 2, -3, -, -        (no 2023 row, so 2024 has no YoY)
+        yoy_pct:    -, 20.0, -25.0, -, -
+        moving_avg: 10, 11, 10.3333, -, 12 (3-year RANGE window: 2022 and 2024 only)
+    """
+
+    def setUp(self):
+        super().setUp()
+        for year, value in ((2020, 10), (2021, 12), (2022, 9), (2024, 15)):
+            MetricRecord.objects.create(
+                year=year, department="전자공학과", metric_type="PAPER", metric_value=Decimal(value)
+            )
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def _series(self, derivation, **kwargs):
+        records = get_derived_series(derivation, departments=["전자공학과"], **kwargs)
+        return [(r["year"], None if r["metric_value"] is None else round(float(r["metric_value"]), 4)) for r in records]
+
+    def test_yoy(self):
+        self.assertEqual(
+            self._series("yoy"), [(2020, None), (2021, 2.0), (2022, -3.0), (2024, None)]
+        )
+
+    def test_yoy_pct(self):
+        self.assertEqual(
+            self._series("yoy_pct"), [(2020, None), (2021, 20.0), (2022, -25.0), (2024, None)]
+        )
+
+    def test_yoy_pct_of_zero_is_null(self):
+        MetricRecord.objects.create(year=2019, department="전자공학과", metric_type="PAPER", metric_value=Decimal(0))
+        self.assertEqual(self._series("yoy_pct", year=2020), [(2020, None)])
+
+    def test_moving_average(self):
+        self.assertEqual(
+            self._series("moving_avg"), [(2020, 10.0), (2021, 11.0), (2022, 10.3333), (2024, 12.0)]
+        )
+        self.assertEqual(self._series("moving_avg", window=2), [(2020, 10.0), (2021, 11.0), (2022, 10.5), (2024, 15.0)])
+
+    def test_year_filter_keeps_earlier_years_in_the_window(self):
+        self.assertEqual(self._series("yoy", year_from=2021, year_to=2022), [(2021, 2.0), (2022, -3.0)])
+        self.assertEqual(self._series("moving_avg", year=2022), [(2022, 10.3333)])
+
+    def test_partitions_by_department_and_metric(self):
+        records = get_derived_series("yoy", year=2024, metric_types=["PAPER"])
+        self.assertEqual(
+            [(r["department"], float(r["metric_value"]) if r["metric_value"] is not None else None) for r in records],
+            [("경영학과", None), ("전자공학과", None), ("컴퓨터공학과", 5.0)],
+        )
+
+    def test_single_query(self):
+        with CaptureQueriesContext(connection) as ctx:
+            get_derived_series("moving_avg", year_from=2021)
+        self.assertEqual(len(ctx.captured_queries), 1)
+        self.assertIn("OVER", ctx.captured_queries[0]["sql"])
+
+    def test_api_derived_series(self):
+        response = self.client.get("/api/dashboard/chart-data/?derive=yoy&department=전자공학과")
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["labels"], ["2020", "2021", "2022", "2024"])
+        self.assertEqual(data["datasets"][0]["department"], "전자공학과")
+        self.assertEqual(data["datasets"][0]["data"], [None, 2.0, -3.0, None])
+
+    def test_api_invalid_derivation_parameters(self):
+        for query in (
+            "derive=median",
+            "derive=moving_avg&window=1",
+            "derive=moving_avg&window=x",
+            "derive=yoy&resolution=month",
+            "derive=yoy&shape=metric_by_year",
+            "derive=yoy&shape=grid&year=2024",
+        ):
+            response = self.client.get(f"/api/dashboard/chart-data/?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+
+class MetricExportTests(MetricRecordTestFixture):
+    """Test the streaming CSV / XLSX export endpoint."""
+
+    URL = "/api/dashboard/export/"
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def _csv_rows(self, response):
+        content = b"".join(response.streaming_content).decode("utf-8-sig")
+        return list(csv.reader(io.StringIO(content)))
+
+    def test_csv_export(self):
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        self.assertIn('filename="metric_records.csv"', response["Content-Disposition"])
+        rows = self._csv_rows(response)
+        self.assertEqual(rows[0], list(export.EXPORT_COLUMNS))
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[1], ["2023", "", "컴퓨터공학과", "BUDGET", "1000.0000"])
+
+    def test_csv_export_uses_chart_filters(self):
+        response = self.client.get(
+            f"{self.URL}?year_from=2024&department=컴퓨터공학과&department=경영학과&metric_type=PAPER"
+        )
+
+        rows = self._csv_rows(response)
+        self.assertEqual(
+            [(row[0], row[2]) for row in rows[1:]],
+            [("2024", "경영학과"), ("2024", "컴퓨터공학과"), ("2025", "컴퓨터공학과")],
+        )
+
+    def test_monthly_export(self):
+        MetricRecord.objects.create(
+            year=2024, month=3, department="경영학과", metric_type="PUBLICATION", metric_value=Decimal(2)
+        )
+
+        rows = self._csv_rows(self.client.get(f"{self.URL}?resolution=month"))
+
+        self.assertEqual(rows[1:], [["2024", "3", "경영학과", "PUBLICATION", "2.0000"]])
+
+    def test_xlsx_export(self):
+        response = self.client.get(f"{self.URL}?file_format=xlsx&year=2024")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("spreadsheetml", response["Content-Type"])
+        workbook = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        self.assertIsNone(workbook.testzip())
+        self.assertIn("[Content_Types].xml", workbook.namelist())
+        sheet = ElementTree.fromstring(workbook.read("xl/worksheets/sheet1.xml"))
+        ns = {"s": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+        rows = [
+            ["".join(cell.itertext()) for cell in row.findall("s:c", ns)]
+            for row in sheet.findall("s:sheetData/s:row", ns)
+        ]
+        self.assertEqual(rows[0], list(export.EXPORT_COLUMNS))
+        self.assertEqual(
+            rows[1:],
+            [["2024", "경영학과", "PAPER", "8.0000"], ["2024", "컴퓨터공학과", "PAPER", "15.0000"]],
+        )
+
+    def test_streams_in_chunks_from_an_iterator(self):
+        """Rows are fetched with iterator() and encoded per chunk, not as one document."""
+        with mock.patch.object(export, "EXPORT_CHUNK_SIZE", 2):
+            response = self.client.get(self.URL)
+            chunks = list(response.streaming_content)
+
+        # Header + 5 rows in chunks of 2
+        self.assertEqual(len(chunks), 4)
+        with mock.patch.object(QuerySet, "iterator", return_value=iter([])) as iterator:
+            list(self.client.get(self.URL).streaming_content)
+        iterator.assert_called_once_with(chunk_size=export.EXPORT_CHUNK_SIZE)
+
+    def test_header_is_sent_before_the_query_runs(self):
+        response = self.client.get(self.URL)
+
+        with CaptureQueriesContext(connection) as ctx:
+            next(iter(response.streaming_content))
+        self.assertEqual(len(ctx.captured_queries), 0)
+
+    def test_invalid_parameters(self):
+        for query in ("file_format=pdf", "year=abc", "resolution=week", "year_from=2025&year_to=2024"):
+            response = self.client.get(f"{self.URL}?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+    def test_requires_authentication(self):
+        self.client.logout()
+        response = self.client.get(self.URL)
+        self.assertEqual(response.status_code, 401)
+
+
+class MonthlyResolutionTests(MetricRecordTestFixture):
+    """Test monthly resolution - monthly rows and yearly rollups."""
+
+    def setUp(self):
+        super().setUp()
+        for month, value in ((1, "100.0000"), (3, "250.0000")):
+            for department in ("컴퓨터공학과", "경영학과"):
+                MetricRecord.objects.create(
+                    year=2024,
+                    month=month,
+                    department=department,
+                    metric_type="RESEARCH_BUDGET",
+                    metric_value=Decimal(value),
+                )
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_year_resolution_ignores_monthly_rows(self):
+        records = get_dashboard_data(year=2024)
+        self.assertEqual(len(records), 2)
+        self.assertNotIn("RESEARCH_BUDGET", [r["metric_type"] for r in records])
+
+    def test_month_resolution_groups_by_month(self):
+        records = get_dashboard_data(year=2024, resolution="month")
+        self.assertEqual(
+            [(r["month"], r["metric_value"]) for r in records],
+            [(1, Decimal("200.0000")), (3, Decimal("500.0000"))],
+        )
+
+    def test_month_resolution_with_department(self):
+        records = get_dashboard_data(year=2024, department="경영학과", resolution="month")
+        self.assertEqual([r["metric_value"] for r in records], [Decimal("100.0000"), Decimal("250.0000")])
+
+    def test_api_month_resolution_labels(self):
+        response = self.client.get("/api/dashboard/chart-data/?year=2024&resolution=month")
+        data = response.json()
+        self.assertEqual(data["labels"], ["2024-01", "2024-03"])
+        self.assertEqual(data["datasets"][0]["data"], [200.0, 500.0])
+
+
+class ChartDocumentTests(MetricRecordTestFixture):
+    """Test pre-rendered chart documents for the default (year, department) charts."""
+
+    def setUp(self):
+        super().setUp()
+        rebuild_documents()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_document_matches_live_payload(self):
+        response = self.client.get("/api/dashboard/chart-data/?year=2024")
+
+        self.assertEqual(response["X-Cache"], "DOCUMENT")
+        live = to_chartjs(get_dashboard_data(year=2024, aggregation="sum"))
+        self.assertEqual(response.content, encode_payload(live))
+        self.assertEqual(json.loads(response.content)["datasets"][0]["data"], [23.0])
+
+    def test_document_is_one_primary_key_lookup(self):
+        with self.assertNumQueries(3):  # session, user, document
+            self.client.get("/api/dashboard/chart-data/?department=경영학과")
+
+    def test_document_query_count_is_independent_of_row_count(self):
+        MetricRecord.objects.bulk_create(
+            MetricRecord(year=1900 + i, department="경영학과", metric_type="PAPER", metric_value=Decimal("1"))
+            for i in range(100)
+        )
+        rebuild_documents()
+        with self.assertNumQueries(3):
+            response = self.client.get("/api/dashboard/chart-data/?department=경영학과")
+        self.assertEqual(len(response.json()["labels"]), 101)
+
+    def test_document_conditional_request(self):
+        first = self.client.get("/api/dashboard/chart-data/")
+        second = self.client.get("/api/dashboard/chart-data/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+
+    def test_upload_regenerates_touched_partitions_only(self):
+        untouched = ChartDocument.objects.get(pk=document_key(2023, "컴퓨터공학과")).updated_at
+        upload = SimpleUploadedFile("new.csv", "year,department,metric_type,value\n2024,경영학과,PAPER,9".encode())
+        parse_and_save_excel(upload)
+
+        response = self.client.get("/api/dashboard/chart-data/?year=2024&department=경영학과")
+        self.assertEqual(response["X-Cache"], "DOCUMENT")
+        self.assertEqual(response.json()["datasets"][0]["data"], [9.0])
+        all_departments = self.client.get("/api/dashboard/chart-data/?year=2024").json()
+        self.assertEqual(all_departments["datasets"][0]["data"], [24.0])
+        self.assertEqual(ChartDocument.objects.get(pk=document_key(2023, "컴퓨터공학과")).updated_at, untouched)
+
+    def test_rollback_deletes_emptied_documents(self):
+        upload = SimpleUploadedFile("new.csv", b"year,department,metric_type,value\n2030,education,PAPER,1")
+        parse_and_save_excel(upload)
+        self.assertTrue(ChartDocument.objects.filter(pk=document_key(2030, None)).exists())
+
+        rollback_batch(UploadBatch.objects.get())
+
+        self.assertFalse(ChartDocument.objects.filter(pk__startswith="2030|").exists())
+
+    def test_documents_are_regenerated_under_the_write_lock(self):
+        """Writers lock first, so the shared (None, None) document is rebuilt from every committed upload."""
+        calls = mock.Mock()
+        with mock.patch("apps.ingest.services.lock_data_writes", wraps=lock_data_writes) as lock, \
+                mock.patch("apps.dashboard.documents.regenerate_documents", wraps=regenerate_documents) as regen:
+            calls.attach_mock(lock, "lock")
+            calls.attach_mock(regen, "regenerate")
+            upload = SimpleUploadedFile("new.csv", b"year,department,metric_type,value\n2030,education,PAPER,1")
+            parse_and_save_excel(upload)
+            rollback_batch(UploadBatch.objects.get())
+
+        self.assertEqual([name for name, _, _ in calls.mock_calls], ["lock", "regenerate", "lock", "regenerate"])
+        self.assertIn((None, None), regen.call_args.args[0])
+
+    def test_rollup_repair_rebuilds_the_documents(self):
+        """Documents built from a corrupted YearMetricRollup are replaced by rebuild_rollups."""
+        YearMetricRollup.objects.filter(year=2024).update(total=Decimal("999"))
+        rebuild_documents()
+        corrupted = self.client.get("/api/dashboard/chart-data/?year=2024")
+        self.assertEqual(corrupted["X-Cache"], "DOCUMENT")
+        self.assertEqual(corrupted.json()["datasets"][0]["data"], [999.0])
+
+        call_command("rebuild_rollups", stdout=io.StringIO())
+
+        response = self.client.get("/api/dashboard/chart-data/?year=2024")
+        self.assertEqual(response["X-Cache"], "DOCUMENT")
+        self.assertEqual(response.json()["datasets"][0]["data"], [23.0])
+
+    def test_other_filters_use_the_query_path(self):
+        response = self.client.get("/api/dashboard/chart-data/?year=2024&aggregation=avg")
+        self.assertEqual(response["X-Cache"], "MISS")
+
+
+class ChartCacheTests(MetricRecordTestFixture):
+    """Test the versioned chart response cache."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_second_request_is_a_cache_hit(self):
+        first = self.client.get("/api/dashboard/chart-data/?year=2024")
+        second = self.client.get("/api/dashboard/chart-data/?year=2024")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(first.json(), second.json())
+
+    def test_cache_hit_skips_chart_query(self):
+        # metric_type filters are not materialized as chart documents
+        self.client.get("/api/dashboard/chart-data/?year=2024&metric_type=PAPER")
+        with self.assertNumQueries(2):  # session, data version (the user is cached)
+            self.client.get("/api/dashboard/chart-data/?year=2024&metric_type=PAPER")
+
+    def test_filters_are_cached_separately(self):
+        self.client.get("/api/dashboard/chart-data/?year=2024")
+        response = self.client.get("/api/dashboard/chart-data/?year=2023")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertIn("2023", response.json()["labels"])
+
+    def test_upload_commit_invalidates_cache(self):
+        self.client.get("/api/dashboard/chart-data/?year=2026&metric_type=PAPER")
+        version_before, _ = get_data_version()
+
+        upload = SimpleUploadedFile("new.csv", b"year,department,metric_type,value\n2026,education,PAPER,7")
+        with self.captureOnCommitCallbacks(execute=True):
+            parse_and_save_excel(upload)
+
+        self.assertEqual(get_data_version()[0], version_before + 1)
+        response = self.client.get("/api/dashboard/chart-data/?year=2026&metric_type=PAPER")
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["labels"], ["2026"])
+
+    def test_rejected_upload_does_not_bump_version(self):
+        version_before, _ = get_data_version()
+        upload = SimpleUploadedFile("bad.csv", b"year,department,metric_type,value\n2026,education,PAPER,x")
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(Exception):
+                parse_and_save_excel(upload)
+
+        self.assertEqual(get_data_version()[0], version_before)
+
+    def test_admin_edit_invalidates_cache(self):
+        admin_user = User.objects.create_superuser(username="admin", password="adminpass123")
+        admin_client = Client()
+        admin_client.force_login(admin_user)
+        version_before, _ = get_data_version()
+        record = self.records[0]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            admin_client.post(
+                f"/admin/ingest/metricrecord/{record.pk}/change/",
+                {
+                    "year": record.year,
+                    "month": "",
+                    "department": record.department,
+                    "metric_type": record.metric_type,
+                    "metric_value": "11",
+                },
+            )
+
+        self.assertEqual(get_data_version()[0], version_before + 1)
+
+    def test_cache_stats_requires_staff(self):
+        response = self.client.get("/api/dashboard/cache-stats/")
+        self.assertEqual(response.status_code, 403)
+
+    def test_cache_stats_reports_counters(self):
+        staff = User.objects.create_user(username="staff", password="staffpass123", is_staff=True)
+        staff_client = Client()
+        staff_client.force_login(staff)
+        self.client.get("/api/dashboard/chart-data/")
+        self.client.get("/api/dashboard/chart-data/")
+
+        data = staff_client.get("/api/dashboard/cache-stats/").json()
+
+        self.assertGreaterEqual(data["hits"], 1)
+        self.assertGreaterEqual(data["misses"], 1)
+        self.assertIn("data_version", data)
+
+
+class ContentEncodingTests(MetricRecordTestFixture):
+    """Test the pre-encoded payload variants served by Accept-Encoding."""
+
+    URL = "/api/dashboard/chart-data/?shape=department_by_year"
+
+    def setUp(self):
+        super().setUp()
+        # Enough departments for the payload to pass encoding.MIN_COMPRESS_SIZE
+        MetricRecord.objects.bulk_create(
+            MetricRecord(year=2024, department=f"학과{i:02d}", metric_type="PAPER", metric_value=Decimal(i))
+            for i in range(20)
+        )
+        rebuild_facets()
+        rebuild_rollups()
+        rebuild_documents()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_gzip_variant(self):
+        plain = self.client.get(self.URL)
+        compressed = self.client.get(self.URL, HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertNotIn("Content-Encoding", plain)
+        self.assertEqual(compressed["Content-Encoding"], "gzip")
+        self.assertEqual(compressed["X-Cache"], "HIT")
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        self.assertLess(len(compressed.content), len(plain.content))
+        self.assertIn("Accept-Encoding", plain["Vary"])
+        self.assertIn("Accept-Encoding", compressed["Vary"])
+
+    def test_compressed_variant_has_weak_etag_that_revalidates(self):
+        plain = self.client.get(self.URL)
+        compressed = self.client.get(self.URL, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(compressed["ETag"], f"W/{plain['ETag']}")
+        response = self.client.get(
+            self.URL, HTTP_ACCEPT_ENCODING="gzip", HTTP_IF_NONE_MATCH=compressed["ETag"]
+        )
+        self.assertEqual(response.status_code, 304)
+
+    def test_refused_encoding_falls_back_to_identity(self):
+        response = self.client.get(self.URL, HTTP_ACCEPT_ENCODING="gzip;q=0, identity")
+
+        self.assertNotIn("Content-Encoding", response)
+        self.assertEqual(len(response.json()["datasets"]), 23)
+
+    def test_document_variants(self):
+        # A year per label makes the all-years document large enough to compress
+        MetricRecord.objects.bulk_create(
+            MetricRecord(year=1950 + i, department="경영학과", metric_type="PAPER", metric_value=Decimal(i))
+            for i in range(50)
+        )
+        rebuild_documents()
+        url = "/api/dashboard/chart-data/?department=경영학과"
+        plain = self.client.get(url)
+        compressed = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(compressed["X-Cache"], "DOCUMENT")
+        self.assertEqual(gzip.decompress(compressed.content), plain.content)
+        document = ChartDocument.objects.get(pk=document_key(None, "경영학과"))
+        self.assertEqual(gzip.decompress(bytes(document.payload_gzip)), bytes(document.payload))
+
+    def test_small_payloads_are_not_compressed(self):
+        response = self.client.get("/api/dashboard/chart-data/?year=2023", HTTP_ACCEPT_ENCODING="gzip")
+        self.assertNotIn("Content-Encoding", response)
+        self.assertIsNone(ChartDocument.objects.get(pk=document_key(2023, None)).payload_gzip)
+
+
+class QueryPlanTests(TestCase):
+    """EXPLAIN every chart API filter combination; none may scan MetricRecord sequentially.
+
+    Runs on PostgreSQL (EXPLAIN, no "Seq Scan" node) and on SQLite (EXPLAIN
+    QUERY PLAN, every access through a covering index). The seeded table
+    is large enough for the planner to prefer the indexes over a scan.
+    """
+
+    TABLE = MetricRecord._meta.db_table
+
+    # (description, query string); each must hit MetricRecord (not a rollup or document)
+    COMBINATIONS = (
+        ("year", "year=2010&shape=department_by_year"),
+        ("department", "department=D07&shape=department_by_year"),
+        ("year + department", "year=2010&department=D07&shape=department_by_year"),
+        ("metric_type", "metric_type=M03&shape=department_by_year"),
+        ("year + metric_type", "year=2010&metric_type=M03&shape=department_by_year"),
+        ("department + metric_type", "department=D07&metric_type=M03"),
+        ("year range + departments", "year_from=2005&year_to=2008&department=D01&department=D02"),
+        ("aggregation over departments", "department=D01&department=D02&shape=metric_by_year&aggregation=max"),
+        ("aggregation in one year", "year=2010&aggregation=max"),
+        ("department totals over a range", "shape=grid&year_from=2005&year_to=2006"),
+        ("derived series", "derive=yoy&department=D07"),
+        ("monthly, one year", "resolution=month&year=2010"),
+        ("monthly, one department", "resolution=month&department=D07"),
+        ("monthly, one metric_type", "resolution=month&metric_type=PUBLICATION&year_from=2015"),
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        User.objects.create_user(username="testuser", password="testpass123")
+        MetricRecord.objects.bulk_create(
+            (
+                MetricRecord(
+                    year=2000 + year, department=f"D{department:02d}", metric_type=f"M{metric:02d}",
+                    metric_value=Decimal(year + department + metric),
+                )
+                for year in range(20)
+                for department in range(40)
+                for metric in range(12)
+            ),
+            batch_size=1000,
+        )
+        MetricRecord.objects.bulk_create(
+            (
+                MetricRecord(
+                    year=2000 + year, month=month, department=f"D{department:02d}",
+                    metric_type="PUBLICATION", metric_value=Decimal(month),
+                )
+                for year in range(20)
+                for department in range(40)
+                for month in range(1, 13)
+            ),
+            batch_size=1000,
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(f"ANALYZE {connection.ops.quote_name(cls.TABLE)}")
+
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def _scans(self, sql):
+        """Sequential scans of MetricRecord in the plan of one query.
+
+        On SQLite, lookups that still read the table (not a COVERING INDEX)
+        are reported too.
+        """
+        with connection.cursor() as cursor:
+            if connection.vendor == "postgresql":
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}")
+                plan = cursor.fetchone()[0]
+                nodes, scans = [plan[0]["Plan"]], []
+                while nodes:
+                    node = nodes.pop()
+                    nodes.extend(node.get("Plans", []))
+                    if node["Node Type"] == "Seq Scan" and node.get("Relation Name") == self.TABLE:
+                        scans.append(node["Node Type"])
+                return scans
+            cursor.execute(f"EXPLAIN QUERY PLAN {sql}")
+            return [
+                detail for *_, detail in cursor.fetchall()
+                if detail.startswith((f"SCAN {self.TABLE}", f"SEARCH {self.TABLE}"))
+                and "COVERING INDEX" not in detail
+            ]
+
+    def test_no_sequential_scans(self):
+        for description, query in self.COMBINATIONS:
+            with self.subTest(description):
+                with CaptureQueriesContext(connection) as ctx:
+                    response = self.client.get(f"/api/dashboard/chart-data/?{query}")
+                self.assertEqual(response.status_code, 200)
+                statements = [q["sql"] for q in ctx.captured_queries if self.TABLE in q["sql"]]
+                self.assertTrue(statements, "combination did not query MetricRecord")
+                for sql in statements:
+                    self.assertEqual(self._scans(sql), [], sql)
+
+
+class ReadOnlyTransactionTests(MetricRecordTestFixture):
+    """Test that read-only views are exempt from ATOMIC_REQUESTS."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_read_only_views_are_non_atomic(self):
+        for url in (
+            "/dashboard/",
+            "/api/dashboard/chart-data/",
+            "/api/dashboard/chart-data-async/",
+            "/api/dashboard/export/",
+            "/api/dashboard/cache-stats/",
+        ):
+            view = resolve(url).func
+            self.assertIn("default", getattr(view, "_non_atomic_requests", set()), url)
+
+    def test_chart_request_opens_no_transaction(self):
+        with mock.patch.dict(connection.settings_dict, {"ATOMIC_REQUESTS": True}):
+            with CaptureQueriesContext(connection) as ctx:
+                response = self.client.get("/api/dashboard/chart-data/?metric_type=PAPER")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse([q["sql"] for q in ctx.captured_queries if "SAVEPOINT" in q["sql"]])
+
+
+class ConditionalGetTests(MetricRecordTestFixture):
+    """Test ETag / Last-Modified handling."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_chart_response_has_validators(self):
+        response = self.client.get("/api/dashboard/chart-data/?year=2024")
+        self.assertTrue(response["ETag"].startswith('"'))
+        self.assertIn("Last-Modified", response)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+    def test_matching_etag_returns_304_with_fewer_queries(self):
+        with CaptureQueriesContext(connection) as full:
+            first = self.client.get("/api/dashboard/chart-data/?year=2024")
+        cache.clear()  # compare against an uncached 200, not a cache hit
+
+        with CaptureQueriesContext(connection) as conditional:
+            response = self.client.get(
+                "/api/dashboard/chart-data/?year=2024", HTTP_IF_NONE_MATCH=first["ETag"]
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], first["ETag"])
+        self.assertLess(len(conditional), len(full))
+
+    def test_etag_differs_per_filter(self):
+        first = self.client.get("/api/dashboard/chart-data/?year=2024")
+        response = self.client.get(
+            "/api/dashboard/chart-data/?year=2023", HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_changes_after_upload(self):
+        first = self.client.get("/api/dashboard/chart-data/?year=2024")
+        upload = SimpleUploadedFile("new.csv", b"year,department,metric_type,value\n2024,education,PAPER,7")
+        with self.captureOnCommitCallbacks(execute=True):
+            parse_and_save_excel(upload)
+
+        response = self.client.get(
+            "/api/dashboard/chart-data/?year=2024", HTTP_IF_NONE_MATCH=first["ETag"]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], first["ETag"])
+
+    def test_dashboard_page_returns_304(self):
+        self.client.get("/dashboard/")  # sets the CSRF cookie
+        first = self.client.get("/dashboard/")
+
+        response = self.client.get("/dashboard/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_dashboard_etag_is_per_user(self):
+        self.client.get("/dashboard/")
+        first = self.client.get("/dashboard/")
+        User.objects.create_user(username="other", password="otherpass123")
+        other = Client()
+        other.login(username="other", password="otherpass123")
+        other.cookies["csrftoken"] = self.client.cookies["csrftoken"].value
+
+        response = other.get("/dashboard/", HTTP_IF_NONE_MATCH=first["ETag"])
+
+        self.assertEqual(response.status_code, 200)
+
+
+
+class AsyncChartDataViewTests(MetricRecordTestFixture):
+    """Test the async chart API against the sync one."""
+
+    ASYNC_URL = "/api/dashboard/chart-data-async/"
+    SYNC_URL = "/api/dashboard/chart-data/"
+
+    def setUp(self):
+        super().setUp()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    async def _login(self):
+        await self.async_client.alogin(username="testuser", password="testpass123")
+
+    async def test_requires_authentication(self):
+        response = await self.async_client.get(self.ASYNC_URL)
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(json.loads(response.content)["error"], "unauthorized")
+
+    async def test_invalid_parameter_returns_400(self):
+        await self._login()
+        for query in ("year=abc", "year_from=2025&year_to=2023", "shape=pie", "derive=moving_avg&window=1"):
+            response = await self.async_client.get(f"{self.ASYNC_URL}?{query}")
+            self.assertEqual(response.status_code, 400, query)
+
+    async def test_responses_match_the_sync_view(self):
+        """문서, 집계, 학과 비교, 파생 시계열 경로 모두 동기 뷰와 같은 바이트와 ETag"""
+        await self._login()
+        for query in (
+            "year=2024",
+            "metric_type=PAPER",
+            "department=컴퓨터공학과&department=경영학과",
+            "shape=metric_by_department",
+            "aggregation=avg&resolution=month",
+            "derive=yoy&department=컴퓨터공학과",
+        ):
+            await cache.aclear()
+            response = await self.async_client.get(f"{self.ASYNC_URL}?{query}")
+            await cache.aclear()
+            expected = await sync_to_async(self.client.get)(f"{self.SYNC_URL}?{query}")
+
+            self.assertEqual(response.status_code, 200, query)
+            self.assertEqual(response.content, expected.content, query)
+            self.assertEqual(response["ETag"], expected["ETag"], query)
+            self.assertEqual(response["X-Cache"], expected["X-Cache"], query)
+
+    async def test_second_request_is_a_cache_hit(self):
+        await self._login()
+        first = await self.async_client.get(f"{self.ASYNC_URL}?metric_type=PAPER")
+        second = await self.async_client.get(f"{self.ASYNC_URL}?metric_type=PAPER")
+
+        self.assertEqual(first["X-Cache"], "MISS")
+        self.assertEqual(second["X-Cache"], "HIT")
+        self.assertEqual(second.content, first.content)
+
+    async def test_conditional_request_returns_304(self):
+        await self._login()
+        first = await self.async_client.get(f"{self.ASYNC_URL}?metric_type=PAPER")
+
+        response = await self.async_client.get(
+            f"{self.ASYNC_URL}?metric_type=PAPER", headers={"If-None-Match": first["ETag"]}
+        )
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_gzip_variant(self):
+        await self._login()
+        response = await self.async_client.get(
+            f"{self.ASYNC_URL}?metric_type=PAPER", headers={"Accept-Encoding": "gzip"}
+        )
+        expected = await sync_to_async(self.client.get)(
+            f"{self.SYNC_URL}?metric_type=PAPER", HTTP_ACCEPT_ENCODING="gzip"
+        )
+        self.assertEqual(response.get("Content-Encoding"), expected.get("Content-Encoding"))
+        self.assertEqual(response.content, expected.content)
+
+    async def test_async_services_match_sync(self):
+        for kwargs in ({}, {"year": 2024}, {"aggregation": "sum"}, {"resolution": "month"}):
+            self.assertEqual(
+                await aget_dashboard_data(**kwargs),
+                await sync_to_async(get_dashboard_data)(**kwargs),
+                kwargs,
+            )
+        self.assertEqual(
+            await aget_derived_series("yoy"), await sync_to_async(get_derived_series)("yoy")
+        )
+
+
+class LoadTestUnitTests(SimpleTestCase):
+    """Test the load generator's filter mix and statistics."""
+
+    DEFAULT_FILTERS = {
+        "years": [2024, 2023],
+        "all_years": [2024, 2023],
+        "departments": ["컴퓨터공학과", "전자공학과"],
+        "metric_types": ["PAPER"],
+        "default_year": 2024,
+    }
+
+    def test_parse_mix(self):
+        self.assertEqual(loadtest.parse_mix("year=3, department=1,all"), {"year": 3.0, "department": 1.0, "all": 1.0})
+        for invalid in ("weekday=1", "year=-1", "year=0"):
+            with self.assertRaises(ValueError):
+                loadtest.parse_mix(invalid)
+
+    def test_filters_come_from_the_page_values(self):
+        rng = random.Random(0)
+
+        self.assertEqual(loadtest.chart_filters("default", self.DEFAULT_FILTERS, rng), {"year": 2024})
+        self.assertEqual(loadtest.chart_filters("all", self.DEFAULT_FILTERS, rng), {})
+        both = loadtest.chart_filters("year_department", self.DEFAULT_FILTERS, rng)
+        self.assertIn(both["year"], self.DEFAULT_FILTERS["all_years"])
+        self.assertIn(both["department"], self.DEFAULT_FILTERS["departments"])
+        self.assertEqual(set(loadtest.chart_filters("department", self.DEFAULT_FILTERS, rng)), {"department"})
+
+    def test_summary_statistics(self):
+        samples = [("chart", 200, 0.002)] * 90 + [("chart", 304, 0.02)] * 8 + [("chart", 500, 0.3), ("chart", 0, 1.2)]
+
+        summary = loadtest.summarize(samples, elapsed=2.0)
+
+        self.assertEqual(summary["requests"], 100)
+        self.assertEqual(summary["throughput_rps"], 50.0)
+        self.assertEqual(summary["errors"], 2)
+        self.assertEqual(summary["error_rate"], 0.02)
+        self.assertEqual(summary["status_counts"], {"0": 1, "200": 90, "304": 8, "500": 1})
+        self.assertEqual(summary["latency_ms"]["p50"], 2.0)
+        self.assertEqual(summary["latency_ms"]["p95"], 20.0)
+        self.assertEqual(summary["latency_ms"]["p99"], 1200.0)
+        self.assertEqual(sum(bucket["count"] for bucket in summary["histogram"]), 100)
+        self.assertEqual(summary["histogram"][0], {"from_ms": 0, "to_ms": 5, "count": 90})
+
+    def test_empty_summary(self):
+        summary = loadtest.summarize([], elapsed=1.0)
+
+        self.assertEqual(summary["requests"], 0)
+        self.assertIsNone(summary["latency_ms"]["p95"])
+
+
+class LoadTestDefaultFiltersTests(MetricRecordTestFixture):
+    """The generator reads the filter values the real dashboard page renders."""
+
+    def test_parses_the_rendered_page(self):
+        self.client.login(username="testuser", password="testpass123")
+        html = self.client.get("/dashboard/").content.decode()
+
+        default_filters = loadtest.parse_default_filters(html)
+
+        self.assertEqual(default_filters["default_year"], 2025)
+        self.assertIn("컴퓨터공학과", default_filters["departments"])
+
+
+class LoadTestCommandTests(LiveServerTestCase):
+    """Run manage.py loadtest against a live server."""
+
+    def setUp(self):
+        cache.clear()
+        for year, department in ((2023, "컴퓨터공학과"), (2024, "컴퓨터공학과"), (2024, "전자공학과")):
+            MetricRecord.objects.create(
+                year=year, department=department, metric_type="PAPER", metric_value=Decimal("10")
+            )
+        rebuild_facets()
+
+    def run_command(self, *args):
+        stdout = io.StringIO()
+        call_command(
+            "loadtest", "--base-url", self.live_server_url, "--create-users", "--allow-remote-db",
+            "--password", "load-secret", *args, stdout=stdout, stderr=io.StringIO(),
+        )
+        return json.loads(stdout.getvalue())
+
+    def test_reports_json_statistics(self):
+        result = self.run_command("--users", "1", "--max-requests", "12", "--burst", "5", "--duration", "30")
+
+        self.assertEqual(result["requests"], 12)
+        self.assertEqual(result["errors"], 0)
+        self.assertEqual(result["login_failures"], [])
+        self.assertEqual(result["endpoints"]["login"]["status_counts"], {"200": 1, "302": 1})
+        # 대시보드 1회 + 차트 5회, 두 번 반복
+        self.assertEqual(result["endpoints"]["dashboard"]["requests"], 2)
+        self.assertEqual(result["endpoints"]["chart"]["requests"], 10)
+        # 같은 필터의 반복 조회는 ETag로 재검증(304)
+        self.assertIn("304", result["endpoints"]["chart"]["status_counts"])
+        self.assertEqual(result["config"]["users"], 1)
+        self.assertNotIn("password", result["config"])
+        for field in ("throughput_rps", "latency_ms", "histogram", "error_rate"):
+            self.assertIn(field, result)
+
+    def test_wrong_password_fails(self):
+        User.objects.create_user(username="loadtest-001", password="something-else")
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "loadtest", "--base-url", self.live_server_url, "--users", "1", "--max-requests", "5",
+                "--password", "load-secret", stdout=io.StringIO(), stderr=io.StringIO(),
+            )
+
+    def test_create_users_requires_a_password(self):
+        with self.assertRaises(CommandError):
+            call_command("loadtest", "--create-users", "--allow-remote-db", stdout=io.StringIO())
+        self.assertFalse(User.objects.exists())
+
+    def test_create_users_is_refused_without_debug(self):
+        """테스트는 DEBUG=False로 실행: 설정된 DB가 운영 DB일 수 있으므로 명시적 허용 필요"""
+        with self.assertRaisesMessage(CommandError, "--allow-remote-db"):
+            call_command(
+                "loadtest", "--create-users", "--password", "load-secret", stdout=io.StringIO()
+            )
+        self.assertFalse(User.objects.exists())
+
+    def test_invalid_mix(self):
+        with self.assertRaises(CommandError):
+            call_command("loadtest", "--password", "load-secret", "--mix", "weekday=1", stdout=io.StringIO())
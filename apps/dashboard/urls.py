@@ -6,11 +6,20 @@ Follows the specification in docs/3.prd.md and docs/spec/003-spec-대시보드-
 URL Patterns:
     - GET /dashboard/ → DashboardView (template rendering)
     - GET /api/dashboard/chart-data/ → ChartDataAPIView (JSON API)
+    - GET /api/dashboard/chart-data-async/ → AsyncChartDataView (same API, async; for ASGI)
+    - GET /api/dashboard/export/ → MetricExportView (streaming CSV / XLSX)
+    - GET /api/dashboard/cache-stats/ → CacheStatsAPIView (staff only)
 """
 
 from django.urls import path
 
-from .views import DashboardView, ChartDataAPIView
+from .views import (
+    AsyncChartDataView,
+    CacheStatsAPIView,
+    ChartDataAPIView,
+    DashboardView,
+    MetricExportView,
+)
 
 app_name = "dashboard"
 
@@ -22,6 +31,9 @@ page_patterns = [
 # API patterns - accessible at /api/dashboard/
 api_patterns = [
     path("chart-data/", ChartDataAPIView.as_view(), name="chart-data-api"),
+    path("chart-data-async/", AsyncChartDataView.as_view(), name="chart-data-async-api"),
+    path("export/", MetricExportView.as_view(), name="export-api"),
+    path("cache-stats/", CacheStatsAPIView.as_view(), name="cache-stats-api"),
 ]
 
 urlpatterns = page_patterns + api_patterns
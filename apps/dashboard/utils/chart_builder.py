@@ -0,0 +1,226 @@
+"""Chart Builder - Single-pass Chart.js payloads in several shapes
+
+Builds chart payloads from metric records (see services.get_dashboard_data)
+in one pass: every value is accumulated into a per-series dict keyed by its
+raw label key, labels are sorted and formatted once at the end, so the cost
+is O(records + series × labels) instead of a list lookup per record.
+
+Shapes:
+    metric_by_year:       x-axis = periods (years, or months), one dataset per metric_type
+    department_by_year:   x-axis = periods, one dataset per (department, metric_type)
+    metric_by_department: x-axis = departments, one dataset per metric_type
+    grid:                 department × metric_type matrix (table / heatmap)
+
+Values falling into the same cell (for example two departments in
+metric_by_year) are summed. None values are skipped, and cells without a
+value get `fill` (0 by default; derived series pass None so Chart.js draws
+a gap).
+
+Example:
+    from apps.dashboard.utils.chart_builder import build_chart
+
+    records = get_dashboard_data(year=2024)
+    chart = build_chart(records, shape="metric_by_department")
+"""
+
+from typing import Any, Callable, Dict, Hashable, Iterable, Tuple
+
+SHAPE_METRIC_BY_YEAR = "metric_by_year"
+SHAPE_DEPARTMENT_BY_YEAR = "department_by_year"
+SHAPE_METRIC_BY_DEPARTMENT = "metric_by_department"
+SHAPE_GRID = "grid"
+SHAPES = (SHAPE_METRIC_BY_YEAR, SHAPE_DEPARTMENT_BY_YEAR, SHAPE_METRIC_BY_DEPARTMENT, SHAPE_GRID)
+
+# Shapes that need the department of each record (not available at month resolution)
+DEPARTMENT_SHAPES = (SHAPE_DEPARTMENT_BY_YEAR, SHAPE_METRIC_BY_DEPARTMENT, SHAPE_GRID)
+
+# Shapes that compare departments: within one year, or across all years when no year is given
+DEPARTMENT_COMPARISON_SHAPES = (SHAPE_METRIC_BY_DEPARTMENT, SHAPE_GRID)
+
+METRIC_COLORS = {
+    # Basic metrics
+    "PAPER": "#4A90E2",  # Blue
+    "BUDGET": "#50E3C2",  # Teal
+    "STUDENT": "#F5A623",  # Orange
+    "PROJECT": "#BD10E0",  # Purple
+    # Department KPI metrics
+    "EMPLOYMENT_RATE": "#7ED321",  # Green
+    "FULL_TIME_FACULTY": "#B8E986",  # Light Green
+    "VISITING_FACULTY": "#A8C959",  # Olive
+    "TECH_TRANSFER_REVENUE": "#F8A623",  # Dark Orange
+    "INTERNATIONAL_CONFERENCE": "#D0021B",  # Red
+    # Publication metrics
+    "PUBLICATION": "#417505",  # Dark Green
+    # Research metrics
+    "RESEARCH_BUDGET": "#FF6B6B",  # Light Red
+    # Student metrics
+    "STUDENT_COUNT": "#4ECDC4",  # Turquoise
+}
+DEFAULT_COLOR = "#999999"  # Gray
+
+# department_by_year colors series by department so comparisons stay readable
+DEPARTMENT_PALETTE = (
+    "#4A90E2", "#F5A623", "#7ED321", "#D0021B", "#BD10E0",
+    "#50E3C2", "#417505", "#FF6B6B", "#4ECDC4", "#8B572A",
+)
+
+
+def metric_color(metric_type: str) -> str:
+    """Hex color for a metric type (gray for unknown types)."""
+    return METRIC_COLORS.get(metric_type, DEFAULT_COLOR)
+
+
+def build_chart(
+    records: Iterable[Dict[str, Any]], shape: str = SHAPE_METRIC_BY_YEAR, fill: Any = 0
+) -> Dict[str, Any]:
+    """Build a chart payload of the given shape.
+
+    Args:
+        records: Dicts with year, (month), department, metric_type and metric_value
+        shape: One of SHAPES
+        fill: Value for series cells without data (series shapes only)
+
+    Returns:
+        dict: {'labels': [...], 'datasets': [...]} for the series shapes,
+              {'rows': [...], 'columns': [...], 'values': [[...]]} for the grid
+
+    Raises:
+        ValueError: Unknown shape
+    """
+    if shape == SHAPE_METRIC_BY_YEAR:
+        return _build_series(records, _period_key, _period_label, fill)
+    if shape == SHAPE_DEPARTMENT_BY_YEAR:
+        return _build_department_series(records, fill)
+    if shape == SHAPE_METRIC_BY_DEPARTMENT:
+        return _build_series(records, _department_key, str, fill)
+    if shape == SHAPE_GRID:
+        return _build_grid(records)
+    raise ValueError(f"Unknown chart shape: {shape}")
+
+
+def _build_series(
+    records: Iterable[Dict[str, Any]],
+    key_of: Callable[[Dict[str, Any]], Hashable],
+    format_label: Callable[[Any], str],
+    fill: Any,
+) -> Dict[str, Any]:
+    """One dataset per metric_type over the sorted label keys."""
+    series: Dict[str, Dict[Hashable, float]] = {}
+    keys = set()
+
+    for record in records:
+        key = key_of(record)
+        if key is None:
+            continue
+        metric_type = record.get("metric_type", "Unknown")
+        cells = series.get(metric_type)
+        if cells is None:
+            cells = series[metric_type] = {}
+        keys.add(key)
+        value = record.get("metric_value")
+        if value is not None:
+            cells[key] = cells.get(key, 0.0) + float(value)
+
+    if not keys:
+        return {"labels": [], "datasets": []}
+
+    ordered = sorted(keys)
+    return {
+        "labels": [format_label(key) for key in ordered],
+        "datasets": [
+            {
+                "label": metric_type,
+                "data": [cells.get(key, fill) for key in ordered],
+                "backgroundColor": metric_color(metric_type),
+            }
+            for metric_type, cells in series.items()
+        ],
+    }
+
+
+def _build_department_series(records: Iterable[Dict[str, Any]], fill: Any) -> Dict[str, Any]:
+    """One dataset per (department, metric_type) over the sorted periods, grouped by department."""
+    series: Dict[Tuple[str, str], Dict[Hashable, float]] = {}
+    keys = set()
+
+    for record in records:
+        key = _period_key(record)
+        department = record.get("department")
+        if key is None or department is None:
+            continue
+        series_key = (department, record.get("metric_type", "Unknown"))
+        cells = series.get(series_key)
+        if cells is None:
+            cells = series[series_key] = {}
+        keys.add(key)
+        value = record.get("metric_value")
+        if value is not None:
+            cells[key] = cells.get(key, 0.0) + float(value)
+
+    if not keys:
+        return {"labels": [], "datasets": []}
+
+    ordered = sorted(keys)
+    colors = {}
+    datasets = []
+    for department, metric_type in sorted(series):
+        if department not in colors:
+            colors[department] = DEPARTMENT_PALETTE[len(colors) % len(DEPARTMENT_PALETTE)]
+        cells = series[(department, metric_type)]
+        datasets.append(
+            {
+                "label": f"{department} · {metric_type}",
+                "department": department,
+                "metric_type": metric_type,
+                "data": [cells.get(key, fill) for key in ordered],
+                "backgroundColor": colors[department],
+            }
+        )
+    return {"labels": [_period_label(key) for key in ordered], "datasets": datasets}
+
+
+def _build_grid(records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """Department × metric_type matrix; missing cells are None."""
+    cells: Dict[Tuple[str, str], float] = {}
+    departments = set()
+    metric_types = set()
+
+    for record in records:
+        department = record.get("department")
+        if department is None:
+            continue
+        metric_type = record.get("metric_type", "Unknown")
+        value = record.get("metric_value")
+        key = (department, metric_type)
+        cells[key] = cells.get(key, 0.0) + (float(value) if value is not None else 0.0)
+        departments.add(department)
+        metric_types.add(metric_type)
+
+    rows = sorted(departments)
+    columns = sorted(metric_types)
+    return {
+        "rows": rows,
+        "columns": columns,
+        "values": [[cells.get((row, column)) for column in columns] for row in rows],
+        "colors": [metric_color(column) for column in columns],
+    }
+
+
+def _period_key(record: Dict[str, Any]) -> Any:
+    """Sortable period key: (year, month) with month 0 for yearly rows."""
+    year = record.get("year")
+    if not year:
+        return None
+    return (year, record.get("month") or 0)
+
+
+def _period_label(key: Tuple[int, int]) -> str:
+    """Chart label for a period key: "2024" for yearly rows, "2024-03" for monthly rows."""
+    year, month = key
+    if month:
+        return f"{year}-{month:02d}"
+    return str(year)
+
+
+def _department_key(record: Dict[str, Any]) -> Any:
+    return record.get("department")
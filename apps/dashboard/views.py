@@ -4,9 +4,18 @@ This module provides views for the dashboard page and chart data API.
 Follows the specification in docs/4.userflow.md and docs/5.dataflow.md
 """
 
-from typing import Any, Dict
+import hashlib
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
 from django.shortcuts import render, redirect
+from django.template.loader import get_template
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from django.views import View
 from django.views.generic import TemplateView
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import logout
@@ -17,10 +26,92 @@ from django.views.decorators.csrf import csrf_protect
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
-
-from .services import get_dashboard_data, to_chartjs
-
-
+from rest_framework.permissions import IsAdminUser
+
+from apps.ingest.versioning import aget_data_version, get_data_version
+from apps.monitoring.timing import timing
+from config.db_router import read_from_replica
+
+from .cache import (
+    aget_cached_chart,
+    aset_cached_chart,
+    cache_stats,
+    chart_etag,
+    get_cached_chart,
+    set_cached_chart,
+)
+from .documents import aget_document, get_document
+from .encoding import ENCODING_IDENTITY, choose_encoding, encode_variants
+from .export import (
+    EXPORT_FORMATS,
+    EXPORT_FORMAT_CSV,
+    EXPORT_FORMAT_XLSX,
+    export_rows,
+    stream_csv,
+    stream_xlsx,
+)
+from .services import (
+    AGGREGATIONS,
+    AGGREGATION_SUM,
+    DEFAULT_MOVING_AVG_WINDOW,
+    DERIVATIONS,
+    DERIVATION_MOVING_AVG,
+    MAX_MOVING_AVG_WINDOW,
+    RESOLUTIONS,
+    RESOLUTION_YEAR,
+    RecordQuery,
+    dashboard_query,
+    department_totals_query,
+    derived_series_query,
+    get_filter_options,
+)
+from .utils.chart_builder import (
+    DEPARTMENT_COMPARISON_SHAPES,
+    DEPARTMENT_SHAPES,
+    SHAPES,
+    SHAPE_DEPARTMENT_BY_YEAR,
+    SHAPE_METRIC_BY_YEAR,
+    build_chart,
+)
+
+
+# Read-only views below are exempt from ATOMIC_REQUESTS (transaction.non_atomic_requests):
+# a request-wide transaction only adds BEGIN / COMMIT round trips to every chart read.
+# Their get() reads the data from the read replica when one is configured (config/db_router.py)
+
+# Templates whose source is part of the dashboard page ETag
+PAGE_TEMPLATES = ("dashboard/index.html", "base.html")
+
+
+@lru_cache(maxsize=1)
+def _page_template_revision() -> str:
+    """Digest of the page templates, computed once per process (changes on deploy)."""
+    digest = hashlib.md5()
+    for name in PAGE_TEMPLATES:
+        digest.update(get_template(name).template.source.encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def _revalidate(response: Any) -> Any:
+    """Let the browser keep the response but revalidate it on every use."""
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _int_param(request: Any, name: str) -> Optional[int]:
+    """Optional integer query parameter; raises ValueError when it is not a number."""
+    value = request.GET.get(name)
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _list_param(request: Any, name: str) -> Tuple[str, ...]:
+    """Repeated query parameter as a sorted tuple without blanks or duplicates."""
+    return tuple(sorted({value for value in request.GET.getlist(name) if value}))
+
+
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
 class DashboardView(LoginRequiredMixin, TemplateView):
     """Dashboard page view - displays chart data visualization.
 
@@ -36,11 +127,42 @@ class DashboardView(LoginRequiredMixin, TemplateView):
     login_url = "login"
     redirect_field_name = "next"
 
+    @read_from_replica
+    def get(self, request: Any, *args: Any, **kwargs: Any) -> Any:
+        """Render the page, or answer 304 when the browser's copy is still current."""
+        self.data_version, _ = get_data_version()
+        etag = self._page_etag(request)
+        if etag:
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                not_modified["ETag"] = etag
+                return _revalidate(not_modified)
+
+        response = super().get(request, *args, **kwargs)
+        if etag:
+            response["ETag"] = etag
+        return _revalidate(response)
+
+    def _page_etag(self, request: Any) -> Optional[str]:
+        """ETag for the rendered page.
+
+        The page depends on the data (filter defaults), the user (greeting),
+        the CSRF secret embedded in the logout form and the template source.
+        Without a CSRF cookie the render would mint a new secret, so the
+        page is not cacheable until the browser has one.
+        """
+        csrf_cookie = request.COOKIES.get(settings.CSRF_COOKIE_NAME)
+        if not csrf_cookie:
+            return None
+        fingerprint = f"{self.data_version}:{request.user.pk}:{csrf_cookie}:{_page_template_revision()}"
+        return f'"{hashlib.md5(fingerprint.encode("utf-8")).hexdigest()}"'
+
     def get_context_data(self, **kwargs: Any) -> Dict[str, Any]:
         """Add default filter values to template context.
 
         According to docs/4.userflow.md and docs/spec/003, the backend must
         provide default filter values (최신 3개년, 전체 학과) through the template context.
+        Values come from the MetricFacet table (see apps/ingest/facets.py).
 
         Returns:
             dict: Context with default_filters containing years and departments
@@ -48,27 +170,20 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
 
         try:
-            # Get all unique years from database, sorted descending
-            from apps.ingest.models import MetricRecord
-
-            all_years = (
-                MetricRecord.objects.values_list("year", flat=True).distinct().order_by("-year")
-            )
-            all_years_list = list(all_years)
+            # Filter options come from the maintained facet table, cached per data version
+            with timing("service"):
+                options = get_filter_options(self.data_version)
+            all_years_list = options["years"]
 
             # Get latest 3 years
             latest_three_years = all_years_list[:3] if all_years_list else []
 
-            # Get all departments
-            all_departments = (
-                MetricRecord.objects.values_list("department", flat=True).distinct().order_by("department")
-            )
-
             # Build default_filters context for frontend
             context["default_filters"] = {
                 "years": latest_three_years,
                 "all_years": all_years_list,
-                "departments": list(all_departments),
+                "departments": options["departments"],
+                "metric_types": options["metric_types"],
                 "default_year": latest_three_years[0] if latest_three_years else None,
             }
         except Exception as e:
@@ -77,73 +192,460 @@ class DashboardView(LoginRequiredMixin, TemplateView):
                 "years": [],
                 "all_years": [],
                 "departments": [],
+                "metric_types": [],
                 "default_year": None,
             }
 
         return context
 
 
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
 class ChartDataAPIView(APIView):
     """API endpoint for retrieving chart data.
 
     Provides JSON response with chart data based on filter parameters.
     Only authenticated users can access this endpoint.
 
-    URL: GET /api/dashboard/chart-data/?year=YYYY&department=DEPT_NAME
+    The default chart of a single (year, department) combination is served
+    from a pre-rendered ChartDocument with one primary-key lookup
+    (X-Cache: DOCUMENT). Other responses are cached per (data version,
+    filters); the X-Cache header reports HIT or MISS. Both hold the JSON
+    already encoded, with gzip / brotli variants picked by Accept-Encoding,
+    so a hit bypasses the DRF renderer. Every response carries a strong ETag and a
+    Last-Modified header derived from the data version, so a conditional
+    request for unchanged data is answered with 304 before any chart query.
+
+    A comparison (several departments and metric types over a year range)
+    is answered with one query and one response. AsyncChartDataView serves
+    the same API for ASGI deployments.
+
+    URL: GET /api/dashboard/chart-data/?year=YYYY&year_from=YYYY&year_to=YYYY
+         &department=DEPT_NAME[&department=...]&metric_type=TYPE[&metric_type=...]
+         &resolution=year|month&shape=SHAPE&aggregation=sum|avg|min|max|count
+         &derive=yoy|yoy_pct|moving_avg&window=N
     """
 
-    def dispatch(self, request, *args, **kwargs):
-        """Check authentication before processing request."""
-        if not request.user.is_authenticated:
-            return Response(
-                {"error": "unauthorized", "message": "인증이 필요합니다."},
-                status=status.HTTP_401_UNAUTHORIZED
-            )
-        return super().dispatch(request, *args, **kwargs)
-
+    @read_from_replica
     def get(self, request: Any) -> Response:
         """Handle GET request for chart data.
 
         Query Parameters:
             year (optional): Filter by year (int)
-            department (optional): Filter by department name (str)
+            year_from, year_to (optional): Inclusive year range (int)
+            department (optional, repeatable): Filter by department name(s) (str)
+            metric_type (optional, repeatable): Filter by metric type(s) (str)
+            resolution (optional): "year" (default) or "month" for monthly series
+            shape (optional): "metric_by_year" (default for zero or one department),
+                "department_by_year" (default for several departments),
+                "metric_by_department" or "grid" (one year, or totals across
+                years when no year is given); department shapes require year resolution
+            aggregation (optional): How departments are combined per period for
+                metric_by_year, or years per department for department comparisons
+                without a year: "sum" (default), "avg", "min", "max" or "count"
+            derive (optional): "yoy", "yoy_pct" or "moving_avg" per (department,
+                metric_type), computed with window functions; defaults to the
+                department_by_year shape
+            window (optional): Moving average width in years (2-10, default 3)
 
         Returns:
             Response: Chart.js compatible JSON or error response
                 - 200: Successful response with chart data
+                - 304: Not modified (If-None-Match / If-Modified-Since matched)
                 - 400: Invalid parameters
-                - 401: Unauthorized (handled by @login_required decorator)
+                - 401: Unauthorized
         """
+        # Checked here rather than in dispatch() so DRF can render the 401 body.
+        # The session and user lookups behind it are cached (see config/auth_backends.py)
+        if not request.user.is_authenticated:
+            return Response(
+                {"error": "unauthorized", "message": "인증이 필요합니다."},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
         try:
-            # Extract and validate query parameters
-            year_param = request.GET.get("year")
-            department_param = request.GET.get("department")
+            query = _parse_chart_query(request)
+            if query is None:
+                return Response(
+                    {"error": "invalid_parameter"},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+
+            # Default chart of one (year, department) combination: serve the stored document
+            partition = query.document_partition()
+            if partition is not None:
+                document = get_document(*partition)
+                if document is not None:
+                    return _document_response(request, *document)
+
+            version, updated_at = get_data_version()
+            params = tuple(query)
+            etag, last_modified, not_modified = _chart_validators(request, version, updated_at, params)
+            if not_modified is not None:
+                return not_modified
+
+            chart_data = get_cached_chart(version, params)
+            cache_status = "HIT"
+
+            if chart_data is None:
+                # Retrieve and transform data
+                with timing("service"):
+                    records = query.records_query().fetch()
+                chart_data = _encode_chart(query, records)
+                set_cached_chart(version, params, chart_data)
+                cache_status = "MISS"
+
+            return _encoded_response(request, chart_data, cache_status, etag, last_modified)
+
+        except Exception as e:
+            # Log the error in production
+            return Response(
+                {"error": "server_error"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
 
-            year = None
-            if year_param is not None and year_param != "":
-                try:
-                    year = int(year_param)
-                except (ValueError, TypeError):
-                    return Response(
-                        {"error": "invalid_parameter"},
-                        status=status.HTTP_400_BAD_REQUEST,
-                    )
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class AsyncChartDataView(View):
+    """Async variant of ChartDataAPIView for ASGI deployments.
 
-            department = department_param if department_param and department_param != "" else None
+    Same parameters, caching, ETags and response bytes as ChartDataAPIView,
+    but the session, user, document, data version and chart queries are
+    awaited (request.auser() and the async ORM), so under an ASGI server a
+    slow chart query suspends only its own request instead of occupying a
+    worker. Django still runs the ORM calls in a thread pool; the event
+    loop keeps accepting and answering other requests meanwhile (see
+    config/asgi.py for the server command).
 
-            # Retrieve and transform data
-            records = get_dashboard_data(year=year, department=department)
-            chart_data = to_chartjs(records)
+    Under WSGI the view still works, run in its own event loop per request.
 
-            return Response(chart_data, status=status.HTTP_200_OK)
+    URL: GET /api/dashboard/chart-data-async/ (query parameters as chart-data/)
+    """
+
+    http_method_names = ["get", "head", "options"]
+
+    @read_from_replica
+    async def get(self, request: Any) -> HttpResponse:
+        """Handle GET request for chart data (see ChartDataAPIView.get)."""
+        user = await request.auser()
+        if not user.is_authenticated:
+            return JsonResponse(
+                {"error": "unauthorized", "message": "인증이 필요합니다."},
+                status=status.HTTP_401_UNAUTHORIZED,
+            )
+
+        try:
+            query = _parse_chart_query(request)
+            if query is None:
+                return JsonResponse({"error": "invalid_parameter"}, status=status.HTTP_400_BAD_REQUEST)
+
+            partition = query.document_partition()
+            if partition is not None:
+                document = await aget_document(*partition)
+                if document is not None:
+                    return _document_response(request, *document)
+
+            version, updated_at = await aget_data_version()
+            params = tuple(query)
+            etag, last_modified, not_modified = _chart_validators(request, version, updated_at, params)
+            if not_modified is not None:
+                return not_modified
+
+            chart_data = await aget_cached_chart(version, params)
+            cache_status = "HIT"
+
+            if chart_data is None:
+                with timing("service"):
+                    records = await query.records_query().afetch()
+                chart_data = _encode_chart(query, records)
+                await aset_cached_chart(version, params, chart_data)
+                cache_status = "MISS"
+
+            return _encoded_response(request, chart_data, cache_status, etag, last_modified)
 
         except Exception as e:
             # Log the error in production
+            return JsonResponse({"error": "server_error"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class ChartQuery(NamedTuple):
+    """Validated chart API parameters; as a plain tuple, the cache key and ETag input."""
+
+    year: Optional[int]
+    year_from: Optional[int]
+    year_to: Optional[int]
+    departments: Tuple[str, ...]
+    metric_types: Tuple[str, ...]
+    resolution: str
+    shape: str
+    aggregation: Optional[str]
+    derive: Optional[str]
+    window: Optional[int]
+
+    @property
+    def across_years(self) -> bool:
+        """Department comparisons without a year aggregate across years."""
+        return self.shape in DEPARTMENT_COMPARISON_SHAPES and self.year is None
+
+    def document_partition(self) -> Optional[Tuple[Optional[int], Optional[str]]]:
+        """(year, department) of the stored ChartDocument for this chart, or None."""
+        if (
+            self.shape == SHAPE_METRIC_BY_YEAR
+            and self.resolution == RESOLUTION_YEAR
+            and self.aggregation == AGGREGATION_SUM
+            and self.year_from is None
+            and self.year_to is None
+            and not self.metric_types
+            and len(self.departments) <= 1
+        ):
+            return self.year, self.departments[0] if self.departments else None
+        return None
+
+    def records_query(self) -> RecordQuery:
+        """The records query behind the chart, fetched with .fetch() or awaited with .afetch()."""
+        if self.derive is not None:
+            return derived_series_query(
+                self.derive,
+                window=self.window or DEFAULT_MOVING_AVG_WINDOW,
+                year=self.year,
+                year_from=self.year_from,
+                year_to=self.year_to,
+                departments=self.departments,
+                metric_types=self.metric_types,
+            )
+        if self.across_years:
+            return department_totals_query(
+                departments=self.departments,
+                metric_types=self.metric_types,
+                year_from=self.year_from,
+                year_to=self.year_to,
+                aggregation=self.aggregation,
+            )
+        return dashboard_query(
+            year=self.year,
+            year_from=self.year_from,
+            year_to=self.year_to,
+            departments=self.departments,
+            metric_types=self.metric_types,
+            resolution=self.resolution,
+            aggregation=self.aggregation,
+        )
+
+
+def _parse_chart_query(request: Any) -> Optional[ChartQuery]:
+    """Validate the chart API query parameters; None when any is invalid (400)."""
+    # Extract and validate query parameters
+    try:
+        year = _int_param(request, "year")
+        year_from = _int_param(request, "year_from")
+        year_to = _int_param(request, "year_to")
+    except ValueError:
+        return None
+    if year_from is not None and year_to is not None and year_from > year_to:
+        return None
+
+    # department / metric_type may be repeated; one value keeps the single-filter behaviour
+    departments = _list_param(request, "department")
+    metric_types = _list_param(request, "metric_type")
+
+    resolution = request.GET.get("resolution") or RESOLUTION_YEAR
+    if resolution not in RESOLUTIONS:
+        return None
+
+    # Derived series (YoY, moving average) are per department and yearly
+    derive = request.GET.get("derive") or None
+    try:
+        window = _int_param(request, "window")
+    except ValueError:
+        window = 0
+    if derive == DERIVATION_MOVING_AVG:
+        window = DEFAULT_MOVING_AVG_WINDOW if window is None else window
+        if not 2 <= window <= MAX_MOVING_AVG_WINDOW:
+            return None
+    else:
+        window = None
+    if derive is not None and (derive not in DERIVATIONS or resolution != RESOLUTION_YEAR):
+        return None
+
+    # Several departments are compared side by side unless a shape is asked for
+    if derive is not None or len(departments) > 1:
+        default_shape = SHAPE_DEPARTMENT_BY_YEAR
+    else:
+        default_shape = SHAPE_METRIC_BY_YEAR
+    shape = request.GET.get("shape") or default_shape
+    if shape not in SHAPES or (shape in DEPARTMENT_SHAPES and resolution != RESOLUTION_YEAR):
+        return None
+    # A derived metric_by_year chart must not sum departments together
+    if derive is not None and not (
+        shape == SHAPE_DEPARTMENT_BY_YEAR
+        or (shape == SHAPE_METRIC_BY_YEAR and len(departments) == 1)
+    ):
+        return None
+
+    # Departments are combined in the database for the per-period shape
+    aggregation = request.GET.get("aggregation") or AGGREGATION_SUM
+    if aggregation not in AGGREGATIONS:
+        return None
+    # Department comparisons without a year aggregate across years instead
+    across_years = shape in DEPARTMENT_COMPARISON_SHAPES and year is None
+    if derive is not None or (shape in DEPARTMENT_SHAPES and not across_years):
+        aggregation = None
+
+    return ChartQuery(
+        year, year_from, year_to, departments, metric_types, resolution, shape, aggregation,
+        derive, window,
+    )
+
+
+def _chart_validators(
+    request: Any, version: int, updated_at: Any, params: Tuple[Any, ...]
+) -> Tuple[str, Optional[int], Optional[HttpResponse]]:
+    """ETag and Last-Modified of a chart, plus the 304 response when the client's copy matches."""
+    etag = chart_etag(version, params)
+    last_modified = int(updated_at.timestamp()) if updated_at else None
+
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        not_modified = _revalidate(not_modified)
+    return etag, last_modified, not_modified
+
+
+def _encode_chart(query: ChartQuery, records: Any) -> Dict[str, bytes]:
+    """Build and encode the chart payload variants for the fetched records."""
+    # Undefined derived values stay null (a gap) instead of 0
+    with timing("serialize"):
+        return encode_variants(build_chart(records, query.shape, fill=None if query.derive else 0))
+
+
+def _document_response(
+    request: Any, variants: Dict[str, bytes], etag: str, updated_at: Any
+) -> HttpResponse:
+    """Return a stored chart document as-is, or 304 when the client's copy matches."""
+    last_modified = int(updated_at.timestamp())
+    not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if not_modified is not None:
+        not_modified["ETag"] = etag
+        return _revalidate(not_modified)
+
+    return _encoded_response(request, variants, "DOCUMENT", etag, last_modified)
+
+
+def _encoded_response(
+    request: Any,
+    variants: Dict[str, bytes],
+    cache_status: str,
+    etag: str,
+    last_modified: Optional[int],
+) -> HttpResponse:
+    """Write the pre-encoded payload variant the client's Accept-Encoding allows.
+
+    A compressed body gets a weak ETag, like GZipMiddleware does, since its
+    bytes differ from the identity representation; If-None-Match uses the
+    weak comparison, so revalidation keeps working for both.
+    """
+    encoding = choose_encoding(request.headers.get("Accept-Encoding", ""), variants)
+    response = HttpResponse(variants[encoding], content_type="application/json")
+    response["X-Cache"] = cache_status
+    if encoding == ENCODING_IDENTITY:
+        response["ETag"] = etag
+    else:
+        response["Content-Encoding"] = encoding
+        response["ETag"] = f"W/{etag}"
+    patch_vary_headers(response, ("Accept-Encoding",))
+    if last_modified is not None:
+        response["Last-Modified"] = http_date(last_modified)
+    return _revalidate(response)
+
+
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class MetricExportView(APIView):
+    """Streaming export of the raw MetricRecord rows as CSV or XLSX.
+
+    Takes the same filters as the chart API. Rows are read through a
+    server-side cursor and encoded chunk by chunk (see export.py), so the
+    response starts immediately and worker memory stays flat however many
+    rows are exported. Only authenticated users can access this endpoint.
+
+    URL: GET /api/dashboard/export/?file_format=csv|xlsx&year=YYYY&year_from=YYYY&year_to=YYYY
+         &department=DEPT_NAME[&department=...]&metric_type=TYPE[&metric_type=...]
+         &resolution=year|month
+    """
+
+    def perform_content_negotiation(self, request, force=False):
+        """The file is not rendered by DRF, so an Accept: text/csv must not end in 406."""
+        return super().perform_content_negotiation(request, force=True)
+
+    @read_from_replica
+    def get(self, request: Any) -> Any:
+        """Stream the filtered rows.
+
+        Query Parameters:
+            file_format (optional): "csv" (default) or "xlsx"
+            year, year_from, year_to (optional): Year filters (int)
+            department, metric_type (optional, repeatable): IN filters (str)
+            resolution (optional): "year" (default) exports the yearly rows,
+                "month" the monthly rows of dated sources
+
+        Returns:
+            StreamingHttpResponse: File download, or 400 for invalid parameters
+                (401 when not authenticated)
+        """
+        # Checked here rather than in dispatch() so DRF can render the 401 body
+        if not request.user.is_authenticated:
             return Response(
-                {"error": "server_error"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                {"error": "unauthorized", "message": "인증이 필요합니다."},
+                status=status.HTTP_401_UNAUTHORIZED
             )
 
+        file_format = request.GET.get("file_format") or EXPORT_FORMAT_CSV
+        resolution = request.GET.get("resolution") or RESOLUTION_YEAR
+        try:
+            year = _int_param(request, "year")
+            year_from = _int_param(request, "year_from")
+            year_to = _int_param(request, "year_to")
+        except ValueError:
+            return Response({"error": "invalid_parameter"}, status=status.HTTP_400_BAD_REQUEST)
+        if (
+            file_format not in EXPORT_FORMATS
+            or resolution not in RESOLUTIONS
+            or (year_from is not None and year_to is not None and year_from > year_to)
+        ):
+            return Response({"error": "invalid_parameter"}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = export_rows(
+            year=year,
+            year_from=year_from,
+            year_to=year_to,
+            departments=_list_param(request, "department"),
+            metric_types=_list_param(request, "metric_type"),
+            monthly=resolution != RESOLUTION_YEAR,
+        )
+        stream = stream_xlsx(rows) if file_format == EXPORT_FORMAT_XLSX else stream_csv(rows)
+
+        response = StreamingHttpResponse(stream, content_type=EXPORT_FORMATS[file_format])
+        response["Content-Disposition"] = f'attachment; filename="metric_records.{file_format}"'
+        patch_cache_control(response, private=True, no_store=True)
+        return response
+
+
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class CacheStatsAPIView(APIView):
+    """Staff-only hit/miss counters of the chart response cache.
+
+    Counters are per worker process; the response includes the pid.
+
+    URL: GET /api/dashboard/cache-stats/
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Any) -> Response:
+        version, updated_at = get_data_version()
+        return Response(
+            {**cache_stats(), "data_version": version, "data_updated_at": updated_at},
+            status=status.HTTP_200_OK,
+        )
+
 
 @require_POST
 @csrf_protect
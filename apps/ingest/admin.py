@@ -1,7 +1,7 @@
 """Django Admin Configuration for Ingest App
 
 Registers models and provides admin interfaces with permission controls.
-Implements Excel/CSV upload functionality (UserFlow #02).
+Implements Excel/CSV upload functionality (UserFlow #02) and upload rollback.
 """
 
 from typing import Any
@@ -9,12 +9,23 @@ from django import forms
 from django.contrib import admin
 from django.core.exceptions import ValidationError
 from django.contrib import messages
+from django.db import transaction
 from django.http import HttpResponseRedirect
 from django.urls import reverse, path
 from django.template.response import TemplateResponse
 
-from .models import MetricRecord
-from .services import parse_and_save_excel
+from .models import IngestRun, IngestStage, MetricRecord, UploadBatch, UploadBatchChange
+from .facets import refresh_facets
+from .rollups import apply_rollup_deltas
+from .services import (
+    ADMIN_EDIT_FORMAT,
+    WRITE_BATCH_SIZE,
+    parse_and_save_excel,
+    refresh_yearly_rollups,
+    rollback_batch,
+)
+from .signals import metric_records_changed
+from .versioning import bump_data_version, lock_data_writes
 
 
 class ExcelUploadForm(forms.Form):
@@ -44,8 +55,8 @@ class ExcelUploadForm(forms.Form):
 class MetricRecordAdmin(admin.ModelAdmin):
     """Admin interface for MetricRecord model"""
 
-    list_display = ("year", "department", "metric_type", "metric_value", "updated_at")
-    list_filter = ("year", "department", "metric_type")
+    list_display = ("year", "month", "department", "metric_type", "metric_value", "updated_at")
+    list_filter = ("year", "month", "department", "metric_type")
     search_fields = ("department", "metric_type")
     readonly_fields = ("created_at", "updated_at")
 
@@ -53,7 +64,7 @@ class MetricRecordAdmin(admin.ModelAdmin):
         (
             "Metric Information",
             {
-                "fields": ("year", "department", "metric_type", "metric_value"),
+                "fields": ("year", "month", "department", "metric_type", "metric_value"),
             },
         ),
         (
@@ -80,6 +91,99 @@ class MetricRecordAdmin(admin.ModelAdmin):
         """Only staff can view"""
         return request.user.is_staff  # type: ignore
 
+    def _log_batch(self, request: Any, description: str) -> UploadBatch:
+        """Log an admin edit so uploads that wrote the same rows earlier can no longer be rolled back over it"""
+        return UploadBatch.objects.create(
+            filename=description[:255], file_format=ADMIN_EDIT_FORMAT, uploaded_by=request.user
+        )
+
+    def save_model(self, request: Any, obj: MetricRecord, form: Any, change: bool) -> None:
+        """Keep rollups and facets in step with the edited row, log it and invalidate caches"""
+        with transaction.atomic():
+            lock_data_writes()
+            batch = self._log_batch(request, f"admin edit of record #{obj.pk}")
+            super().save_model(request, obj, form, change)
+            keys = {(obj.year, obj.department, obj.metric_type)}
+            deltas = []
+            if form.initial:
+                initial = form.initial
+                keys.add((initial["year"], initial["department"], initial["metric_type"]))
+                if initial.get("month") is None:
+                    deltas.append(
+                        (initial["year"], initial["department"], initial["metric_type"], initial["metric_value"], None)
+                    )
+            if obj.month is None:
+                deltas.append((obj.year, obj.department, obj.metric_type, None, obj.metric_value))
+            apply_rollup_deltas(deltas)
+            refresh_yearly_rollups(keys if obj.month or form.initial.get("month") else (), batch)
+            # 월 행을 연간 행으로 바꾼 경우 롤업 갱신이 이 행을 이미 기록했을 수 있음
+            UploadBatchChange.objects.bulk_create(
+                [UploadBatchChange(batch=batch, record_id=obj.pk, previous_value=form.initial.get("metric_value"))],
+                ignore_conflicts=True,
+            )
+            refresh_facets(keys)
+            metric_records_changed.send(sender=MetricRecord, keys=keys)
+            bump_data_version()
+
+    def delete_model(self, request: Any, obj: MetricRecord) -> None:
+        """Keep rollups and facets in step with the deleted row, log it and invalidate caches"""
+        with transaction.atomic():
+            lock_data_writes()
+            batch = self._log_batch(request, f"admin delete of record #{obj.pk}")
+            UploadBatchChange.objects.create(
+                batch=batch,
+                record_id=obj.pk,
+                previous_value=obj.metric_value,
+                deleted=True,
+                year=obj.year,
+                month=obj.month,
+                department=obj.department,
+                metric_type=obj.metric_type,
+            )
+            super().delete_model(request, obj)
+            key = (obj.year, obj.department, obj.metric_type)
+            if obj.month:
+                refresh_yearly_rollups({key}, batch)
+            else:
+                apply_rollup_deltas([(*key, obj.metric_value, None)])
+            refresh_facets({key})
+            metric_records_changed.send(sender=MetricRecord, keys={key})
+            bump_data_version()
+
+    def delete_queryset(self, request: Any, queryset: Any) -> None:
+        """Keep rollups and facets in step with bulk-deleted rows, log them and invalidate caches"""
+        with transaction.atomic():
+            lock_data_writes()
+            records = list(queryset.only("id", "year", "month", "department", "metric_type", "metric_value"))
+            batch = self._log_batch(request, f"admin delete of {len(records)} records")
+            UploadBatchChange.objects.bulk_create(
+                [
+                    UploadBatchChange(
+                        batch=batch,
+                        record_id=record.pk,
+                        previous_value=record.metric_value,
+                        deleted=True,
+                        year=record.year,
+                        month=record.month,
+                        department=record.department,
+                        metric_type=record.metric_type,
+                    )
+                    for record in records
+                ],
+                batch_size=WRITE_BATCH_SIZE,
+            )
+            monthly_keys = {(r.year, r.department, r.metric_type) for r in records if r.month is not None}
+            keys = {(r.year, r.department, r.metric_type) for r in records}
+            yearly_values = [
+                (r.year, r.department, r.metric_type, r.metric_value) for r in records if r.month is None
+            ]
+            super().delete_queryset(request, queryset)
+            apply_rollup_deltas((*row, None) for row in yearly_values)
+            refresh_yearly_rollups(monthly_keys, batch)
+            refresh_facets(keys)
+            metric_records_changed.send(sender=MetricRecord, keys=keys)
+            bump_data_version()
+
     def get_urls(self) -> list:
         """Add custom URL for Excel upload"""
         urls = super().get_urls()
@@ -99,7 +203,9 @@ class MetricRecordAdmin(admin.ModelAdmin):
             if form.is_valid():
                 try:
                     file_obj = request.FILES["file"]
-                    success_count, failure_count, summary_message = parse_and_save_excel(file_obj)
+                    success_count, failure_count, summary_message = parse_and_save_excel(
+                        file_obj, uploaded_by=request.user
+                    )
 
                     messages.success(
                         request,
@@ -126,3 +232,106 @@ class MetricRecordAdmin(admin.ModelAdmin):
         }
 
         return TemplateResponse(request, "admin/ingest/upload.html", context)
+
+
+@admin.register(UploadBatch)
+class UploadBatchAdmin(admin.ModelAdmin):
+    """Admin interface for upload batches - lists uploads and rolls them back"""
+
+    list_display = (
+        "id",
+        "filename",
+        "file_format",
+        "uploaded_by",
+        "inserted_count",
+        "updated_count",
+        "created_at",
+        "rolled_back_at",
+    )
+    list_filter = ("file_format", "rolled_back_at")
+    readonly_fields = list_display
+    actions = ("rollback_upload",)
+
+    def has_add_permission(self, request: object) -> bool:
+        """Batches are created by uploads only"""
+        return False
+
+    def has_change_permission(self, request: object, obj: object = None) -> bool:
+        """Batches are an audit log - read only"""
+        return False
+
+    def has_delete_permission(self, request: object, obj: object = None) -> bool:
+        """Deleting a batch would lose the data needed to roll it back"""
+        return False
+
+    def has_view_permission(self, request: object, obj: object = None) -> bool:
+        """Only staff can view"""
+        return request.user.is_staff  # type: ignore
+
+    @admin.action(description="Rollback selected uploads")
+    def rollback_upload(self, request: Any, queryset: Any) -> None:
+        """Undo the selected batches, newest first so overlapping uploads unwind in order"""
+        if not request.user.is_staff:
+            messages.error(request, "Only staff can roll back uploads.")
+            return
+
+        for batch in queryset.order_by("-id"):
+            try:
+                deleted_count, restored_count = rollback_batch(batch)
+                messages.success(
+                    request,
+                    f"Rolled back upload #{batch.pk}: {deleted_count} deleted, {restored_count} restored",
+                )
+            except ValidationError as e:
+                messages.error(request, f"Rollback failed: {e.messages[0]}")
+
+
+class IngestStageInline(admin.TabularInline):
+    """Read-only per-stage measurements of an ingest run"""
+
+    model = IngestStage
+    fields = ("name", "wall_ms", "rows_in", "rows_out", "peak_memory_kb", "top_allocations")
+    readonly_fields = fields
+    extra = 0
+    can_delete = False
+
+    def has_add_permission(self, request: object, obj: object = None) -> bool:
+        return False
+
+
+@admin.register(IngestRun)
+class IngestRunAdmin(admin.ModelAdmin):
+    """Admin interface for ingest runs - sortable list to spot slow or large uploads"""
+
+    list_display = (
+        "created_at",
+        "filename",
+        "file_format",
+        "status",
+        "rows_in",
+        "rows_out",
+        "total_ms",
+        "peak_memory_kb",
+        "batch",
+    )
+    list_filter = ("status", "file_format")
+    search_fields = ("filename",)
+    date_hierarchy = "created_at"
+    readonly_fields = list_display + ("uploaded_by", "error_message")
+    inlines = (IngestStageInline,)
+
+    def has_add_permission(self, request: object) -> bool:
+        """Runs are recorded by uploads only"""
+        return False
+
+    def has_change_permission(self, request: object, obj: object = None) -> bool:
+        """Runs are measurements - read only"""
+        return False
+
+    def has_delete_permission(self, request: object, obj: object = None) -> bool:
+        """Only staff can prune old runs"""
+        return request.user.is_staff  # type: ignore
+
+    def has_view_permission(self, request: object, obj: object = None) -> bool:
+        """Only staff can view"""
+        return request.user.is_staff  # type: ignore
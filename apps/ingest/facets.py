@@ -0,0 +1,85 @@
+"""Metric Facets - Maintained distinct years, departments and metric types
+
+MetricFacet holds one row per distinct year, department and metric_type of
+the yearly MetricRecord rows, with its row count. Write paths call
+refresh_facets() with the keys they touched, so the dashboard can read its
+filter options from a few dozen rows instead of running SELECT DISTINCT
+over the whole table.
+
+Example:
+    from apps.ingest.facets import refresh_facets
+
+    refresh_facets({(2024, "computer-science", "PAPER")})
+"""
+
+from typing import Dict, Iterable, List, Tuple
+
+from django.db.models import Count
+
+from .models import MetricFacet, MetricRecord
+
+FACET_FIELDS = (
+    (MetricFacet.KIND_YEAR, "year"),
+    (MetricFacet.KIND_DEPARTMENT, "department"),
+    (MetricFacet.KIND_METRIC_TYPE, "metric_type"),
+)
+
+
+def refresh_facets(keys: Iterable[Tuple[int, str, str]]) -> None:
+    """
+    Recount the facets touched by a write.
+
+    Each affected year, department and metric_type is recounted with one
+    indexed GROUP BY per kind; values whose count dropped to zero are removed.
+    The recount reads the table, so the caller's transaction must hold
+    versioning.lock_data_writes(); otherwise a concurrent writer's rows are
+    missed and its facets can be deleted.
+
+    Args:
+        keys: (year, department, metric_type) keys that were inserted, updated or deleted
+    """
+    keys = set(keys)
+    if not keys:
+        return
+
+    for position, (kind, field) in enumerate(FACET_FIELDS):
+        values = {key[position] for key in keys}
+        counts = dict(
+            MetricRecord.objects.filter(month__isnull=True, **{f"{field}__in": values})
+            .values_list(field)
+            .annotate(n=Count("id"))
+        )
+        _store_counts(kind, {str(value): counts.get(value, 0) for value in values})
+
+
+def rebuild_facets() -> None:
+    """Recompute every facet from the base table (recovery and test fixtures)."""
+    MetricFacet.objects.all().delete()
+    for kind, field in FACET_FIELDS:
+        counts = (
+            MetricRecord.objects.filter(month__isnull=True).values_list(field).annotate(n=Count("id"))
+        )
+        MetricFacet.objects.bulk_create(
+            MetricFacet(kind=kind, value=str(value), record_count=n) for value, n in counts
+        )
+
+
+def _store_counts(kind: str, counts: Dict[str, int]) -> None:
+    """Upsert non-zero counts and delete facets that no longer have rows."""
+    MetricFacet.objects.filter(
+        kind=kind, value__in=[value for value, n in counts.items() if n == 0]
+    ).delete()
+    MetricFacet.objects.bulk_create(
+        [MetricFacet(kind=kind, value=value, record_count=n) for value, n in counts.items() if n],
+        update_conflicts=True,
+        unique_fields=["kind", "value"],
+        update_fields=["record_count"],
+    )
+
+
+def read_facets() -> Dict[str, List[str]]:
+    """All facet values by kind in one indexed query, in (kind, value) order."""
+    facets: Dict[str, List[str]] = {kind: [] for kind, _ in FACET_FIELDS}
+    for kind, value in MetricFacet.objects.order_by("kind", "value").values_list("kind", "value"):
+        facets[kind].append(value)
+    return facets
@@ -0,0 +1,158 @@
+"""Ingest Instrumentation - Per-stage timing and memory profiling
+
+Measures wall time, row counts and peak traced memory for each stage of an
+ingest run (read, detect_format, transform, normalize, write) and stores
+them as IngestRun / IngestStage rows.
+
+Example:
+    profiler = IngestProfiler()
+    with profiler.stage("read") as stage:
+        df = pd.read_csv(file_obj)
+        stage["rows_out"] = len(df)
+    profiler.save(filename="data.csv", status=IngestRun.STATUS_SUCCESS)
+"""
+
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+from .models import IngestRun, IngestStage
+
+# tracemalloc은 프로세스 전역: 같은 워커의 동시 업로드(gthread)가 시작/종료를 공유
+_tracing_lock = threading.Lock()
+_active_profilers = 0
+_profiler_generation = 0  # 프로파일러가 시작될 때마다 증가 (단계 도중 합류 감지)
+_started_tracing = False
+
+
+def _acquire_tracing() -> None:
+    """Register a tracing profiler; the first one starts tracemalloc unless it is already running."""
+    global _active_profilers, _profiler_generation, _started_tracing
+    with _tracing_lock:
+        if _active_profilers == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _started_tracing = True
+        _active_profilers += 1
+        _profiler_generation += 1
+
+
+def _release_tracing() -> None:
+    """Unregister a profiler; the last one stops tracemalloc if a profiler started it."""
+    global _active_profilers, _started_tracing
+    with _tracing_lock:
+        _active_profilers -= 1
+        if _active_profilers == 0 and _started_tracing:
+            tracemalloc.stop()
+            _started_tracing = False
+
+
+def _begin_stage() -> Optional[int]:
+    """Reset the peak for a stage when no other run is traced; returns the generation to check, else None."""
+    with _tracing_lock:
+        if _active_profilers != 1 or not tracemalloc.is_tracing():
+            return None
+        tracemalloc.reset_peak()
+        return _profiler_generation
+
+
+def _stage_peak_kb(generation: Optional[int]) -> Optional[int]:
+    """Peak traced memory since _begin_stage, or None when another run overlapped the stage."""
+    with _tracing_lock:
+        if generation is None or generation != _profiler_generation or not tracemalloc.is_tracing():
+            return None
+        return tracemalloc.get_traced_memory()[1] // 1024
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, limit: int) -> List[Dict[str, Any]]:
+    """Summarize the largest allocation sites of a snapshot, skipping tracemalloc itself."""
+    snapshot = snapshot.filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+    return [
+        {
+            "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+            "size_kb": round(stat.size / 1024, 1),
+            "count": stat.count,
+        }
+        for stat in snapshot.statistics("lineno")[:limit]
+    ]
+
+
+class IngestProfiler:
+    """Collects stage measurements for one ingest run.
+
+    Memory is traced with tracemalloc for the duration of the run when
+    INGEST_TRACE_MEMORY is on. tracemalloc is process-wide, so concurrent
+    runs share it through a reference count: the last one to finish stops
+    it (tracing started by someone else is left running). The peak of a
+    stage is only recorded when no other run overlapped it, otherwise
+    peak_memory_kb is None. A stage slower than INGEST_SLOW_STAGE_SECONDS
+    also records the top allocation sites while tracing is on.
+    """
+
+    def __init__(self) -> None:
+        self.trace_memory = getattr(settings, "INGEST_TRACE_MEMORY", False)
+        self.slow_stage_seconds = getattr(settings, "INGEST_SLOW_STAGE_SECONDS", 2.0)
+        self.top_allocations_limit = getattr(settings, "INGEST_TOP_ALLOCATIONS", 10)
+        self.stages: List[Dict[str, Any]] = []
+        self._tracing = False
+        self._started_at = time.perf_counter()
+
+        if self.trace_memory:
+            _acquire_tracing()
+            self._tracing = True
+
+    @contextmanager
+    def stage(self, name: str, rows_in: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Measure one stage. Set ``rows_out`` on the yielded dict before leaving the block."""
+        measurement: Dict[str, Any] = {"name": name, "rows_in": rows_in, "rows_out": None}
+        generation = _begin_stage() if self._tracing else None
+        started = time.perf_counter()
+        try:
+            yield measurement
+        finally:
+            elapsed = time.perf_counter() - started
+            measurement["wall_ms"] = round(elapsed * 1000, 2)
+            measurement["peak_memory_kb"] = None
+            measurement["top_allocations"] = []
+            if self._tracing:
+                measurement["peak_memory_kb"] = _stage_peak_kb(generation)
+                if elapsed >= self.slow_stage_seconds and tracemalloc.is_tracing():
+                    try:
+                        snapshot = tracemalloc.take_snapshot()
+                    except RuntimeError:  # 다른 스레드가 방금 추적을 종료함
+                        snapshot = None
+                    if snapshot is not None:
+                        measurement["top_allocations"] = _top_allocations(snapshot, self.top_allocations_limit)
+            self.stages.append(measurement)
+
+    def stop(self) -> None:
+        """Release tracing for this run (stopped when no other run is traced)."""
+        if self._tracing:
+            _release_tracing()
+            self._tracing = False
+
+    def save(self, **run_fields: Any) -> IngestRun:
+        """Persist the run and its stages. Extra keyword arguments are IngestRun fields."""
+        self.stop()
+        peaks = [s["peak_memory_kb"] for s in self.stages if s["peak_memory_kb"] is not None]
+        fields = {
+            "total_ms": round((time.perf_counter() - self._started_at) * 1000, 2),
+            "rows_in": self.stages[0]["rows_out"] if self.stages else None,
+            "rows_out": self.stages[-1]["rows_out"] if self.stages else None,
+            "peak_memory_kb": max(peaks) if peaks else None,
+        }
+        fields.update(run_fields)
+        run = IngestRun.objects.create(**fields)
+        IngestStage.objects.bulk_create(
+            IngestStage(run=run, position=position, **measurement)
+            for position, measurement in enumerate(self.stages)
+        )
+        return run
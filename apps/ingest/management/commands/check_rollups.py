@@ -0,0 +1,34 @@
+"""Verify the metric rollup tables against MetricRecord.
+
+Usage:
+    python manage.py check_rollups
+    python manage.py check_rollups --fix    # rebuild when differences are found
+
+Exits with status 1 when a difference is found (and not fixed).
+"""
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.ingest.rollups import check_rollups
+
+
+class Command(BaseCommand):
+    help = "Compare YearMetricRollup and DepartmentMetricRollup with the base table"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true", help="Rebuild the rollups when they differ")
+
+    def handle(self, *args, **options):
+        problems = check_rollups()
+        if not problems:
+            self.stdout.write(self.style.SUCCESS("Rollups are consistent"))
+            return
+
+        for problem in problems:
+            self.stdout.write(problem)
+
+        if options["fix"]:
+            call_command("rebuild_rollups", stdout=self.stdout, stderr=self.stderr)
+            return
+        raise CommandError(f"{len(problems)} rollup rows differ from the base table")
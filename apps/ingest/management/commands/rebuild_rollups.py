@@ -0,0 +1,32 @@
+"""Recompute the metric rollup tables from MetricRecord.
+
+The "all departments" chart documents are built from YearMetricRollup, so
+they are rebuilt in the same transaction; otherwise the dashboard would keep
+serving the totals of the repaired rollups.
+
+Usage:
+    python manage.py rebuild_rollups
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from apps.dashboard.documents import rebuild_documents
+from apps.ingest.rollups import check_rollups, rebuild_rollups
+from apps.ingest.versioning import bump_data_version, lock_data_writes
+
+
+class Command(BaseCommand):
+    help = "Recompute YearMetricRollup and DepartmentMetricRollup from the base table, then the chart documents"
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            lock_data_writes()
+            rebuild_rollups()
+            rebuild_documents()
+            bump_data_version()
+
+        problems = check_rollups()
+        if problems:
+            raise CommandError(f"{len(problems)} rollup rows still differ after the rebuild")
+        self.stdout.write(self.style.SUCCESS("Rollups and chart documents rebuilt"))
@@ -0,0 +1,57 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:36
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0002_add_compound_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadBatch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filename', models.CharField(max_length=255)),
+                ('file_format', models.CharField(max_length=50)),
+                ('inserted_count', models.IntegerField(default=0)),
+                ('updated_count', models.IntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('rolled_back_at', models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='UploadBatchChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('record_id', models.BigIntegerField()),
+                ('previous_value', models.DecimalField(decimal_places=4, max_digits=18, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='uploadbatch',
+            name='uploaded_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='uploadbatchchange',
+            name='batch',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='ingest.uploadbatch'),
+        ),
+        migrations.AddIndex(
+            model_name='uploadbatchchange',
+            index=models.Index(fields=['record_id'], name='idx_batch_change_record'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='uploadbatchchange',
+            unique_together={('batch', 'record_id')},
+        ),
+    ]
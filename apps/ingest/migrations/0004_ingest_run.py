@@ -0,0 +1,65 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:39
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0003_upload_batch'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IngestRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('filename', models.CharField(max_length=255)),
+                ('file_format', models.CharField(blank=True, max_length=50)),
+                ('status', models.CharField(choices=[('success', 'Success'), ('rejected', 'Rejected'), ('error', 'Error')], max_length=20)),
+                ('error_message', models.TextField(blank=True)),
+                ('rows_in', models.IntegerField(null=True)),
+                ('rows_out', models.IntegerField(null=True)),
+                ('total_ms', models.FloatField()),
+                ('peak_memory_kb', models.IntegerField(null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ('-created_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='IngestStage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('position', models.PositiveSmallIntegerField()),
+                ('name', models.CharField(max_length=30)),
+                ('wall_ms', models.FloatField()),
+                ('rows_in', models.IntegerField(null=True)),
+                ('rows_out', models.IntegerField(null=True)),
+                ('peak_memory_kb', models.IntegerField(null=True)),
+                ('top_allocations', models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                'ordering': ('run', 'position'),
+            },
+        ),
+        migrations.AddField(
+            model_name='ingestrun',
+            name='batch',
+            field=models.OneToOneField(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='run', to='ingest.uploadbatch'),
+        ),
+        migrations.AddField(
+            model_name='ingestrun',
+            name='uploaded_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='ingeststage',
+            name='run',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stages', to='ingest.ingestrun'),
+        ),
+    ]
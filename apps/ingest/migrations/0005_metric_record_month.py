@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0004_ingest_run'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='metricrecord',
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name='metricrecord',
+            name='month',
+            field=models.PositiveSmallIntegerField(blank=True, null=True),
+        ),
+        migrations.AddConstraint(
+            model_name='metricrecord',
+            constraint=models.UniqueConstraint(condition=models.Q(('month__isnull', True)), fields=('year', 'department', 'metric_type'), name='uniq_metric_record_year'),
+        ),
+        migrations.AddConstraint(
+            model_name='metricrecord',
+            constraint=models.UniqueConstraint(condition=models.Q(('month__isnull', False)), fields=('year', 'department', 'metric_type', 'month'), name='uniq_metric_record_month'),
+        ),
+    ]
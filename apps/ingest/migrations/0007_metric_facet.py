@@ -0,0 +1,38 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:46
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_facets(apps, schema_editor):
+    MetricRecord = apps.get_model('ingest', 'MetricRecord')
+    MetricFacet = apps.get_model('ingest', 'MetricFacet')
+    for field in ('year', 'department', 'metric_type'):
+        counts = MetricRecord.objects.filter(month__isnull=True).values_list(field).annotate(n=Count('id'))
+        MetricFacet.objects.bulk_create(
+            MetricFacet(kind=field, value=str(value), record_count=n) for value, n in counts
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0006_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MetricFacet',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('year', 'Year'), ('department', 'Department'), ('metric_type', 'Metric type')], max_length=20)),
+                ('value', models.CharField(max_length=100)),
+                ('record_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='metricfacet',
+            constraint=models.UniqueConstraint(fields=('kind', 'value'), name='uniq_metric_facet'),
+        ),
+        migrations.RunPython(populate_facets, migrations.RunPython.noop),
+    ]
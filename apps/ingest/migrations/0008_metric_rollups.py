@@ -0,0 +1,62 @@
+# Generated by Django 5.2.7 on 2026-10-19 17:56
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+
+
+def populate_rollups(apps, schema_editor):
+    MetricRecord = apps.get_model('ingest', 'MetricRecord')
+    for model_name, fields in (
+        ('YearMetricRollup', ('year', 'metric_type')),
+        ('DepartmentMetricRollup', ('department', 'metric_type')),
+    ):
+        model = apps.get_model('ingest', model_name)
+        totals = (
+            MetricRecord.objects.filter(month__isnull=True)
+            .values_list(*fields)
+            .annotate(total=Sum('metric_value'), row_count=Count('id'))
+            .order_by()
+        )
+        model.objects.bulk_create(
+            model(**dict(zip(fields, key)), total=total, row_count=row_count)
+            for *key, total, row_count in totals
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0007_metric_facet'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DepartmentMetricRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('department', models.CharField(max_length=100)),
+                ('metric_type', models.CharField(max_length=50)),
+                ('total', models.DecimalField(decimal_places=4, default=0, max_digits=24)),
+                ('row_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='YearMetricRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('metric_type', models.CharField(max_length=50)),
+                ('total', models.DecimalField(decimal_places=4, default=0, max_digits=24)),
+                ('row_count', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='departmentmetricrollup',
+            constraint=models.UniqueConstraint(fields=('department', 'metric_type'), name='uniq_department_metric_rollup'),
+        ),
+        migrations.AddConstraint(
+            model_name='yearmetricrollup',
+            constraint=models.UniqueConstraint(fields=('year', 'metric_type'), name='uniq_year_metric_rollup'),
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.7 on 2026-10-19 18:22
+
+# Purpose: Covering partial indexes for every chart API filter pattern
+# (year, department-only, metric_type-only, monthly), so the dashboard
+# queries are answered by index-only scans. The (year, department) index
+# from 0002 is superseded by idx_metric_year_cover (yearly rows) and
+# idx_metric_month_cover (monthly rows) and is dropped.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0008_metric_rollups'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='metricrecord',
+            name='idx_metric_records_year_department',
+        ),
+        migrations.AddIndex(
+            model_name='metricrecord',
+            index=models.Index(condition=models.Q(('month__isnull', True)), fields=['year', 'department', 'metric_type', 'metric_value', 'month'], name='idx_metric_year_cover'),
+        ),
+        migrations.AddIndex(
+            model_name='metricrecord',
+            index=models.Index(condition=models.Q(('month__isnull', True)), fields=['department', 'year', 'metric_type', 'metric_value', 'month'], name='idx_metric_department_cover'),
+        ),
+        migrations.AddIndex(
+            model_name='metricrecord',
+            index=models.Index(condition=models.Q(('month__isnull', True)), fields=['metric_type', 'year', 'department', 'metric_value', 'month'], name='idx_metric_type_cover'),
+        ),
+        migrations.AddIndex(
+            model_name='metricrecord',
+            index=models.Index(condition=models.Q(('month__isnull', False)), fields=['year', 'month', 'metric_type', 'department', 'metric_value'], name='idx_metric_month_cover'),
+        ),
+        migrations.AddIndex(
+            model_name='metricrecord',
+            index=models.Index(condition=models.Q(('month__isnull', False)), fields=['department', 'year', 'month', 'metric_type', 'metric_value'], name='idx_metric_month_department'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 5.2.7 on 2026-10-19 19:21
+
+# Purpose: Log monthly rows deleted by a dated re-upload (with their natural
+# key and value) so rollback_batch can insert them again.
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ingest', '0009_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='uploadbatchchange',
+            name='deleted',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='uploadbatchchange',
+            name='department',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddField(
+            model_name='uploadbatchchange',
+            name='metric_type',
+            field=models.CharField(blank=True, max_length=50),
+        ),
+        migrations.AddField(
+            model_name='uploadbatchchange',
+            name='month',
+            field=models.PositiveSmallIntegerField(null=True),
+        ),
+        migrations.AddField(
+            model_name='uploadbatchchange',
+            name='year',
+            field=models.IntegerField(null=True),
+        ),
+    ]
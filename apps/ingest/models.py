@@ -1,7 +1,25 @@
+from django.conf import settings
 from django.db import models
 
 class MetricRecord(models.Model):
+    """A metric value for one (year, department, metric_type).
+
+    Dated sources (publication_list, research_project) also store one row per
+    month. Rows with month=NULL are yearly values; for dated sources they are
+    rollups kept equal to the SUM of the monthly rows by
+    services.refresh_yearly_rollups, so year-level queries read them directly.
+
+    The yearly rows have one partial index per leading filter column of the
+    chart API (year, department, metric_type). Each index holds every column
+    the chart queries read, metric_value included, so they are answered by
+    index-only scans (checked with EXPLAIN in dashboard QueryPlanTests).
+    month, always NULL in the yearly indexes, is their last key column only
+    because SQLite does not treat a partial index as covering when the
+    column of its condition is missing.
+    """
+
     year = models.IntegerField()
+    month = models.PositiveSmallIntegerField(null=True, blank=True)
     department = models.CharField(max_length=100)
     metric_type = models.CharField(max_length=50)
     metric_value = models.DecimalField(max_digits=18, decimal_places=4)
@@ -9,7 +27,251 @@ class MetricRecord(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ("year", "department", "metric_type")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["year", "department", "metric_type"],
+                condition=models.Q(month__isnull=True),
+                name="uniq_metric_record_year",
+            ),
+            models.UniqueConstraint(
+                fields=["year", "department", "metric_type", "month"],
+                condition=models.Q(month__isnull=False),
+                name="uniq_metric_record_month",
+            ),
+        ]
+        indexes = [
+            # year / year + department filters (replaces idx_metric_records_year_department)
+            models.Index(
+                fields=["year", "department", "metric_type", "metric_value", "month"],
+                condition=models.Q(month__isnull=True),
+                name="idx_metric_year_cover",
+            ),
+            # department-only filters (all years of one or more departments)
+            models.Index(
+                fields=["department", "year", "metric_type", "metric_value", "month"],
+                condition=models.Q(month__isnull=True),
+                name="idx_metric_department_cover",
+            ),
+            # metric_type filters without a year or department
+            models.Index(
+                fields=["metric_type", "year", "department", "metric_value", "month"],
+                condition=models.Q(month__isnull=True),
+                name="idx_metric_type_cover",
+            ),
+            # monthly series, in the (year, month, metric_type) GROUP BY order
+            models.Index(
+                fields=["year", "month", "metric_type", "department", "metric_value"],
+                condition=models.Q(month__isnull=False),
+                name="idx_metric_month_cover",
+            ),
+            # monthly series of one or more departments
+            models.Index(
+                fields=["department", "year", "month", "metric_type", "metric_value"],
+                condition=models.Q(month__isnull=False),
+                name="idx_metric_month_department",
+            ),
+        ]
+
+    def __str__(self):
+        if self.month:
+            return f"{self.year}-{self.month:02d} - {self.department} - {self.metric_type}"
+        return f"{self.year} - {self.department} - {self.metric_type}"
+
+
+class UploadBatch(models.Model):
+    """One ingest run (a single uploaded file).
+
+    The rows it touched are recorded in UploadBatchChange so the whole batch
+    can be undone with a few set-based statements (see services.rollback_batch).
+    Row edits and deletes in the admin are logged the same way with
+    file_format=services.ADMIN_EDIT_FORMAT, so an earlier upload cannot be
+    rolled back over them.
+    """
+
+    filename = models.CharField(max_length=255)
+    file_format = models.CharField(max_length=50)
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
+    )
+    inserted_count = models.IntegerField(default=0)
+    updated_count = models.IntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    rolled_back_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"#{self.pk} {self.filename}"
+
+    @property
+    def is_rolled_back(self) -> bool:
+        return self.rolled_back_at is not None
+
+
+class UploadBatchChange(models.Model):
+    """A MetricRecord row written by a batch.
+
+    previous_value is NULL for rows the batch inserted, otherwise it holds the
+    value the row had before the batch updated it. record_id is a plain
+    column (not a ForeignKey) so deleting MetricRecord rows stays a single
+    DELETE without cascade collection.
+
+    Rows the batch deleted (monthly rows missing from a dated re-upload) are
+    logged with deleted=True and their natural key, so rollback can insert
+    them again with previous_value.
+    """
+
+    batch = models.ForeignKey(UploadBatch, on_delete=models.CASCADE, related_name="changes")
+    record_id = models.BigIntegerField()
+    previous_value = models.DecimalField(max_digits=18, decimal_places=4, null=True)
+    deleted = models.BooleanField(default=False)
+    year = models.IntegerField(null=True)
+    month = models.PositiveSmallIntegerField(null=True)
+    department = models.CharField(max_length=100, blank=True)
+    metric_type = models.CharField(max_length=50, blank=True)
+
+    class Meta:
+        unique_together = ("batch", "record_id")
+        indexes = [
+            models.Index(fields=["record_id"], name="idx_batch_change_record"),
+        ]
+
+
+class IngestRun(models.Model):
+    """Timing and memory profile of one upload attempt, successful or not."""
+
+    STATUS_SUCCESS = "success"
+    STATUS_REJECTED = "rejected"
+    STATUS_ERROR = "error"
+    STATUS_CHOICES = (
+        (STATUS_SUCCESS, "Success"),
+        (STATUS_REJECTED, "Rejected"),
+        (STATUS_ERROR, "Error"),
+    )
+
+    filename = models.CharField(max_length=255)
+    file_format = models.CharField(max_length=50, blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES)
+    error_message = models.TextField(blank=True)
+    batch = models.OneToOneField(
+        UploadBatch, null=True, blank=True, on_delete=models.SET_NULL, related_name="run"
+    )
+    uploaded_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, blank=True, on_delete=models.SET_NULL
+    )
+    rows_in = models.IntegerField(null=True)
+    rows_out = models.IntegerField(null=True)
+    total_ms = models.FloatField()
+    peak_memory_kb = models.IntegerField(null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-created_at",)
+
+    def __str__(self):
+        return f"{self.filename} ({self.status}, {self.total_ms:.0f} ms)"
+
+
+class IngestStage(models.Model):
+    """One measured stage (read, detect_format, transform, normalize, write) of an IngestRun."""
+
+    run = models.ForeignKey(IngestRun, on_delete=models.CASCADE, related_name="stages")
+    position = models.PositiveSmallIntegerField()
+    name = models.CharField(max_length=30)
+    wall_ms = models.FloatField()
+    rows_in = models.IntegerField(null=True)
+    rows_out = models.IntegerField(null=True)
+    peak_memory_kb = models.IntegerField(null=True)
+    top_allocations = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        ordering = ("run", "position")
+
+    def __str__(self):
+        return f"{self.name}: {self.wall_ms:.1f} ms"
+
+
+class MetricFacet(models.Model):
+    """A distinct year, department or metric_type of the yearly MetricRecord rows.
+
+    Maintained by apps/ingest/facets.py so the dashboard can list filter
+    options without SELECT DISTINCT over MetricRecord.
+    """
+
+    KIND_YEAR = "year"
+    KIND_DEPARTMENT = "department"
+    KIND_METRIC_TYPE = "metric_type"
+    KIND_CHOICES = (
+        (KIND_YEAR, "Year"),
+        (KIND_DEPARTMENT, "Department"),
+        (KIND_METRIC_TYPE, "Metric type"),
+    )
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    value = models.CharField(max_length=100)
+    record_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "value"], name="uniq_metric_facet"),
+        ]
+
+    def __str__(self):
+        return f"{self.kind}={self.value} ({self.record_count})"
+
+
+class YearMetricRollup(models.Model):
+    """SUM and COUNT of the yearly MetricRecord rows per (year, metric_type), all departments.
+
+    Maintained incrementally from writer deltas by apps/ingest/rollups.py.
+    """
+
+    year = models.IntegerField()
+    metric_type = models.CharField(max_length=50)
+    total = models.DecimalField(max_digits=24, decimal_places=4, default=0)
+    row_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["year", "metric_type"], name="uniq_year_metric_rollup"),
+        ]
+
+    def __str__(self):
+        return f"{self.year} - {self.metric_type}: {self.total} ({self.row_count})"
+
+
+class DepartmentMetricRollup(models.Model):
+    """SUM and COUNT of the yearly MetricRecord rows per (department, metric_type), all years.
+
+    Maintained incrementally from writer deltas by apps/ingest/rollups.py.
+    """
+
+    department = models.CharField(max_length=100)
+    metric_type = models.CharField(max_length=50)
+    total = models.DecimalField(max_digits=24, decimal_places=4, default=0)
+    row_count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["department", "metric_type"], name="uniq_department_metric_rollup"
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.department} - {self.metric_type}: {self.total} ({self.row_count})"
+
+
+class DataVersion(models.Model):
+    """Single-row counter bumped whenever MetricRecord data changes.
+
+    Readers key their caches by this version (see apps/ingest/versioning.py),
+    so every worker process sees an invalidation as soon as the bump commits.
+    """
+
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
-        return f"{self.year} - {self.department} - {self.metric_type}"
\ No newline at end of file
+        return f"v{self.version}"
@@ -0,0 +1,150 @@
+"""Metric Rollups - Incrementally maintained dashboard aggregates
+
+YearMetricRollup and DepartmentMetricRollup hold SUM and COUNT of the yearly
+MetricRecord rows (month IS NULL) at (year, metric_type) and
+(department, metric_type) granularity. Every write path reports the value
+changes it applied as deltas; apply_rollup_deltas() folds them into the
+rollups with one INSERT ... ON CONFLICT DO UPDATE per table, adding to the
+stored totals so concurrent writers never overwrite each other.
+
+rebuild_rollups() recomputes both tables from the base table and
+check_rollups() compares them without changing anything (see the
+rebuild_rollups / check_rollups management commands).
+
+Example:
+    from apps.ingest.rollups import apply_rollup_deltas
+
+    # (year, department, metric_type, old_value, new_value); None = no row
+    apply_rollup_deltas([(2024, "컴퓨터공학과", "PAPER", Decimal("10"), Decimal("12"))])
+"""
+
+from decimal import Decimal
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import connection
+from django.db.models import Count, Sum
+
+from .models import DepartmentMetricRollup, MetricRecord, YearMetricRollup
+
+# (year, department, metric_type, old_value, new_value); None means the row did not / no longer exists
+RollupDelta = Tuple[int, str, str, Optional[Decimal], Optional[Decimal]]
+
+# Rows per INSERT statement (keeps SQLite below its bound-parameter limit)
+UPSERT_BATCH_SIZE = 200
+
+ROLLUP_TABLES = (
+    (YearMetricRollup, ("year", "metric_type")),
+    (DepartmentMetricRollup, ("department", "metric_type")),
+)
+
+
+def apply_rollup_deltas(deltas: Iterable[RollupDelta]) -> None:
+    """
+    Add the value changes of yearly MetricRecord rows to both rollup tables.
+
+    Must run in the same transaction as the writes it describes. Rollup rows
+    whose count drops to zero are deleted.
+
+    Args:
+        deltas: (year, department, metric_type, old_value, new_value) per changed row
+    """
+    year_changes: Dict[Tuple, List] = {}
+    department_changes: Dict[Tuple, List] = {}
+
+    for year, department, metric_type, old, new in deltas:
+        total = (new or 0) - (old or 0)
+        count = (new is not None) - (old is not None)
+        if not total and not count:
+            continue
+        for changes, key in (
+            (year_changes, (year, metric_type)),
+            (department_changes, (department, metric_type)),
+        ):
+            change = changes.setdefault(key, [Decimal(0), 0])
+            change[0] += total
+            change[1] += count
+
+    for (model, fields), changes in zip(ROLLUP_TABLES, (year_changes, department_changes)):
+        if changes:
+            _upsert_increments(model, fields, changes)
+
+
+def _upsert_increments(model, fields: Tuple[str, str], changes: Dict[Tuple, List]) -> None:
+    """INSERT the changes, or add them to the existing row, then drop empty rows."""
+    quote = connection.ops.quote_name
+    table = quote(model._meta.db_table)
+    columns = ", ".join(quote(field) for field in (*fields, "total", "row_count"))
+    conflict = ", ".join(quote(field) for field in fields)
+    total, row_count = quote("total"), quote("row_count")
+
+    items = list(changes.items())
+    with connection.cursor() as cursor:
+        for start in range(0, len(items), UPSERT_BATCH_SIZE):
+            chunk = items[start:start + UPSERT_BATCH_SIZE]
+            placeholders = ", ".join(["(%s, %s, %s, %s)"] * len(chunk))
+            params = [value for key, (delta, count) in chunk for value in (*key, delta, count)]
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) VALUES {placeholders} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET "
+                f"{total} = {table}.{total} + EXCLUDED.{total}, "
+                f"{row_count} = {table}.{row_count} + EXCLUDED.{row_count}",
+                params,
+            )
+    model.objects.filter(row_count__lte=0).delete()
+
+
+def _base_totals(fields: Tuple[str, str]):
+    """SUM / COUNT of the yearly rows grouped by the rollup fields."""
+    return (
+        MetricRecord.objects.filter(month__isnull=True)
+        .values_list(*fields)
+        .annotate(total=Sum("metric_value"), row_count=Count("id"))
+        .order_by()
+    )
+
+
+def rebuild_rollups() -> None:
+    """Recompute both rollup tables from the base table (recovery)."""
+    for model, fields in ROLLUP_TABLES:
+        model.objects.all().delete()
+        model.objects.bulk_create(
+            (
+                model(**dict(zip(fields, key)), total=total, row_count=row_count)
+                for *key, total, row_count in _base_totals(fields)
+            ),
+            batch_size=UPSERT_BATCH_SIZE,
+        )
+
+
+def check_rollups() -> List[str]:
+    """
+    Compare both rollup tables with the base table.
+
+    Returns:
+        List[str]: One message per mismatching, missing or extra rollup row (empty when consistent)
+    """
+    problems = []
+    for model, fields in ROLLUP_TABLES:
+        expected = {tuple(key): (total, row_count) for *key, total, row_count in _base_totals(fields)}
+        stored = {
+            tuple(key): (total, row_count)
+            for *key, total, row_count in model.objects.values_list(*fields, "total", "row_count")
+        }
+        name = model.__name__
+        for key in sorted(expected.keys() | stored.keys(), key=str):
+            if key not in stored:
+                problems.append(f"{name} {key}: missing (expected {expected[key]})")
+            elif key not in expected:
+                problems.append(f"{name} {key}: extra row {stored[key]}")
+            elif not _same(stored[key], expected[key]):
+                problems.append(f"{name} {key}: stored {stored[key]}, expected {expected[key]}")
+    return problems
+
+
+def _same(stored: Tuple, expected: Tuple) -> bool:
+    """Totals are compared at the model's 4 decimal places."""
+    quantum = Decimal("0.0001")
+    return (
+        stored[1] == expected[1]
+        and Decimal(stored[0]).quantize(quantum) == Decimal(expected[0]).quantize(quantum)
+    )
@@ -4,18 +4,33 @@ This module handles Excel/CSV file parsing, data normalization, and database UPS
 Implements the core logic for UserFlow #02 (Admin Excel Upload).
 """
 
-from typing import List, Dict, Any, Tuple, Optional, TYPE_CHECKING
+import logging
+import operator
+from functools import reduce
+from typing import List, Dict, Any, Iterable, Tuple, Optional, TYPE_CHECKING
 from decimal import Decimal
 
 # TYPE_CHECKING: 타입 체커에게만 pandas를 알림 (런타임에는 실행 안됨)
 if TYPE_CHECKING:
+    import numpy as np
     import pandas as pd
 
 # Lazy import: pandas는 함수 내부에서 import (Django admin 로드 시 무거운 의존성 방지)
 from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import OuterRef, Q, Subquery, Sum
+from django.utils import timezone
 
-from .models import MetricRecord
+from apps.monitoring import metrics
+
+from .facets import refresh_facets
+from .instrumentation import IngestProfiler
+from .models import IngestRun, MetricRecord, UploadBatch, UploadBatchChange
+from .rollups import apply_rollup_deltas
+from .signals import metric_records_changed
+from .versioning import bump_data_version, lock_data_writes
+
+logger = logging.getLogger(__name__)
 
 
 ALLOWED_DEPARTMENTS = {
@@ -70,6 +85,9 @@ ALLOWED_METRICS = {
 ALLOWED_FILE_EXTENSIONS = {".xlsx", ".xls", ".csv"}
 REQUIRED_COLUMNS = {"year", "department", "metric_type", "value"}
 FAILURE_THRESHOLD_PERCENTAGE = 20
+WRITE_BATCH_SIZE = 1000
+# 관리자 화면의 행 수정/삭제를 기록하는 UploadBatch 형식 (업로드가 아니므로 되돌릴 수 없음)
+ADMIN_EDIT_FORMAT = "admin_edit"
 
 # 한글 컬럼명 → metric_type 매핑
 KOREAN_COLUMN_MAPPING = {
@@ -81,12 +99,26 @@ KOREAN_COLUMN_MAPPING = {
 }
 
 
-def parse_and_save_excel(file_obj: Any) -> Tuple[int, int, str]:
+def _alias_key(value: str) -> str:
+    """Matching key for alias lookup: case-, whitespace- and hyphen/underscore-insensitive."""
+    return "".join(ch for ch in value if not ch.isspace() and ch not in "-_").casefold()
+
+
+# 정규화 키 → 표준 이름 (ALLOWED_* 테이블에서 생성)
+DEPARTMENT_ALIASES = {_alias_key(alias): name for alias, name in ALLOWED_DEPARTMENTS.items()}
+METRIC_ALIASES = {_alias_key(alias): name for alias, name in ALLOWED_METRICS.items()}
+
+
+def parse_and_save_excel(file_obj: Any, uploaded_by: Optional[Any] = None) -> Tuple[int, int, str]:
     """
     Parse and save Excel/CSV file to database.
 
+    Every successful upload is recorded as an UploadBatch so it can be
+    undone later with rollback_batch().
+
     Args:
         file_obj: Django UploadedFile object
+        uploaded_by: Optional user who uploaded the file
 
     Returns:
         Tuple[int, int, str]: (success_count, failure_count, summary_message)
@@ -96,6 +128,14 @@ def parse_and_save_excel(file_obj: Any) -> Tuple[int, int, str]:
     """
     import pandas as pd  # Lazy import: 함수 호출 시점에만 로드
 
+    profiler = IngestProfiler()
+    run_fields = {
+        "filename": file_obj.name[:255],
+        "uploaded_by": uploaded_by,
+        "status": IngestRun.STATUS_ERROR,
+    }
+    failed_rows = 0
+
     try:
         filename = file_obj.name.lower()
         if not any(filename.endswith(ext) for ext in ALLOWED_FILE_EXTENSIONS):
@@ -103,47 +143,90 @@ def parse_and_save_excel(file_obj: Any) -> Tuple[int, int, str]:
                 f"File format not allowed. Allowed: {', '.join(ALLOWED_FILE_EXTENSIONS)}"
             )
 
-        if filename.endswith(".csv"):
-            df = pd.read_csv(file_obj)
-        else:
-            df = pd.read_excel(file_obj)
+        with profiler.stage("read") as stage:
+            if filename.endswith(".csv"):
+                df = pd.read_csv(file_obj)
+            else:
+                df = pd.read_excel(file_obj)
+            stage["rows_out"] = len(df)
 
         # 파일 형식 감지
-        file_format = _detect_file_format(df)
-
-        if file_format == "standard":
-            _validate_columns(df)
-        elif file_format == "department_kpi":
-            df = _transform_korean_format(df)
-        elif file_format == "publication_list":
-            df = _transform_publication_list(df)
-        elif file_format == "research_project":
-            df = _transform_research_project(df)
-        elif file_format == "student_roster":
-            df = _transform_student_roster(df)
-        else:
-            raise ValidationError("Unknown file format. Please check the file structure.")
-
-        results = _process_rows(df)
+        with profiler.stage("detect_format", rows_in=len(df)) as stage:
+            file_format = _detect_file_format(df)
+            stage["rows_out"] = len(df)
+        run_fields["file_format"] = file_format
+
+        # 변환 형식은 집계 전에 학과명을 정규화하므로 매핑 실패 건수는 원본 행 기준으로 여기서 받는다
+        source_unknowns = {}
+        with profiler.stage("transform", rows_in=len(df)) as stage:
+            if file_format == "standard":
+                _validate_columns(df)
+            elif file_format == "department_kpi":
+                df, source_unknowns["department"] = _transform_korean_format(df)
+            elif file_format == "publication_list":
+                df, source_unknowns["department"] = _transform_publication_list(df)
+            elif file_format == "research_project":
+                df, source_unknowns["department"] = _transform_research_project(df)
+            elif file_format == "student_roster":
+                df, source_unknowns["department"] = _transform_student_roster(df)
+            else:
+                raise ValidationError("Unknown file format. Please check the file structure.")
+            stage["rows_out"] = len(df)
+
+        batch = UploadBatch(
+            filename=file_obj.name[:255],
+            file_format=file_format,
+            uploaded_by=uploaded_by,
+        )
+        results = _process_rows(df, batch, profiler, source_unknowns)
 
         total_rows = len(df)
         success_count = results["success_count"]
-        failure_count = results["failure_count"]
-        failure_rate = (failure_count / total_rows * 100) if total_rows > 0 else 0
-
-        if failure_rate >= FAILURE_THRESHOLD_PERCENTAGE:
-            raise ValidationError(
-                f"Failure rate is {failure_rate:.1f}%. Please review the file."
-            )
+        failure_count = failed_rows = results["failure_count"]
 
         summary_message = _generate_summary_message(total_rows, success_count, failure_count)
 
+        run_fields.update(status=IngestRun.STATUS_SUCCESS, batch=batch, rows_out=success_count)
         return success_count, failure_count, summary_message
 
-    except ValidationError:
+    except ValidationError as e:
+        run_fields.update(status=IngestRun.STATUS_REJECTED, error_message="; ".join(e.messages))
         raise
     except Exception as e:
+        run_fields["error_message"] = str(e)
         raise ValidationError(f"Error processing file: {str(e)}")
+    finally:
+        _record_run(profiler, run_fields, failed_rows)
+
+
+def _record_run(profiler: IngestProfiler, run_fields: Dict[str, Any], failed_rows: int) -> None:
+    """
+    Save the IngestRun and count it in the ingest metrics.
+
+    Instrumentation must never change the outcome of an upload, so any error
+    here is logged and swallowed instead of replacing the upload's result or
+    its ValidationError. The save runs in its own savepoint so a failed
+    insert does not break an enclosing transaction.
+
+    Args:
+        profiler: IngestProfiler of the run
+        run_fields: IngestRun fields collected by parse_and_save_excel
+        failed_rows: Number of rows that failed normalization
+    """
+    try:
+        with transaction.atomic():
+            run = profiler.save(**run_fields)
+        succeeded = run.status == IngestRun.STATUS_SUCCESS
+        metrics.record_ingest(
+            status=run.status,
+            saved=(run.rows_out or 0) if succeeded else 0,
+            failed=failed_rows,
+            rejected=0 if succeeded else (run.rows_in or 0),
+            seconds=run.total_ms / 1000,
+        )
+    except Exception:
+        profiler.stop()
+        logger.exception("Could not record ingest run of %s", run_fields.get("filename"))
 
 
 def _validate_columns(df: "pd.DataFrame") -> None:
@@ -165,109 +248,504 @@ def _validate_columns(df: "pd.DataFrame") -> None:
         )
 
 
-def _process_rows(df: "pd.DataFrame") -> Dict[str, int]:
+def _process_rows(
+    df: "pd.DataFrame",
+    batch: UploadBatch,
+    profiler: IngestProfiler,
+    source_unknowns: Optional[Dict[str, Dict[str, int]]] = None,
+) -> Dict[str, Any]:
     """
-    Process each row: normalize, validate, and upsert to database.
+    Normalize every row, then upsert the valid ones as a single batch.
+
+    The failure threshold is checked before anything is written, so a
+    rejected file leaves the database (and the batch log) untouched.
 
     Args:
         df: pandas DataFrame with validated columns
+        batch: Unsaved UploadBatch describing this run
+        profiler: IngestProfiler measuring the normalize and write stages
+        source_unknowns: Unknown values counted by a format transform over
+            the source rows, keyed like unknown_values; they replace the
+            counts over the aggregated rows
 
     Returns:
-        dict: {"success_count": int, "failure_count": int}
-    """
-    import pandas as pd  # Lazy import
-
-    success_count = 0
-    failure_count = 0
-    failures = []
+        dict: {"success_count": int, "failure_count": int, "failures": list,
+               "unknown_values": dict}
 
+    Raises:
+        ValidationError: If the failure rate reaches FAILURE_THRESHOLD_PERCENTAGE
+    """
     df.columns = df.columns.str.lower()
 
-    with transaction.atomic():
-        for row_num, row in df.iterrows():
-            try:
-                normalized_row = _normalize_row(row)
-                _upsert_metric_record(normalized_row)
-                success_count += 1
-            except Exception as e:
-                failure_count += 1
-                failures.append(f"Row {row_num + 2}: {str(e)}")
+    with profiler.stage("normalize", rows_in=len(df)) as stage:
+        normalized_rows, failures, unknown_values = _normalize_frame(df)
+        stage["rows_out"] = len(normalized_rows)
+    for column, values in (source_unknowns or {}).items():
+        if values:
+            unknown_values[column] = values
+        else:
+            unknown_values.pop(column, None)
 
     if failures:
         print("\n[Excel Upload Failures]")
         for failure_msg in failures:
             print(f"  {failure_msg}")
 
-    return {"success_count": success_count, "failure_count": failure_count, "failures": failures}
+    for column, values in unknown_values.items():
+        for value, count in values.items():
+            logger.warning("Upload %s: %s '%s' is not in the alias table (%d rows)", batch.filename, column, value, count)
 
+    total_rows = len(df)
+    failure_count = len(failures)
+    failure_rate = (failure_count / total_rows * 100) if total_rows > 0 else 0
 
-def _normalize_row(row: "pd.Series") -> Dict[str, Any]:
+    if failure_rate >= FAILURE_THRESHOLD_PERCENTAGE:
+        raise ValidationError(
+            f"Failure rate is {failure_rate:.1f}%. Please review the file."
+        )
+
+    with profiler.stage("write", rows_in=len(normalized_rows)) as stage:
+        with transaction.atomic():
+            lock_data_writes()
+            batch.save()
+            dated_keys = {
+                (row["year"], row["department"], row["metric_type"]) for row in normalized_rows if row["month"]
+            }
+            _delete_missing_months(normalized_rows, dated_keys, batch)
+            _write_records(normalized_rows, batch)
+            refresh_yearly_rollups(dated_keys, batch)
+            keys = {(row["year"], row["department"], row["metric_type"]) for row in normalized_rows}
+            refresh_facets(keys)
+            metric_records_changed.send(sender=MetricRecord, keys=keys)
+            bump_data_version()
+        stage["rows_out"] = batch.inserted_count + batch.updated_count
+
+    return {
+        "success_count": len(normalized_rows),
+        "failure_count": failure_count,
+        "failures": failures,
+        "unknown_values": unknown_values,
+    }
+
+
+def _normalize_frame(df: "pd.DataFrame") -> Tuple[List[Dict[str, Any]], List[str], Dict[str, Dict[str, int]]]:
     """
-    Normalize row data: clean strings, cast types, apply domain mappings.
+    Normalize all rows at once: clean strings, cast types, apply domain mappings.
+
+    Department and metric names are resolved once per unique value (see
+    _normalize_column); year and value are validated column-wise. A row
+    without a month fails when the file also has monthly rows for its
+    (year, department, metric_type): that yearly value is the rollup of the
+    months.
 
     Args:
-        row: pandas Series representing a single row
+        df: pandas DataFrame with lower-cased standard columns
 
     Returns:
-        dict: Normalized row data
+        Tuple of (normalized_rows, failures, unknown_values) where failures
+        holds one "Row N: reason" message per invalid row and unknown_values
+        maps column name to {unmapped value: row count}
+    """
+    import numpy as np  # Lazy import
+    import pandas as pd  # Lazy import
 
-    Raises:
-        ValueError: If required field is invalid
+    empty = pd.Series([None] * len(df), index=df.index, dtype=object)
+    year_raw = df["year"] if "year" in df else empty
+    department_raw = df["department"] if "department" in df else empty
+    metric_type_raw = df["metric_type"] if "metric_type" in df else empty
+    value_raw = df["value"] if "value" in df else empty
+    month_raw = df["month"] if "month" in df else empty
+
+    year_num = pd.to_numeric(year_raw, errors="coerce")
+    year_ok = (year_num >= 1900) & (year_num <= 2100)
+
+    # month는 선택 항목: 비어 있으면 연간 값, 있으면 1~12
+    month_num = pd.to_numeric(month_raw, errors="coerce")
+    month_ok = month_raw.isna() | ((month_num >= 1) & (month_num <= 12))
+
+    departments, unknown_departments = _normalize_column(department_raw, DEPARTMENT_ALIASES)
+    metric_types, unknown_metrics = _normalize_column(metric_type_raw, METRIC_ALIASES)
+    department_ok = departments != ""
+    metric_type_ok = metric_types != ""
+
+    value_num = pd.to_numeric(value_raw, errors="coerce")
+    value_ok = np.isfinite(value_num.to_numpy(dtype=float, na_value=np.nan))
+
+    valid = year_ok.to_numpy() & month_ok.to_numpy() & department_ok & metric_type_ok & value_ok
+
+    # 같은 (year, department, metric_type)에 월별 행이 있으면 연간 값은 월 합계(롤업)이므로 빈 month 행은 실패 처리
+    has_month = month_num.notna().to_numpy()
+    keys = pd.MultiIndex.from_arrays([year_num.to_numpy(), departments, metric_types])
+    conflicting = valid & ~has_month & keys.isin(keys[valid & has_month])
+    valid &= ~conflicting
+
+    failures = []
+    for position in np.flatnonzero(~valid):
+        if not year_ok.iat[position]:
+            reason = f"Year conversion failed: {year_raw.iat[position]}"
+        elif not month_ok.iat[position]:
+            reason = f"Invalid month: {month_raw.iat[position]}"
+        elif not department_ok[position]:
+            reason = "Department is required"
+        elif not metric_type_ok[position]:
+            reason = "Metric type is required"
+        elif pd.isna(value_raw.iat[position]):
+            reason = "Metric value is required"
+        elif not value_ok[position]:
+            reason = f"Value conversion failed: {value_raw.iat[position]}"
+        else:
+            reason = "Yearly value conflicts with monthly rows of the same year, department and metric"
+        failures.append(f"Row {df.index[position] + 2}: {reason}")
+
+    normalized_rows = [
+        {
+            "year": year,
+            "month": None if month != month else int(month),
+            "department": department,
+            "metric_type": metric_type,
+            "metric_value": Decimal(str(value)),
+        }
+        for year, month, department, metric_type, value in zip(
+            year_num[valid].astype(int).tolist(),
+            month_num[valid].tolist(),
+            departments[valid].tolist(),
+            metric_types[valid].tolist(),
+            value_raw[valid].tolist(),
+        )
+    ]
+
+    unknown_values = {}
+    if unknown_departments:
+        unknown_values["department"] = unknown_departments
+    if unknown_metrics:
+        unknown_values["metric_type"] = unknown_metrics
+
+    return normalized_rows, failures, unknown_values
+
+
+def _normalize_column(column: "pd.Series", aliases: Dict[str, str]) -> Tuple["np.ndarray", Dict[str, int]]:
     """
-    year_raw = row.get("year")
-    department_raw = row.get("department")
-    metric_type_raw = row.get("metric_type")
-    value_raw = row.get("value")
+    Map a column of raw names to canonical names, resolving each unique value once.
 
-    try:
-        year = int(year_raw) if pd.notna(year_raw) else None
-        if year is None or year < 1900 or year > 2100:
-            raise ValueError(f"Invalid year: {year_raw}")
-    except (ValueError, TypeError) as e:
-        raise ValueError(f"Year conversion failed: {year_raw}")
-
-    department_str = (str(department_raw) if pd.notna(department_raw) else "").strip()
-    if not department_str:
-        raise ValueError("Department is required")
-    department = ALLOWED_DEPARTMENTS.get(department_str, department_str)
-
-    metric_type_str = (str(metric_type_raw) if pd.notna(metric_type_raw) else "").strip()
-    if not metric_type_str:
-        raise ValueError("Metric type is required")
-    metric_type = ALLOWED_METRICS.get(metric_type_str, metric_type_str)
+    The column is factorized to its unique values, every unique value is looked
+    up in the alias table, and the result is broadcast back to the rows by
+    code. Values missing from the table are kept as stripped text.
 
-    try:
-        metric_value = Decimal(str(value_raw)) if pd.notna(value_raw) else None
-        if metric_value is None:
-            raise ValueError("Metric value is required")
-    except Exception as e:
-        raise ValueError(f"Value conversion failed: {value_raw}")
+    Args:
+        column: Raw department or metric_type column
+        aliases: Table from _alias_key(alias) to canonical name
 
-    return {
-        "year": year,
-        "department": department,
-        "metric_type": metric_type,
-        "metric_value": metric_value,
+    Returns:
+        Tuple of (object array of canonical names, "" for blank cells,
+        {unknown value: row count})
+    """
+    import numpy as np  # Lazy import
+    import pandas as pd  # Lazy import
+
+    codes, uniques = pd.factorize(column, use_na_sentinel=True)
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+    resolved = []
+    unknown = {}
+    for value, count in zip(uniques, counts):
+        text = str(value).strip()
+        canonical = aliases.get(_alias_key(text))
+        if canonical is None:
+            canonical = text
+            if text:
+                unknown[text] = unknown.get(text, 0) + int(count)
+        resolved.append(canonical)
+
+    # The trailing "" is picked up by the -1 (missing value) code
+    lookup = np.array(resolved + [""], dtype=object)
+    return lookup[codes], unknown
+
+
+def _record_key(row: Any) -> Tuple[int, Optional[int], str, str]:
+    """Natural key of a MetricRecord (or normalized row dict): (year, month, department, metric_type)."""
+    if isinstance(row, dict):
+        return row["year"], row.get("month"), row["department"], row["metric_type"]
+    return row.year, row.month, row.department, row.metric_type
+
+
+def _write_records(normalized_rows: List[Dict[str, Any]], batch: Optional[UploadBatch]) -> None:
+    """
+    Upsert normalized rows with bulk statements and log them against the batch.
+
+    Rows are keyed by (year, month, department, metric_type); when a key
+    repeats the last row wins, as it did with per-row update_or_create. Rows
+    whose value is unchanged are not rewritten and are not logged. The value
+    changes of yearly rows are applied to the rollup tables as deltas.
+
+    Args:
+        normalized_rows: Output of _normalize_frame for every valid row
+        batch: Saved UploadBatch the changes belong to, or None to skip logging
+    """
+    rows_by_key = {_record_key(row): row for row in normalized_rows}
+    if not rows_by_key:
+        return
+
+    existing = {
+        _record_key(record): record
+        for record in MetricRecord.objects.filter(
+            year__in={key[0] for key in rows_by_key},
+            department__in={key[2] for key in rows_by_key},
+            metric_type__in={key[3] for key in rows_by_key},
+        ).only("id", "year", "month", "department", "metric_type", "metric_value")
     }
 
+    now = timezone.now()
+    to_insert = []
+    to_update = []
+    changes = []
+
+    for key, row in rows_by_key.items():
+        record = existing.get(key)
+        if record is None:
+            to_insert.append(MetricRecord(**row))
+        elif record.metric_value != row["metric_value"]:
+            changes.append(UploadBatchChange(batch=batch, record_id=record.pk, previous_value=record.metric_value))
+            record.metric_value = row["metric_value"]
+            record.updated_at = now
+            to_update.append(record)
+
+    MetricRecord.objects.bulk_update(to_update, ["metric_value", "updated_at"], batch_size=WRITE_BATCH_SIZE)
+    MetricRecord.objects.bulk_create(to_insert, batch_size=WRITE_BATCH_SIZE)
+
+    previous_values = {change.record_id: change.previous_value for change in changes}
+    apply_rollup_deltas(
+        [
+            (record.year, record.department, record.metric_type, previous_values[record.pk],
+             record.metric_value)
+            for record in to_update
+            if record.month is None
+        ]
+        + [
+            (record.year, record.department, record.metric_type, None, record.metric_value)
+            for record in to_insert
+            if record.month is None
+        ]
+    )
+
+    if batch is None:
+        return
+
+    changes.extend(UploadBatchChange(batch=batch, record_id=record.pk) for record in to_insert)
+    UploadBatchChange.objects.bulk_create(changes, batch_size=WRITE_BATCH_SIZE)
+
+    batch.inserted_count += len(to_insert)
+    batch.updated_count += len(to_update)
+    batch.save(update_fields=["inserted_count", "updated_count"])
 
-@transaction.atomic
-def _upsert_metric_record(normalized_row: Dict[str, Any]) -> None:
+
+def _delete_missing_months(
+    normalized_rows: List[Dict[str, Any]], dated_keys: Iterable[Tuple[int, str, str]], batch: UploadBatch
+) -> None:
     """
-    Insert or update a single metric record in the database.
+    Delete the monthly rows of the uploaded keys that the file no longer contains.
+
+    A dated file replaces the months of every (year, department, metric_type)
+    it covers, as a re-upload replaced the yearly value before months were
+    stored; a corrected date must not leave its old month behind in the
+    rollup. The deleted rows are logged against the batch with their key and
+    value so rollback_batch can insert them again.
 
     Args:
-        normalized_row: Normalized row dict
+        normalized_rows: Output of _normalize_frame for every valid row
+        dated_keys: (year, department, metric_type) keys with monthly rows in the file
+        batch: Saved UploadBatch the deletions belong to
+    """
+    dated_keys = set(dated_keys)
+    if not dated_keys:
+        return
+
+    uploaded = {_record_key(row) for row in normalized_rows if row["month"]}
+    stale = [
+        record
+        for record in MetricRecord.objects.filter(
+            month__isnull=False,
+            year__in={key[0] for key in dated_keys},
+            department__in={key[1] for key in dated_keys},
+            metric_type__in={key[2] for key in dated_keys},
+        ).only("id", "year", "month", "department", "metric_type", "metric_value")
+        if (record.year, record.department, record.metric_type) in dated_keys
+        and _record_key(record) not in uploaded
+    ]
+    if not stale:
+        return
+
+    UploadBatchChange.objects.bulk_create(
+        [
+            UploadBatchChange(
+                batch=batch,
+                record_id=record.pk,
+                previous_value=record.metric_value,
+                deleted=True,
+                year=record.year,
+                month=record.month,
+                department=record.department,
+                metric_type=record.metric_type,
+            )
+            for record in stale
+        ],
+        batch_size=WRITE_BATCH_SIZE,
+    )
+    MetricRecord.objects.filter(pk__in=[record.pk for record in stale]).delete()
 
-    Raises:
-        Exception: If database operation fails
+
+def refresh_yearly_rollups(keys: Iterable[Tuple[int, str, str]], batch: Optional[UploadBatch] = None) -> None:
     """
-    MetricRecord.objects.update_or_create(
-        year=normalized_row["year"],
-        department=normalized_row["department"],
-        metric_type=normalized_row["metric_type"],
-        defaults={"metric_value": normalized_row["metric_value"]},
+    Recompute yearly rows (month=NULL) from their monthly rows.
+
+    For every (year, department, metric_type) key the yearly value becomes
+    the SUM of its monthly rows, so year-level dashboard queries never have
+    to aggregate months. A key with no monthly rows left loses its yearly
+    rollup as well.
+
+    Args:
+        keys: (year, department, metric_type) keys whose months changed
+        batch: UploadBatch to log the rollup writes against, or None to skip logging
+    """
+    keys = set(keys)
+    if not keys:
+        return
+
+    totals = (
+        MetricRecord.objects.filter(
+            month__isnull=False,
+            year__in={key[0] for key in keys},
+            department__in={key[1] for key in keys},
+            metric_type__in={key[2] for key in keys},
+        )
+        .values("year", "department", "metric_type")
+        .annotate(total=Sum("metric_value"))
     )
+    rollup_rows = [
+        {
+            "year": total["year"],
+            "department": total["department"],
+            "metric_type": total["metric_type"],
+            "metric_value": total["total"],
+        }
+        for total in totals
+        if (total["year"], total["department"], total["metric_type"]) in keys
+    ]
+    _write_records(rollup_rows, batch)
+
+    emptied = keys - {(row["year"], row["department"], row["metric_type"]) for row in rollup_rows}
+    deltas = []
+    for year, department, metric_type in emptied:
+        yearly = MetricRecord.objects.filter(
+            year=year, month__isnull=True, department=department, metric_type=metric_type
+        )
+        deltas.extend(
+            (year, department, metric_type, value, None)
+            for value in yearly.values_list("metric_value", flat=True)
+        )
+        yearly.delete()
+    apply_rollup_deltas(deltas)
+
+
+def rollback_batch(batch: UploadBatch) -> Tuple[int, int]:
+    """
+    Undo an upload batch: delete the rows it inserted, restore the
+    previous values of the rows it updated and insert again the monthly
+    rows it deleted.
+
+    The cost is a handful of set-based statements regardless of batch size.
+    A batch can only be rolled back while no later, still-active batch has
+    written the same rows, otherwise the later upload would be silently lost.
+    Admin edits are logged as batches too (ADMIN_EDIT_FORMAT), so a row
+    corrected in the admin after the upload also blocks the rollback; those
+    batches cannot be rolled back themselves.
+
+    Args:
+        batch: UploadBatch to undo
+
+    Returns:
+        Tuple[int, int]: (deleted_count, restored_count)
+
+    Raises:
+        ValidationError: If the batch was already rolled back, is an admin
+            edit or is superseded
+    """
+    with transaction.atomic():
+        lock_data_writes()
+        batch = UploadBatch.objects.select_for_update().get(pk=batch.pk)
+        if batch.is_rolled_back:
+            raise ValidationError(f"Upload #{batch.pk} has already been rolled back.")
+        if batch.file_format == ADMIN_EDIT_FORMAT:
+            raise ValidationError(f"#{batch.pk} is an admin edit. Correct the rows in the admin instead.")
+
+        changes = UploadBatchChange.objects.filter(batch=batch)
+
+        later_formats = set(
+            UploadBatchChange.objects.filter(
+                batch__id__gt=batch.pk,
+                batch__rolled_back_at__isnull=True,
+                record_id__in=changes.values("record_id"),
+            ).values_list("batch__file_format", flat=True).distinct()
+        )
+        if ADMIN_EDIT_FORMAT in later_formats:
+            raise ValidationError(
+                f"Upload #{batch.pk} has rows that were corrected in the admin afterwards. Fix them by hand instead."
+            )
+        superseded = bool(later_formats)
+        # Deleted rows are superseded when a later upload wrote their key again
+        deleted_rows = [
+            MetricRecord(
+                year=change.year,
+                month=change.month,
+                department=change.department,
+                metric_type=change.metric_type,
+                metric_value=change.previous_value,
+            )
+            for change in changes.filter(deleted=True)
+        ]
+        if deleted_rows and not superseded:
+            superseded = MetricRecord.objects.filter(
+                reduce(
+                    operator.or_,
+                    (
+                        Q(year=row.year, month=row.month, department=row.department, metric_type=row.metric_type)
+                        for row in deleted_rows
+                    ),
+                )
+            ).exists()
+        if superseded:
+            raise ValidationError(
+                f"Upload #{batch.pk} was overwritten by a later upload. Roll that one back first."
+            )
+
+        # Yearly rows of the batch with their current and restored values (rollup deltas).
+        # Monthly changes always come with a logged change of their yearly rollup row.
+        previous_value = changes.filter(record_id=OuterRef("pk")).values("previous_value")[:1]
+        deltas = list(
+            MetricRecord.objects.filter(pk__in=changes.values("record_id"), month__isnull=True)
+            .annotate(previous=Subquery(previous_value))
+            .values_list("year", "department", "metric_type", "metric_value", "previous")
+        )
+        touched_keys = {delta[:3] for delta in deltas}
+
+        restored_count = MetricRecord.objects.filter(
+            pk__in=changes.filter(previous_value__isnull=False, deleted=False).values("record_id")
+        ).update(metric_value=Subquery(previous_value), updated_at=timezone.now())
+
+        deleted_count, _ = MetricRecord.objects.filter(
+            pk__in=changes.filter(previous_value__isnull=True).values("record_id")
+        ).delete()
+
+        MetricRecord.objects.bulk_create(deleted_rows, batch_size=WRITE_BATCH_SIZE)
+        restored_count += len(deleted_rows)
+
+        batch.rolled_back_at = timezone.now()
+        batch.save(update_fields=["rolled_back_at"])
+        apply_rollup_deltas(deltas)
+        refresh_facets(touched_keys)
+        metric_records_changed.send(sender=MetricRecord, keys=touched_keys)
+        bump_data_version()
+
+    return deleted_count, restored_count
 
 
 def _generate_summary_message(total_rows: int, success_count: int, failure_count: int) -> str:
@@ -337,7 +815,7 @@ def _is_korean_format(df: "pd.DataFrame") -> bool:
     return file_format != "standard"
 
 
-def _transform_korean_format(df: "pd.DataFrame") -> "pd.DataFrame":
+def _transform_korean_format(df: "pd.DataFrame") -> Tuple["pd.DataFrame", Dict[str, int]]:
     """
     한글 형식 DataFrame을 표준 형식으로 변환 (department_kpi.csv)
 
@@ -351,7 +829,7 @@ def _transform_korean_format(df: "pd.DataFrame") -> "pd.DataFrame":
         df: 한글 형식 DataFrame
 
     Returns:
-        "pd.DataFrame": 표준 형식으로 변환된 DataFrame (Melt 형태)
+        Tuple of (표준 형식으로 변환된 DataFrame (Melt 형태), 매핑되지 않은 학과명별 원본 행 수)
     """
     # 컬럼 이름 매핑
     column_rename = {
@@ -362,6 +840,9 @@ def _transform_korean_format(df: "pd.DataFrame") -> "pd.DataFrame":
 
     df_renamed = df.rename(columns=column_rename)
 
+    # 부서명 정규화 (한글 → 영문): melt 전에 해야 매핑 실패 건수가 원본 행 기준이 됨
+    df_renamed["department"], unknown_departments = _normalize_column(df_renamed["department"], DEPARTMENT_ALIASES)
+
     # 지표 컬럼들 (한글 → metric_type)
     metric_columns = list(KOREAN_COLUMN_MAPPING.keys())
 
@@ -379,86 +860,93 @@ def _transform_korean_format(df: "pd.DataFrame") -> "pd.DataFrame":
     # 한글 컬럼명 → metric_type 변환
     df_melted["metric_type"] = df_melted["metric_column"].map(KOREAN_COLUMN_MAPPING)
 
-    # 부서명 정규화 (한글 → 영문)
-    df_melted["department"] = df_melted["department"].map(
-        lambda x: ALLOWED_DEPARTMENTS.get(x, x)
-    )
-
     # 최종 컬럼 선택
     df_result = df_melted[["year", "department", "metric_type", "value"]].copy()
 
     # year를 정수로 변환
     df_result["year"] = df_result["year"].astype(int)
 
-    return df_result
+    return df_result, unknown_departments
 
 
-def _transform_publication_list(df: "pd.DataFrame") -> "pd.DataFrame":
+def _transform_publication_list(df: "pd.DataFrame") -> Tuple["pd.DataFrame", Dict[str, int]]:
     """
     publication_list.csv를 표준 형식으로 변환
 
     입력: 논문ID, 게재일, 단과대학, 학과, 논문제목, ...
-    출력: year, department, metric_type, value (각 학과별 논문 수)
+    출력: year, month, department, metric_type, value (학과별 월간 논문 수)
+
+    월 단위 행으로 저장되고, 연간 값은 refresh_yearly_rollups()가 합계로 유지한다.
 
     Args:
         df: 논문 목록 DataFrame
 
     Returns:
-        "pd.DataFrame": 표준 형식으로 변환된 DataFrame
+        Tuple of (표준 형식으로 변환된 DataFrame, 매핑되지 않은 학과명별 원본 행 수)
     """
-    # 게재일에서 연도 추출
-    df["year"] = pd.to_datetime(df["게재일"], errors="coerce").dt.year.astype(int)
+    import pandas as pd  # Lazy import
+
+    # 게재일에서 연도/월 추출
+    published = pd.to_datetime(df["게재일"], errors="coerce")
+    df["year"] = published.dt.year.astype(int)
+    df["month"] = published.dt.month.astype(int)
 
     # 부서명 정규화
-    df["department"] = df["학과"].map(lambda x: ALLOWED_DEPARTMENTS.get(x, x))
+    df["department"], unknown_departments = _normalize_column(df["학과"], DEPARTMENT_ALIASES)
 
-    # 학과별, 연도별 논문 수 집계
-    df_grouped = df.groupby(["year", "department"]).size().reset_index(name="value")
+    # 학과별, 월별 논문 수 집계
+    df_grouped = df.groupby(["year", "month", "department"]).size().reset_index(name="value")
 
     # metric_type 추가
     df_grouped["metric_type"] = "PUBLICATION"
 
     # 최종 컬럼 선택
-    df_result = df_grouped[["year", "department", "metric_type", "value"]].copy()
+    df_result = df_grouped[["year", "month", "department", "metric_type", "value"]].copy()
 
-    return df_result
+    return df_result, unknown_departments
 
 
-def _transform_research_project(df: "pd.DataFrame") -> "pd.DataFrame":
+def _transform_research_project(df: "pd.DataFrame") -> Tuple["pd.DataFrame", Dict[str, int]]:
     """
     research_project_data.csv를 표준 형식으로 변환
 
     입력: 집행ID, 과제번호, 과제명, 연구책임자, 소속학과, 집행일자, 집행금액, ...
-    출력: year, department, metric_type, value (연도별 연구비)
+    출력: year, month, department, metric_type, value (월별 연구비 집행액)
+
+    월 단위 행으로 저장되고, 연간 값은 refresh_yearly_rollups()가 합계로 유지한다.
 
     Args:
         df: 연구 과제 DataFrame
 
     Returns:
-        "pd.DataFrame": 표준 형식으로 변환된 DataFrame
+        Tuple of (표준 형식으로 변환된 DataFrame, 매핑되지 않은 학과명별 원본 행 수)
     """
-    # 집행일자에서 연도 추출
-    df["year"] = pd.to_datetime(df["집행일자"], errors="coerce").dt.year.astype(int)
+    import pandas as pd  # Lazy import
+
+    # 집행일자에서 연도/월 추출
+    executed = pd.to_datetime(df["집행일자"], errors="coerce")
+    df["year"] = executed.dt.year.astype(int)
+    df["month"] = executed.dt.month.astype(int)
 
     # 부서명 정규화
-    df["department"] = df["소속학과"].map(lambda x: ALLOWED_DEPARTMENTS.get(x, x))
+    df["department"], unknown_departments = _normalize_column(df["소속학과"], DEPARTMENT_ALIASES)
 
     # 집행금액을 숫자로 변환
     df["execution_amount"] = pd.to_numeric(df["집행금액"], errors="coerce")
 
-    # 학과별, 연도별 연구비 합계
-    df_grouped = df.groupby(["year", "department"])["execution_amount"].sum().reset_index(name="value")
+    # 학과별, 월별 연구비 합계
+    df_grouped = df.groupby(["year", "month", "department"])["execution_amount"].sum().reset_index(name="value")
 
     # metric_type 추가
     df_grouped["metric_type"] = "RESEARCH_BUDGET"
 
     # 최종 컬럼 선택
-    df_result = df_grouped[["year", "department", "metric_type", "value"]].copy()
+    df_result = df_grouped[["year", "month", "department", "metric_type", "value"]].copy()
 
-    return df_result
+    return df_result, unknown_departments
 
 
-def _transform_student_roster(df: "pd.DataFrame") -> "pd.DataFrame":
+def _transform_student_roster(df: "pd.DataFrame") -> Tuple["pd.DataFrame", Dict[str, int]]:
     """
     student_roster.csv를 표준 형식으로 변환
 
@@ -469,13 +957,13 @@ def _transform_student_roster(df: "pd.DataFrame") -> "pd.DataFrame":
         df: 학생 명단 DataFrame
 
     Returns:
-        "pd.DataFrame": 표준 형식으로 변환된 DataFrame
+        Tuple of (표준 형식으로 변환된 DataFrame, 매핑되지 않은 학과명별 원본 행 수)
     """
     # 입학년도를 연도로 사용
     df["year"] = df["입학년도"].astype(int)
 
     # 부서명 정규화
-    df["department"] = df["학과"].map(lambda x: ALLOWED_DEPARTMENTS.get(x, x))
+    df["department"], unknown_departments = _normalize_column(df["학과"], DEPARTMENT_ALIASES)
 
     # 학적상태가 '재학'인 학생만 카운트
     df_active = df[df["학적상태"] == "재학"].copy()
@@ -489,4 +977,4 @@ def _transform_student_roster(df: "pd.DataFrame") -> "pd.DataFrame":
     # 최종 컬럼 선택
     df_result = df_grouped[["year", "department", "metric_type", "value"]].copy()
 
-    return df_result
+    return df_result, unknown_departments
@@ -0,0 +1,20 @@
+"""Ingest Signals - Notifications for code that derives data from MetricRecord
+
+metric_records_changed is sent inside the writing transaction by every
+write path (upload, rollback, admin edits) with the (year, department,
+metric_type) keys it touched, so receivers can refresh derived data in the
+same transaction.
+
+Example:
+    from django.dispatch import receiver
+    from apps.ingest.signals import metric_records_changed
+
+    @receiver(metric_records_changed)
+    def on_change(sender, keys, **kwargs):
+        ...
+"""
+
+from django.dispatch import Signal
+
+# Sent with keys: Set[Tuple[int, str, str]] of (year, department, metric_type)
+metric_records_changed = Signal()
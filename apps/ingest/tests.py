@@ -1,3 +1,607 @@
-from django.test import TestCase
+"""Ingest Tests - Upload parsing, persistence and rollback
 
-# Create your tests here.
+Follows the checklist in docs/rules/testing.md.
+
+Test Coverage:
+  - parse_and_save_excel: Insert, UPSERT and failure threshold
+  - _normalize_column: Unique-value alias resolution
+  - refresh_yearly_rollups: Monthly rows and their yearly rollups
+  - rollback_batch: Constant-cost undo of an upload batch
+  - IngestProfiler: Per-stage IngestRun records
+  - refresh_facets: Filter facets kept in step with uploads, rollbacks and admin edits
+  - apply_rollup_deltas: Rollup tables kept in step with every write path
+  - UploadBatchAdmin: "Rollback selected uploads" admin action
+"""
+
+import tracemalloc
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, Client, override_settings
+
+from apps.dashboard.documents import partitions_for
+from apps.ingest.facets import read_facets, refresh_facets
+from apps.ingest.instrumentation import IngestProfiler
+from apps.ingest.models import (
+    DepartmentMetricRollup,
+    IngestRun,
+    MetricFacet,
+    MetricRecord,
+    UploadBatch,
+    UploadBatchChange,
+    YearMetricRollup,
+)
+from apps.ingest.rollups import check_rollups, rebuild_rollups
+from apps.ingest.versioning import lock_data_writes
+from apps.ingest.services import (
+    ADMIN_EDIT_FORMAT,
+    DEPARTMENT_ALIASES,
+    _normalize_column,
+    parse_and_save_excel,
+    rollback_batch,
+)
+
+
+def make_csv(name: str, rows: list) -> SimpleUploadedFile:
+    """Build an uploaded CSV file in the standard (year, department, metric_type, value) format."""
+    lines = ["year,department,metric_type,value"] + [",".join(str(v) for v in row) for row in rows]
+    return SimpleUploadedFile(name, "\n".join(lines).encode("utf-8"), content_type="text/csv")
+
+
+class ParseAndSaveExcelTests(TestCase):
+    """Test parse_and_save_excel - persistence and batch logging."""
+
+    def test_valid_upload_creates_batch(self):
+        """TC-01: Valid rows are saved and logged as inserts."""
+        success, failure, _ = parse_and_save_excel(
+            make_csv("valid.csv", [(2025, "computer-science", "PAPER", 20), (2025, "computer-science", "BUDGET", 70000)])
+        )
+
+        self.assertEqual((success, failure), (2, 0))
+        batch = UploadBatch.objects.get()
+        self.assertEqual(batch.inserted_count, 2)
+        self.assertEqual(batch.updated_count, 0)
+        self.assertEqual(batch.changes.filter(previous_value__isnull=True).count(), 2)
+
+    def test_upsert_logs_previous_value(self):
+        """TC-02: Re-uploading a key updates it and records the old value."""
+        parse_and_save_excel(make_csv("first.csv", [(2025, "computer-science", "PAPER", 20)]))
+        parse_and_save_excel(make_csv("second.csv", [(2025, "computer-science", "PAPER", 25)]))
+
+        record = MetricRecord.objects.get()
+        self.assertEqual(record.metric_value, Decimal("25"))
+        change = UploadBatchChange.objects.get(batch__filename="second.csv")
+        self.assertEqual(change.record_id, record.pk)
+        self.assertEqual(change.previous_value, Decimal("20"))
+
+    def test_unchanged_rows_are_not_logged(self):
+        """Uploading identical values writes nothing new."""
+        parse_and_save_excel(make_csv("first.csv", [(2025, "computer-science", "PAPER", 20)]))
+        parse_and_save_excel(make_csv("again.csv", [(2025, "computer-science", "PAPER", 20)]))
+
+        self.assertFalse(UploadBatchChange.objects.filter(batch__filename="again.csv").exists())
+
+    def test_rejected_upload_writes_nothing(self):
+        """TC-05: A file over the failure threshold leaves no rows and no batch."""
+        with self.assertRaises(ValidationError) as ctx:
+            parse_and_save_excel(
+                make_csv("partial.csv", [(2025, "computer-science", "PAPER", 30), (2025, "computer-science", "BUDGET", "invalid")])
+            )
+
+        self.assertIn("50.0%", str(ctx.exception))
+        self.assertFalse(MetricRecord.objects.exists())
+        self.assertFalse(UploadBatch.objects.exists())
+
+
+class NormalizationTests(TestCase):
+    """Test department/metric normalization - TC-07/08."""
+
+    def test_case_variants_collapse_to_one_department(self):
+        """sample/test-dept-norm.csv: COMPUTER-SCIENCE, Computer-Science → computer-science"""
+        with open(settings.BASE_DIR / "sample" / "test-dept-norm.csv", "rb") as f:
+            upload = SimpleUploadedFile("test-dept-norm.csv", f.read())
+        success, failure, _ = parse_and_save_excel(upload)
+
+        self.assertEqual((success, failure), (3, 0))
+        self.assertEqual(
+            list(MetricRecord.objects.values_list("department", flat=True).distinct()),
+            ["computer-science"],
+        )
+
+    def test_alias_matching_ignores_case_whitespace_and_hyphens(self):
+        import pandas as pd
+
+        column = pd.Series(["Computer Science", " computer_science ", "컴퓨터공학과", "ELECTRONICS", None])
+        resolved, unknown = _normalize_column(column, DEPARTMENT_ALIASES)
+
+        self.assertEqual(
+            resolved.tolist(),
+            ["computer-science", "computer-science", "computer-science", "electronics", ""],
+        )
+        self.assertEqual(unknown, {})
+
+    def test_unknown_values_reported_once_per_value(self):
+        import pandas as pd
+
+        column = pd.Series(["경영학과"] * 1000 + ["philosophy"])
+        resolved, unknown = _normalize_column(column, DEPARTMENT_ALIASES)
+
+        self.assertEqual(unknown, {"경영학과": 1000})
+        self.assertEqual(resolved[0], "경영학과")
+
+    def test_unknown_values_logged_once_per_value(self):
+        rows = [(2025, "경영학과", "PAPER", 1), (2024, "경영학과", "PAPER", 2), (2025, "education", "PAPER", 3)]
+        with self.assertLogs("apps.ingest.services", level="WARNING") as logs:
+            parse_and_save_excel(make_csv("unknown.csv", rows))
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("department '경영학과' is not in the alias table (2 rows)", logs.output[0])
+
+    def test_transformed_upload_reports_unknown_values_per_source_row(self):
+        """Counts come from the source rows, not from the per-month aggregates."""
+        rows = [("P1", "2024-01-10", "경영학과"), ("P2", "2024-01-20", "경영학과"), ("P3", "2024-03-05", "경영학과")]
+        with self.assertLogs("apps.ingest.services", level="WARNING") as logs:
+            parse_and_save_excel(make_publication_csv("pubs.csv", rows))
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("department '경영학과' is not in the alias table (3 rows)", logs.output[0])
+
+    def test_metric_aliases_normalized(self):
+        parse_and_save_excel(make_csv("metrics.csv", [(2025, "education", "Employment Rate", 80)]))
+        self.assertEqual(MetricRecord.objects.get().metric_type, "EMPLOYMENT_RATE")
+
+
+def make_publication_csv(name: str, rows: list) -> SimpleUploadedFile:
+    """Build a publication_list upload from (논문ID, 게재일, 학과) tuples."""
+    lines = ["논문ID,게재일,단과대학,학과,논문제목"] + [f"{pid},{date},공과대학,{dept},Title" for pid, date, dept in rows]
+    return SimpleUploadedFile(name, "\n".join(lines).encode("utf-8"), content_type="text/csv")
+
+
+class MonthlyRollupTests(TestCase):
+    """Test monthly rows for dated sources and their yearly rollups."""
+
+    def setUp(self):
+        parse_and_save_excel(
+            make_publication_csv(
+                "pubs.csv",
+                [
+                    ("P1", "2024-01-10", "컴퓨터공학과"),
+                    ("P2", "2024-01-20", "컴퓨터공학과"),
+                    ("P3", "2024-03-05", "컴퓨터공학과"),
+                ],
+            )
+        )
+
+    def test_dated_upload_stores_months_and_yearly_rollup(self):
+        monthly = MetricRecord.objects.filter(month__isnull=False).order_by("month")
+        self.assertEqual([(r.month, r.metric_value) for r in monthly], [(1, Decimal("2")), (3, Decimal("1"))])
+
+        yearly = MetricRecord.objects.get(month__isnull=True)
+        self.assertEqual(yearly.metric_type, "PUBLICATION")
+        self.assertEqual(yearly.metric_value, Decimal("3"))
+
+    def test_reupload_replaces_the_months_of_its_keys(self):
+        """A dated file replaces the months of each (year, department, metric_type) it covers."""
+        parse_and_save_excel(
+            make_publication_csv(
+                "more.csv", [("P4", "2024-06-01", "컴퓨터공학과"), ("P5", "2024-02-01", "전자공학과")]
+            )
+        )
+
+        cs_months = MetricRecord.objects.filter(department="computer-science", month__isnull=False)
+        self.assertEqual(list(cs_months.values_list("month", flat=True)), [6])
+        self.assertEqual(
+            MetricRecord.objects.get(department="computer-science", month__isnull=True).metric_value, Decimal("1")
+        )
+        self.assertEqual(
+            MetricRecord.objects.get(department="electronics", month__isnull=True).metric_value, Decimal("1")
+        )
+
+    def test_corrected_date_moves_the_row_to_its_month(self):
+        """Re-uploading with a corrected date leaves no stale month in the yearly rollup."""
+        parse_and_save_excel(
+            make_publication_csv(
+                "fixed.csv",
+                [
+                    ("P1", "2024-01-10", "컴퓨터공학과"),
+                    ("P2", "2024-01-20", "컴퓨터공학과"),
+                    ("P3", "2024-01-25", "컴퓨터공학과"),
+                ],
+            )
+        )
+
+        monthly = MetricRecord.objects.filter(month__isnull=False)
+        self.assertEqual([(r.month, r.metric_value) for r in monthly], [(1, Decimal("3"))])
+        self.assertEqual(MetricRecord.objects.get(month__isnull=True).metric_value, Decimal("3"))
+        change = UploadBatchChange.objects.get(batch__filename="fixed.csv", deleted=True)
+        self.assertEqual((change.year, change.month, change.previous_value), (2024, 3, Decimal("1")))
+
+    def test_rollback_restores_months_and_rollup(self):
+        parse_and_save_excel(make_publication_csv("more.csv", [("P4", "2024-06-01", "컴퓨터공학과")]))
+        rollback_batch(UploadBatch.objects.get(filename="more.csv"))
+
+        monthly = MetricRecord.objects.filter(month__isnull=False).order_by("month")
+        self.assertEqual([(r.month, r.metric_value) for r in monthly], [(1, Decimal("2")), (3, Decimal("1"))])
+        self.assertEqual(MetricRecord.objects.get(month__isnull=True).metric_value, Decimal("3"))
+
+    def test_rollback_of_deleted_month_rewritten_later_is_rejected(self):
+        parse_and_save_excel(make_publication_csv("more.csv", [("P4", "2024-06-01", "컴퓨터공학과")]))
+        parse_and_save_excel(
+            make_publication_csv("again.csv", [("P4", "2024-06-01", "컴퓨터공학과"), ("P1", "2024-01-10", "컴퓨터공학과")])
+        )
+
+        with self.assertRaises(ValidationError):
+            rollback_batch(UploadBatch.objects.get(filename="more.csv"))
+
+    def test_admin_edit_of_month_refreshes_rollup(self):
+        admin_user = User.objects.create_superuser(username="admin", password="adminpass123")
+        client = Client()
+        client.force_login(admin_user)
+        january = MetricRecord.objects.get(month=1)
+
+        client.post(
+            f"/admin/ingest/metricrecord/{january.pk}/change/",
+            {
+                "year": 2024,
+                "month": 1,
+                "department": "computer-science",
+                "metric_type": "PUBLICATION",
+                "metric_value": "10",
+            },
+        )
+
+        self.assertEqual(MetricRecord.objects.get(month__isnull=True).metric_value, Decimal("11"))
+
+    def test_yearly_row_for_key_with_months_is_a_failure(self):
+        """A blank-month row next to monthly rows of its key fails instead of clashing with the rollup."""
+        lines = [
+            "year,month,department,metric_type,value",
+            "2024,,electronics,PAPER,50",
+            "2024,1,electronics,PAPER,2",
+            "2024,2,electronics,PAPER,3",
+            "2024,,philosophy,PAPER,7",
+            "2024,3,philosophy,BUDGET,4",
+            "2024,4,philosophy,BUDGET,6",
+        ]
+        upload = SimpleUploadedFile("mixed.csv", "\n".join(lines).encode("utf-8"), content_type="text/csv")
+
+        success, failures, _ = parse_and_save_excel(upload)
+
+        self.assertEqual((success, failures), (5, 1))
+        electronics = MetricRecord.objects.get(department="electronics", year=2024, month__isnull=True)
+        self.assertEqual(electronics.metric_value, Decimal("5"))
+        self.assertEqual(
+            MetricRecord.objects.get(department="philosophy", metric_type="PAPER", month__isnull=True).metric_value,
+            Decimal("7"),
+        )
+
+
+class RollbackBatchTests(TestCase):
+    """Test rollback_batch - undo inserts and restore updated values."""
+
+    def setUp(self):
+        parse_and_save_excel(make_csv("first.csv", [(2024, "electronics", "PAPER", 10), (2025, "electronics", "PAPER", 20)]))
+        parse_and_save_excel(make_csv("second.csv", [(2025, "electronics", "PAPER", 99), (2025, "philosophy", "PAPER", 5)]))
+        self.first = UploadBatch.objects.get(filename="first.csv")
+        self.second = UploadBatch.objects.get(filename="second.csv")
+
+    def test_rollback_deletes_inserts_and_restores_updates(self):
+        deleted, restored = rollback_batch(self.second)
+
+        self.assertEqual((deleted, restored), (1, 1))
+        self.assertFalse(MetricRecord.objects.filter(department="philosophy").exists())
+        self.assertEqual(
+            MetricRecord.objects.get(year=2025, department="electronics").metric_value, Decimal("20")
+        )
+        self.second.refresh_from_db()
+        self.assertTrue(self.second.is_rolled_back)
+
+    def test_rollback_twice_is_rejected(self):
+        rollback_batch(self.second)
+        with self.assertRaises(ValidationError):
+            rollback_batch(self.second)
+
+    def test_superseded_batch_cannot_be_rolled_back(self):
+        """An older batch whose rows were overwritten must wait for the newer one."""
+        with self.assertRaises(ValidationError):
+            rollback_batch(self.first)
+
+        rollback_batch(self.second)
+        rollback_batch(self.first)
+        self.assertFalse(MetricRecord.objects.exists())
+
+    def test_undo_is_constant_query_count(self):
+        """The undo itself costs the same number of queries for any batch size."""
+        parse_and_save_excel(make_csv("big.csv", [(2000 + i, "education", "BUDGET", i) for i in range(50)]))
+        big = UploadBatch.objects.get(filename="big.csv")
+
+        # Derived data (facets, chart documents) is measured in the test below
+        with mock.patch("apps.ingest.services.refresh_facets"), \
+                mock.patch("apps.ingest.services.metric_records_changed"):
+            for batch in (big, self.second):
+                # 8 for the undo (write lock included), 4 for the rollup deltas, SAVEPOINT and RELEASE
+                with self.assertNumQueries(14):
+                    rollback_batch(batch)
+
+    def test_rollback_derived_data_costs_per_touched_partition(self):
+        """Facets and chart documents are recounted per touched key, not per row."""
+        partitions = partitions_for({(2025, "electronics", "PAPER"), (2025, "philosophy", "PAPER")})
+        self.assertEqual(len(partitions), 6)
+
+        # 14 for the undo (above); facets: a GROUP BY and an upsert per kind plus one DELETE for
+        # the emptied department (7); documents: one aggregate per (year, department) partition,
+        # one DELETE for the emptied ones and one upsert
+        with self.assertNumQueries(14 + 7 + len(partitions) + 2):
+            rollback_batch(self.second)
+
+
+@override_settings(INGEST_TRACE_MEMORY=True)
+class IngestRunTests(TestCase):
+    """Test per-stage instrumentation of ingest runs."""
+
+    def test_successful_run_records_every_stage(self):
+        parse_and_save_excel(make_csv("run.csv", [(2025, "education", "PAPER", 3), (2025, "education", "BUDGET", 7)]))
+
+        run = IngestRun.objects.get()
+        self.assertEqual(run.status, IngestRun.STATUS_SUCCESS)
+        self.assertEqual(run.batch, UploadBatch.objects.get())
+        self.assertEqual((run.rows_in, run.rows_out), (2, 2))
+        self.assertEqual(
+            list(run.stages.values_list("name", flat=True)),
+            ["read", "detect_format", "transform", "normalize", "write"],
+        )
+        for stage in run.stages.all():
+            self.assertGreaterEqual(stage.wall_ms, 0)
+            self.assertIsNotNone(stage.peak_memory_kb)
+
+    def test_rejected_run_is_recorded(self):
+        with self.assertRaises(ValidationError):
+            parse_and_save_excel(make_csv("bad.csv", [(2025, "education", "PAPER", "x")]))
+
+        run = IngestRun.objects.get()
+        self.assertEqual(run.status, IngestRun.STATUS_REJECTED)
+        self.assertIn("Failure rate", run.error_message)
+        self.assertIsNone(run.batch)
+
+    @override_settings(INGEST_SLOW_STAGE_SECONDS=0)
+    def test_slow_stages_record_top_allocations(self):
+        parse_and_save_excel(make_csv("slow.csv", [(2025, "education", "PAPER", 3)]))
+
+        stage = IngestRun.objects.get().stages.get(name="read")
+        self.assertTrue(stage.top_allocations)
+        self.assertIn("location", stage.top_allocations[0])
+
+    def test_failed_run_record_keeps_the_upload_result(self):
+        """An error while saving the IngestRun is logged, not raised in place of the upload's result."""
+        with mock.patch.object(IngestProfiler, "save", side_effect=RuntimeError("db down")):
+            with self.assertLogs("apps.ingest.services", level="ERROR"):
+                with self.assertRaisesMessage(ValidationError, "Failure rate"):
+                    parse_and_save_excel(make_csv("bad.csv", [(2025, "education", "PAPER", "x")]))
+            with self.assertLogs("apps.ingest.services", level="ERROR"):
+                success, failed, _ = parse_and_save_excel(make_csv("ok.csv", [(2025, "education", "PAPER", 3)]))
+
+        self.assertEqual((success, failed), (1, 0))
+        self.assertFalse(tracemalloc.is_tracing())
+
+    @override_settings(INGEST_SLOW_STAGE_SECONDS=0)
+    def test_overlapping_runs_share_tracing(self):
+        """A run that finishes first must not stop tracing under a run still in progress."""
+        first, second = IngestProfiler(), IngestProfiler()
+        with second.stage("write") as stage:
+            first.stop()
+            self.assertTrue(tracemalloc.is_tracing())
+            stage["rows_out"] = 1
+        second.stop()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(second.stages[0]["peak_memory_kb"])  # 다른 실행과 겹친 단계의 최대치는 기록 안 함
+        self.assertTrue(second.stages[0]["top_allocations"])
+
+    @override_settings(INGEST_TRACE_MEMORY=False)
+    def test_tracing_disabled(self):
+        profiler = IngestProfiler()
+        with profiler.stage("read") as stage:
+            stage["rows_out"] = 0
+        profiler.stop()
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(profiler.stages[0]["peak_memory_kb"])
+
+
+class MetricFacetTests(TestCase):
+    """Test refresh_facets - distinct filter values maintained on every write path."""
+
+    def test_upload_adds_facets(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 1), (2025, "philosophy", "BUDGET", 2)]))
+
+        self.assertEqual(
+            read_facets(),
+            {
+                MetricFacet.KIND_YEAR: ["2024", "2025"],
+                MetricFacet.KIND_DEPARTMENT: ["electronics", "philosophy"],
+                MetricFacet.KIND_METRIC_TYPE: ["BUDGET", "PAPER"],
+            },
+        )
+        self.assertEqual(
+            MetricFacet.objects.get(kind=MetricFacet.KIND_METRIC_TYPE, value="PAPER").record_count, 1
+        )
+
+    def test_rollback_removes_facets_without_rows(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 1)]))
+        parse_and_save_excel(make_csv("b.csv", [(2025, "philosophy", "PAPER", 2)]))
+
+        rollback_batch(UploadBatch.objects.get(filename="b.csv"))
+
+        facets = read_facets()
+        self.assertEqual(facets[MetricFacet.KIND_YEAR], ["2024"])
+        self.assertEqual(facets[MetricFacet.KIND_DEPARTMENT], ["electronics"])
+        self.assertEqual(
+            MetricFacet.objects.get(kind=MetricFacet.KIND_METRIC_TYPE, value="PAPER").record_count, 1
+        )
+
+    def test_monthly_rows_count_once_through_their_rollup(self):
+        parse_and_save_excel(
+            make_publication_csv("p.csv", [("P1", "2024-01-05", "electronics"), ("P2", "2024-02-05", "electronics")])
+        )
+
+        self.assertEqual(
+            MetricFacet.objects.get(kind=MetricFacet.KIND_YEAR, value="2024").record_count, 1
+        )
+
+    def test_writers_take_the_write_lock_before_recounting(self):
+        """Upload and rollback lock DataVersion first, so the recount sees every committed writer."""
+        calls = mock.Mock()
+        with mock.patch("apps.ingest.services.lock_data_writes", wraps=lock_data_writes) as lock, \
+                mock.patch("apps.ingest.services.refresh_facets", wraps=refresh_facets) as refresh:
+            calls.attach_mock(lock, "lock")
+            calls.attach_mock(refresh, "refresh")
+            parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 1)]))
+            rollback_batch(UploadBatch.objects.get(filename="a.csv"))
+
+        self.assertEqual([name for name, _, _ in calls.mock_calls], ["lock", "refresh", "lock", "refresh"])
+        self.assertFalse(MetricFacet.objects.exists())
+
+
+class MetricRollupTests(TestCase):
+    """Test the incrementally maintained rollup tables against the base table."""
+
+    def assertConsistent(self):
+        self.assertEqual(check_rollups(), [])
+
+    def test_upload_update_and_rollback_keep_rollups_consistent(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 10), (2024, "philosophy", "PAPER", 5)]))
+        self.assertConsistent()
+        self.assertEqual(
+            YearMetricRollup.objects.values_list("total", "row_count").get(year=2024, metric_type="PAPER"),
+            (Decimal("15"), 2),
+        )
+
+        parse_and_save_excel(make_csv("b.csv", [(2024, "electronics", "PAPER", 12), (2025, "electronics", "PAPER", 1)]))
+        self.assertConsistent()
+        self.assertEqual(
+            DepartmentMetricRollup.objects.get(department="electronics", metric_type="PAPER").total, Decimal("13")
+        )
+
+        rollback_batch(UploadBatch.objects.get(filename="b.csv"))
+        self.assertConsistent()
+        self.assertFalse(YearMetricRollup.objects.filter(year=2025).exists())
+
+    def test_monthly_uploads_count_their_yearly_rollup_once(self):
+        parse_and_save_excel(
+            make_publication_csv("p.csv", [("P1", "2024-01-05", "electronics"), ("P2", "2024-02-05", "electronics")])
+        )
+        self.assertConsistent()
+        self.assertEqual(
+            YearMetricRollup.objects.values_list("total", "row_count").get(year=2024),
+            (Decimal("2"), 1),
+        )
+
+    def test_check_reports_drift_and_rebuild_repairs_it(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 10)]))
+        MetricRecord.objects.update(metric_value=Decimal("99"))  # bypasses the writer
+
+        self.assertEqual(len(check_rollups()), 2)
+        rebuild_rollups()
+        self.assertConsistent()
+
+    def test_check_rollups_command(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 10)]))
+        YearMetricRollup.objects.all().delete()
+
+        with self.assertRaises(CommandError):
+            call_command("check_rollups", stdout=StringIO())
+        call_command("check_rollups", "--fix", stdout=StringIO())
+        self.assertConsistent()
+
+
+class UploadBatchAdminTests(TestCase):
+    """Test the rollback admin action."""
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(username="admin", password="adminpass123")
+        self.client = Client()
+        self.client.login(username="admin", password="adminpass123")
+
+    def test_upload_records_uploader(self):
+        self.client.post(
+            "/admin/ingest/metricrecord/upload/",
+            {"file": make_csv("admin.csv", [(2025, "education", "PAPER", 3)])},
+        )
+        self.assertEqual(UploadBatch.objects.get().uploaded_by, self.admin)
+
+    def test_rollback_action(self):
+        parse_and_save_excel(make_csv("bad.csv", [(2025, "education", "PAPER", 3)]))
+        batch = UploadBatch.objects.get()
+
+        response = self.client.post(
+            "/admin/ingest/uploadbatch/",
+            {"action": "rollback_upload", "_selected_action": [batch.pk]},
+            follow=True,
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(MetricRecord.objects.exists())
+        batch.refresh_from_db()
+        self.assertTrue(batch.is_rolled_back)
+
+    def test_ingest_run_changelist_sorts_by_duration(self):
+        parse_and_save_excel(make_csv("run.csv", [(2025, "education", "PAPER", 3)]))
+
+        response = self.client.get("/admin/ingest/ingestrun/?o=-7")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "run.csv")
+
+    def test_admin_delete_updates_facets(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 1), (2025, "philosophy", "PAPER", 2)]))
+        record = MetricRecord.objects.get(department="philosophy")
+
+        self.client.post(f"/admin/ingest/metricrecord/{record.pk}/delete/", {"post": "yes"})
+
+        self.assertEqual(read_facets()[MetricFacet.KIND_DEPARTMENT], ["electronics"])
+        self.assertEqual(check_rollups(), [])
+
+    def test_admin_edit_updates_rollups(self):
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 1)]))
+        record = MetricRecord.objects.get()
+
+        self.client.post(
+            f"/admin/ingest/metricrecord/{record.pk}/change/",
+            {"year": 2024, "month": "", "department": "electronics", "metric_type": "PAPER", "metric_value": "7"},
+        )
+
+        self.assertEqual(MetricRecord.objects.get().metric_value, Decimal("7"))
+        self.assertEqual(check_rollups(), [])
+
+    def test_admin_edit_blocks_rollback_of_earlier_upload(self):
+        """Rolling back the upload must not silently overwrite a later correction."""
+        parse_and_save_excel(make_csv("a.csv", [(2024, "electronics", "PAPER", 1)]))
+        parse_and_save_excel(make_csv("b.csv", [(2024, "electronics", "PAPER", 2)]))
+        record = MetricRecord.objects.get()
+
+        self.client.post(
+            f"/admin/ingest/metricrecord/{record.pk}/change/",
+            {"year": 2024, "month": "", "department": "electronics", "metric_type": "PAPER", "metric_value": "7"},
+        )
+
+        with self.assertRaises(ValidationError):
+            rollback_batch(UploadBatch.objects.get(filename="b.csv"))
+        with self.assertRaises(ValidationError):
+            rollback_batch(UploadBatch.objects.get(file_format=ADMIN_EDIT_FORMAT))
+        self.assertEqual(MetricRecord.objects.get().metric_value, Decimal("7"))
+
+    def test_admin_delete_blocks_rollback_of_earlier_upload(self):
+        parse_and_save_excel(make_publication_csv("pubs.csv", [("P1", "2024-01-10", "컴퓨터공학과")]))
+        january = MetricRecord.objects.get(month=1)
+
+        self.client.post(f"/admin/ingest/metricrecord/{january.pk}/delete/", {"post": "yes"})
+
+        with self.assertRaises(ValidationError):
+            rollback_batch(UploadBatch.objects.get(filename="pubs.csv"))
+        self.assertFalse(MetricRecord.objects.exists())
@@ -0,0 +1,90 @@
+"""Data Versioning - Commit-time invalidation token for MetricRecord data
+
+Every write path that changes MetricRecord (upload, rollback, admin edits)
+calls bump_data_version(). The bump runs in transaction.on_commit, so a
+rolled-back upload never invalidates anything and the new version becomes
+visible to every worker process right after the data itself commits.
+
+The same DataVersion row serializes the writers: each write transaction
+starts with lock_data_writes(), which holds a row lock until it commits.
+Derived data (facet counts, chart documents) is recounted from the table
+inside the writing transaction, and under READ COMMITTED two concurrent
+writers would each recount without the other's rows; with the lock the
+second writer only reads after the first has committed.
+
+Example:
+    from apps.ingest.versioning import get_data_version
+
+    version, updated_at = get_data_version()  # or: await aget_data_version()
+    cache_key = f"chart:{version}:{year}:{department}"
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import DataVersion
+
+DATA_VERSION_PK = 1
+
+
+def get_data_version() -> Tuple[int, Optional[datetime]]:
+    """Return (version, updated_at) of the current data. One primary-key lookup."""
+    row = DataVersion.objects.filter(pk=DATA_VERSION_PK).values_list("version", "updated_at").first()
+    if row is None:
+        return 0, None
+    return row
+
+
+async def aget_data_version() -> Tuple[int, Optional[datetime]]:
+    """Async get_data_version for async views."""
+    row = await DataVersion.objects.filter(pk=DATA_VERSION_PK).values_list("version", "updated_at").afirst()
+    if row is None:
+        return 0, None
+    return row
+
+
+def lock_data_writes() -> None:
+    """
+    Take the MetricRecord write lock until the current transaction ends.
+
+    Call it first in every transaction that writes MetricRecord, before any
+    other row is written, so writers queue on this lock instead of
+    deadlocking on each other's rows. One SELECT ... FOR UPDATE (a plain
+    SELECT on SQLite, which serializes writers itself).
+
+    Raises:
+        TransactionManagementError: If called outside a transaction on PostgreSQL
+    """
+    locked = DataVersion.objects.select_for_update().filter(pk=DATA_VERSION_PK).values_list("pk", flat=True)
+    if list(locked):
+        return
+    try:
+        with transaction.atomic():
+            DataVersion.objects.create(pk=DATA_VERSION_PK, version=0)
+    except IntegrityError:
+        # Another writer created the row first; wait for its lock
+        list(locked.all())
+
+
+def bump_data_version() -> None:
+    """Schedule a version bump for when the current transaction commits."""
+    transaction.on_commit(_bump)
+
+
+def _bump() -> None:
+    """Increment the version in a single UPDATE, creating the row on first use."""
+    updated = DataVersion.objects.filter(pk=DATA_VERSION_PK).update(
+        version=F("version") + 1, updated_at=timezone.now()
+    )
+    if updated:
+        return
+    try:
+        with transaction.atomic():
+            DataVersion.objects.create(pk=DATA_VERSION_PK, version=1)
+    except IntegrityError:
+        # Another process created the row first
+        _bump()
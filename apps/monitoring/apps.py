@@ -0,0 +1,15 @@
+from django.apps import AppConfig
+
+
+class MonitoringConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.monitoring'
+
+    def ready(self):
+        from django.db.backends.signals import connection_created
+
+        from .db import on_connection_created
+        from .timing import install_execute_wrapper
+
+        connection_created.connect(on_connection_created, dispatch_uid="monitoring_connection_created")
+        connection_created.connect(install_execute_wrapper, dispatch_uid="monitoring_execute_wrapper")
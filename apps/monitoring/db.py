@@ -0,0 +1,66 @@
+"""Database Connection Statistics - Per-process connection and pool counters
+
+Counts connection_created signals per database alias and reads the psycopg
+pool statistics of pooled aliases (DB_POOL=true, see config/settings.py).
+Without a pool every connection_created is a new physical connection; with
+a pool it is a checkout, and the pool's own counters (connections_num)
+report the physical connections.
+
+Example:
+    from apps.monitoring.db import connection_stats
+
+    stats = connection_stats()
+    # [{'alias': 'default', 'vendor': 'postgresql', 'pooled': True, ...}]
+"""
+
+import os
+from collections import Counter
+from typing import Any, Dict, List
+
+from django.db import connections
+
+# alias -> connection_created count of this process
+_created: Counter = Counter()
+
+
+def on_connection_created(sender, connection, **kwargs) -> None:
+    """Receiver for django.db.backends.signals.connection_created."""
+    _created[connection.alias] += 1
+
+
+def pool_stats(alias: str) -> Dict[str, Any]:
+    """psycopg_pool statistics of a pooled alias, or {} when it has no pool (or it is not open yet)."""
+    connection = connections[alias]
+    if connection.vendor != "postgresql" or not connection.settings_dict["OPTIONS"].get("pool"):
+        return {}
+    # Read the registry instead of connection.pool, which would create the pool
+    pool = connection._connection_pools.get(alias)
+    return pool.get_stats() if pool is not None else {}
+
+
+def connection_stats() -> List[Dict[str, Any]]:
+    """
+    Connection counters of the current worker process, one entry per database alias.
+
+    Returns:
+        List[dict]: alias, vendor, pooled, conn_max_age, connection_created
+                    (connects, or pool checkouts when pooled), pool (psycopg_pool
+                    get_stats(): pool_min, pool_max, pool_size, pool_available,
+                    requests_waiting, connections_num, ...) and pid
+    """
+    stats = []
+    for alias in connections:
+        connection = connections[alias]
+        pooled = bool(connection.settings_dict["OPTIONS"].get("pool"))
+        stats.append(
+            {
+                "alias": alias,
+                "vendor": connection.vendor,
+                "pooled": pooled,
+                "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+                "connection_created": _created[alias],
+                "pool": pool_stats(alias) if pooled else None,
+                "pid": os.getpid(),
+            }
+        )
+    return stats
@@ -0,0 +1,337 @@
+"""Prometheus Metrics - Request latency, ingest throughput and cache efficiency
+
+Each process records into an in-memory registry (a lock and a few dict
+updates, a few microseconds per request). GET /metrics renders the sum over
+all gunicorn workers in the Prometheus text format:
+
+- http_request_duration_seconds   histogram by endpoint (URL route) and method
+- http_requests_total             counter by endpoint, method and status
+- http_request_db_queries         histogram of SQL queries per request by endpoint
+- cache_lookups_total             counter by cache (chart, auth_user) and result (hit, miss)
+- cache_hit_ratio                 gauge by cache, hits / lookups since the server started
+- ingest_rows_total               counter by outcome (saved, failed, rejected)
+- ingest_uploads_total            counter by IngestRun status
+- ingest_seconds_total            counter, wall time spent in ingest runs
+- ingest_rows_per_second          gauge, saved rows / ingest seconds since the server started
+
+Aggregation across processes:
+    With METRICS_DIR set (gunicorn.conf.py sets it and empties it when the
+    master starts), every process writes a snapshot of its registry to
+    ``<METRICS_DIR>/<pid>-<start>.json`` every METRICS_FLUSH_SECONDS from a
+    background thread, and the worker answering /metrics sums all files.
+    Files of processes that have exited (recycled workers) are folded into
+    one archive file, so counters never go backwards when a worker restarts.
+    Without METRICS_DIR (runserver, tests) only the current process is shown.
+
+Use rate() on the counters for throughput, e.g. ingest rows per second
+while uploads run: rate(ingest_rows_total{outcome="saved"}[5m]) /
+rate(ingest_seconds_total[5m]).
+
+Example:
+    from apps.monitoring import metrics
+
+    metrics.inc("cache_lookups_total", cache="chart", result="hit")
+    metrics.observe("http_request_duration_seconds", 0.042, endpoint="api/dashboard/chart-data/", method="GET")
+"""
+
+import fcntl
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.conf import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# name -> (type, help, buckets)
+METRICS: Dict[str, Tuple[str, str, Tuple[float, ...]]] = {
+    "http_request_duration_seconds": ("histogram", "Request latency inside Django by URL route.", LATENCY_BUCKETS),
+    "http_requests_total": ("counter", "Requests by URL route, method and status.", ()),
+    "http_request_db_queries": ("histogram", "SQL queries per request by URL route.", QUERY_BUCKETS),
+    "cache_lookups_total": ("counter", "Cache lookups by cache and result.", ()),
+    "ingest_rows_total": ("counter", "Ingested rows by outcome.", ()),
+    "ingest_uploads_total": ("counter", "Ingest runs by status.", ()),
+    "ingest_seconds_total": ("counter", "Wall time spent in ingest runs.", ()),
+}
+
+# Gauges computed from the aggregated counters when rendering
+DERIVED_HELP = {
+    "cache_hit_ratio": "Cache hits / lookups since the server started.",
+    "ingest_rows_per_second": "Saved rows / ingest seconds since the server started.",
+}
+
+ARCHIVE_FILE = "archive.json"
+LOCK_FILE = ".lock"
+
+Labels = Tuple[Tuple[str, str], ...]
+Key = Tuple[str, Labels]
+
+
+class Registry:
+    """Counters and histograms of one process."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.counters: Dict[Key, float] = defaultdict(float)
+        # key -> per-bucket counts (the last one is +Inf) followed by the sum
+        self.histograms: Dict[Key, List[float]] = {}
+
+    def inc(self, name: str, amount: float, labels: Labels) -> None:
+        with self._lock:
+            self.counters[(name, labels)] += amount
+
+    def observe(self, name: str, value: float, labels: Labels) -> None:
+        buckets = METRICS[name][2]
+        with self._lock:
+            values = self.histograms.get((name, labels))
+            if values is None:
+                values = self.histograms[(name, labels)] = [0.0] * (len(buckets) + 2)
+            values[bisect_left(buckets, value)] += 1
+            values[-1] += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-serializable copy of the registry."""
+        with self._lock:
+            return {
+                "counters": [[name, labels, value] for (name, labels), value in self.counters.items()],
+                "histograms": [[name, labels, list(values)] for (name, labels), values in self.histograms.items()],
+            }
+
+    def merge(self, snapshot: Dict[str, Any]) -> None:
+        """Add a snapshot (of this or another process) to the registry."""
+        with self._lock:
+            for name, labels, value in snapshot.get("counters", ()):
+                if name in METRICS:
+                    self.counters[(name, _labels_key(labels))] += value
+            for name, labels, values in snapshot.get("histograms", ()):
+                if name not in METRICS or len(values) != len(METRICS[name][2]) + 2:
+                    continue  # bucket layout changed between deployments
+                key = (name, _labels_key(labels))
+                current = self.histograms.setdefault(key, [0.0] * len(values))
+                for index, value in enumerate(values):
+                    current[index] += value
+
+
+def _labels_key(labels: Iterable) -> Labels:
+    return tuple((str(name), str(value)) for name, value in labels)
+
+
+_registry = Registry()
+_flusher_started = False
+_snapshot_name = f"{os.getpid()}-{time.time_ns()}.json"
+
+
+def _after_fork() -> None:
+    # A forked worker starts from zero: the master's counts stay in the master's file
+    global _registry, _flusher_started, _snapshot_name
+    _registry = Registry()
+    _flusher_started = False
+    _snapshot_name = f"{os.getpid()}-{time.time_ns()}.json"
+
+
+os.register_at_fork(after_in_child=_after_fork)
+
+
+def inc(name: str, amount: float = 1, **labels: Any) -> None:
+    """Increase a counter of the current process."""
+    _registry.inc(name, amount, tuple((key, str(label)) for key, label in labels.items()))
+    _ensure_flusher()
+
+
+def observe(name: str, value: float, **labels: Any) -> None:
+    """Record one value in a histogram of the current process."""
+    _registry.observe(name, value, tuple((key, str(label)) for key, label in labels.items()))
+    _ensure_flusher()
+
+
+def observe_request(endpoint: str, method: str, status: int, seconds: float, queries: int) -> None:
+    """Record one finished request (called by ServerTimingMiddleware)."""
+    labels = (("endpoint", endpoint), ("method", method))
+    _registry.observe("http_request_duration_seconds", seconds, labels)
+    _registry.observe("http_request_db_queries", queries, (("endpoint", endpoint),))
+    _registry.inc("http_requests_total", 1, labels + (("status", str(status)),))
+    _ensure_flusher()
+
+
+def record_ingest(status: str, saved: int, failed: int, rejected: int, seconds: float) -> None:
+    """Record one ingest run: rows by outcome, the run status and its wall time."""
+    inc("ingest_uploads_total", status=status)
+    inc("ingest_seconds_total", seconds)
+    for outcome, rows in (("saved", saved), ("failed", failed), ("rejected", rejected)):
+        if rows:
+            inc("ingest_rows_total", rows, outcome=outcome)
+
+
+def metrics_dir() -> Optional[str]:
+    return getattr(settings, "METRICS_DIR", None) or None
+
+
+def _ensure_flusher() -> None:
+    global _flusher_started
+    if _flusher_started or metrics_dir() is None:
+        return
+    _flusher_started = True
+    threading.Thread(target=_flush_periodically, name="metrics-flush", daemon=True).start()
+
+
+def _flush_periodically() -> None:
+    interval = getattr(settings, "METRICS_FLUSH_SECONDS", 5)
+    while True:
+        time.sleep(interval)
+        try:
+            flush()
+        except OSError:
+            pass  # full or missing tmpfs: try again next time
+
+
+def flush() -> None:
+    """Write the current process's snapshot to METRICS_DIR (atomically)."""
+    directory = metrics_dir()
+    if directory is None:
+        return
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, _snapshot_name)
+    _write_json(path, _registry.snapshot())
+
+
+def _write_json(path: str, data: Dict[str, Any]) -> None:
+    # Unique per thread: the flush thread and a /metrics request may write at the same time
+    temporary = f"{path}.{threading.get_ident()}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(temporary, path)
+
+
+def _read_json(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _process_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def collect() -> Registry:
+    """The registry summed over every process (only this one without METRICS_DIR)."""
+    directory = metrics_dir()
+    if directory is None:
+        total = Registry()
+        total.merge(_registry.snapshot())
+        return total
+
+    flush()
+    total = Registry()
+    with open(os.path.join(directory, LOCK_FILE), "a") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        archive_path = os.path.join(directory, ARCHIVE_FILE)
+        archive = Registry()
+        archive.merge(_read_json(archive_path) or {})
+        archived = False
+        for filename in sorted(os.listdir(directory)):
+            if not filename.endswith(".json") or filename == ARCHIVE_FILE:
+                continue
+            path = os.path.join(directory, filename)
+            snapshot = _read_json(path)
+            if snapshot is None:
+                continue
+            pid = int(filename.split("-", 1)[0]) if filename.split("-", 1)[0].isdigit() else 0
+            if pid and not _process_alive(pid):
+                archive.merge(snapshot)
+                archived = True
+                os.unlink(path)
+            else:
+                total.merge(snapshot)
+        if archived:
+            _write_json(archive_path, archive.snapshot())
+    total.merge(archive.snapshot())
+    return total
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _format_bound(bound: float) -> str:
+    return repr(float(bound))
+
+
+def render(registry: Optional[Registry] = None) -> str:
+    """Prometheus text exposition format (version 0.0.4) of the aggregated metrics."""
+    registry = registry or collect()
+    lines: List[str] = []
+    for name, (kind, help_text, buckets) in METRICS.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        if kind == "counter":
+            for (metric, labels), value in sorted(registry.counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+            continue
+        for (metric, labels), values in sorted(registry.histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0.0
+            for bound, count in zip(buckets + (float("inf"),), values[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_bound(bound)
+                lines.append(f"{name}_bucket{_format_labels(labels + (('le', le),))} {_format_value(cumulative)}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(values[-1])}")
+            lines.append(f"{name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+
+    lines += _derived_gauges(registry)
+    return "\n".join(lines) + "\n"
+
+
+def _derived_gauges(registry: Registry) -> List[str]:
+    lookups: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    rows_saved = seconds = 0.0
+    for (name, labels), value in registry.counters.items():
+        label_map = dict(labels)
+        if name == "cache_lookups_total":
+            lookups[label_map.get("cache", "")][label_map.get("result", "")] += value
+        elif name == "ingest_rows_total" and label_map.get("outcome") == "saved":
+            rows_saved += value
+        elif name == "ingest_seconds_total":
+            seconds += value
+
+    lines = [f"# HELP cache_hit_ratio {DERIVED_HELP['cache_hit_ratio']}", "# TYPE cache_hit_ratio gauge"]
+    for cache_name, results in sorted(lookups.items()):
+        total = sum(results.values())
+        if total:
+            lines.append(f'cache_hit_ratio{{cache="{_escape(cache_name)}"}} {round(results["hit"] / total, 4)}')
+    lines += [
+        f"# HELP ingest_rows_per_second {DERIVED_HELP['ingest_rows_per_second']}",
+        "# TYPE ingest_rows_per_second gauge",
+    ]
+    if seconds:
+        lines.append(f"ingest_rows_per_second {round(rows_saved / seconds, 1)}")
+    return lines
+
+
+def reset() -> None:
+    """Forget the current process's metrics (tests)."""
+    global _registry
+    _registry = Registry()
@@ -0,0 +1,321 @@
+"""Monitoring Tests
+
+Test Coverage:
+  - connection_stats: per-alias connection counters and pool statistics
+  - DatabasePoolAPIView: staff-only access and response shape
+  - ServerTimingMiddleware: Server-Timing header, sampling and access log
+  - Prometheus metrics: recording, aggregation across processes, /metrics access
+"""
+
+import json
+import os
+import tempfile
+import time
+from decimal import Decimal
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.db.backends.signals import connection_created
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.ingest.facets import rebuild_facets
+from apps.ingest.models import MetricRecord
+from apps.ingest.services import parse_and_save_excel
+from apps.monitoring import db, metrics
+from apps.monitoring.db import connection_stats, pool_stats
+from apps.monitoring.timing import RequestTiming, db_execute_wrapper, timing
+
+
+class ConnectionStatsTests(TestCase):
+    """Test the per-process connection counters."""
+
+    def test_counts_connection_created(self):
+        before = connection_stats()[0]["connection_created"]
+
+        connection_created.send(sender=connection.__class__, connection=connection)
+
+        self.assertEqual(connection_stats()[0]["connection_created"], before + 1)
+
+    def test_unpooled_alias(self):
+        stats = connection_stats()[0]
+        self.assertEqual(stats["alias"], "default")
+        self.assertFalse(stats["pooled"])
+        self.assertIsNone(stats["pool"])
+        self.assertEqual(pool_stats("default"), {})
+
+    def test_pool_statistics_are_read_without_opening_a_pool(self):
+        pool = mock.Mock()
+        pool.get_stats.return_value = {"pool_min": 1, "pool_max": 4, "pool_size": 2, "connections_num": 2}
+        fake = mock.Mock(
+            vendor="postgresql",
+            settings_dict={"OPTIONS": {"pool": {"max_size": 4}}, "CONN_MAX_AGE": 0},
+            _connection_pools={"default": pool},
+        )
+        with mock.patch.object(db, "connections", {"default": fake}):
+            stats = connection_stats()[0]
+
+        self.assertTrue(stats["pooled"])
+        self.assertEqual(stats["pool"]["connections_num"], 2)
+        fake._connection_pools = {}
+        with mock.patch.object(db, "connections", {"default": fake}):
+            self.assertEqual(pool_stats("default"), {})
+
+
+class DatabasePoolAPIViewTests(TestCase):
+    """Test the staff-only db-pool endpoint."""
+
+    URL = "/api/monitoring/db-pool/"
+
+    def test_staff_only(self):
+        User.objects.create_user(username="viewer", password="testpass123")
+        client = Client()
+        client.login(username="viewer", password="testpass123")
+
+        self.assertEqual(client.get(self.URL).status_code, 403)
+
+    def test_returns_database_stats(self):
+        User.objects.create_user(username="staff", password="testpass123", is_staff=True)
+        client = Client()
+        client.login(username="staff", password="testpass123")
+
+        response = client.get(self.URL)
+
+        self.assertEqual(response.status_code, 200)
+        entry = response.json()["databases"][0]
+        self.assertEqual(entry["alias"], "default")
+        self.assertIn("connection_created", entry)
+        self.assertIn("pid", entry)
+
+
+def parse_server_timing(header):
+    """{'db': (dur_ms, desc), ...} from a Server-Timing header value."""
+    metrics = {}
+    for part in header.split(","):
+        name, *params = [item.strip() for item in part.split(";")]
+        values = dict(param.split("=", 1) for param in params)
+        metrics[name] = (float(values["dur"]), values.get("desc", "").strip('"'))
+    return metrics
+
+
+@override_settings(SERVER_TIMING_SAMPLE_RATE=1.0)
+class ServerTimingTests(TestCase):
+    """Test the Server-Timing header and the access log line."""
+
+    CHART_URL = "/api/dashboard/chart-data/?department=컴퓨터공학과&metric_type=PAPER"
+
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(username="testuser", password="testpass123")
+        MetricRecord.objects.create(
+            year=2024, department="컴퓨터공학과", metric_type="PAPER", metric_value=Decimal("10")
+        )
+        rebuild_facets()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_chart_response_breaks_down_the_time(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.CHART_URL)
+
+        metrics = parse_server_timing(response["Server-Timing"])
+        for name in ("app", "db", "session", "service", "serialize"):
+            self.assertIn(name, metrics)
+        self.assertEqual(metrics["db"][1], f"{len(queries)} queries")
+        self.assertLessEqual(metrics["db"][0], metrics["app"][0])
+
+    def test_dashboard_page_reports_render_time(self):
+        response = self.client.get("/dashboard/")
+
+        self.assertIn("render", parse_server_timing(response["Server-Timing"]))
+
+    def test_async_view_counts_queries_run_in_worker_threads(self):
+        response = self.client.get(self.CHART_URL.replace("chart-data", "chart-data-async"))
+
+        metrics = parse_server_timing(response["Server-Timing"])
+        self.assertRegex(metrics["db"][1], r"^[1-9]\d* queries$")
+        self.assertIn("service", metrics)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_requests_have_no_header(self):
+        response = self.client.get(self.CHART_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Server-Timing", response)
+
+    def test_access_log_line_includes_the_timings(self):
+        with self.assertLogs("apps.monitoring.access", level="INFO") as logs:
+            self.client.get(self.CHART_URL)
+
+        entry = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(entry["method"], "GET")
+        self.assertEqual(entry["path"], "/api/dashboard/chart-data/")
+        self.assertEqual(entry["status"], 200)
+        self.assertGreater(entry["db_queries"], 0)
+        for field in ("duration_ms", "bytes", "app_ms", "db_ms", "service_ms", "serialize_ms"):
+            self.assertIn(field, entry)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_requests_are_still_logged(self):
+        with self.assertLogs("apps.monitoring.access", level="INFO") as logs:
+            self.client.get(self.CHART_URL)
+
+        entry = json.loads(logs.records[-1].getMessage())
+        self.assertEqual(entry["status"], 200)
+        self.assertNotIn("db_ms", entry)
+
+    def test_timing_outside_a_request_is_a_no_op(self):
+        with timing("service"):
+            pass
+        execute = mock.Mock(return_value="result")
+
+        self.assertEqual(db_execute_wrapper(execute, "SELECT 1", None, False, {}), "result")
+        execute.assert_called_once_with("SELECT 1", None, False, {})
+
+    def test_header_order_and_format(self):
+        current = RequestTiming()
+        current.add("serialize", 0.002)
+        current.add("db", 0.0015)
+        current.queries = 3
+        current.add("app", 0.01)
+
+        self.assertEqual(
+            current.header(), 'app;dur=10.0, db;dur=1.5;desc="3 queries", serialize;dur=2.0'
+        )
+
+
+def parse_metrics(text):
+    """{'name{labels}': value} from a Prometheus text exposition."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+@override_settings(METRICS_DIR=None)
+class MetricsTests(TestCase):
+    """Test the Prometheus metrics and the /metrics endpoint."""
+
+    CHART_URL = "/api/dashboard/chart-data/?department=컴퓨터공학과&metric_type=PAPER"
+
+    def setUp(self):
+        cache.clear()
+        metrics.reset()
+        User.objects.create_user(username="testuser", password="testpass123")
+        MetricRecord.objects.create(
+            year=2024, department="컴퓨터공학과", metric_type="PAPER", metric_value=Decimal("10")
+        )
+        rebuild_facets()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def scrape(self, **extra):
+        response = Client().get("/metrics", **extra)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        return parse_metrics(response.content.decode())
+
+    def test_requests_are_recorded_by_route(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.CHART_URL)
+        query_count = len(queries)
+        self.client.get(self.CHART_URL)
+
+        samples = self.scrape()
+        labels = 'endpoint="api/dashboard/chart-data/",method="GET"'
+        self.assertEqual(samples[f'http_requests_total{{{labels},status="200"}}'], 2)
+        self.assertEqual(samples[f"http_request_duration_seconds_count{{{labels}}}"], 2)
+        self.assertEqual(samples[f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}}'], 2)
+        self.assertGreater(samples[f"http_request_duration_seconds_sum{{{labels}}}"], 0)
+        query_sum = samples['http_request_db_queries_sum{endpoint="api/dashboard/chart-data/"}']
+        self.assertGreaterEqual(query_sum, query_count)
+
+    @override_settings(SERVER_TIMING_SAMPLE_RATE=0)
+    def test_unsampled_requests_count_their_queries(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(self.CHART_URL)
+        query_count = len(queries)  # 다음 요청이 connection.queries를 비우기 전에
+
+        samples = self.scrape()
+        self.assertEqual(
+            samples['http_request_db_queries_sum{endpoint="api/dashboard/chart-data/"}'], query_count
+        )
+
+    def test_cache_hit_ratio(self):
+        self.client.get(self.CHART_URL)
+        self.client.get(self.CHART_URL)
+
+        samples = self.scrape()
+        self.assertEqual(samples['cache_lookups_total{cache="chart",result="hit"}'], 1)
+        self.assertEqual(samples['cache_lookups_total{cache="chart",result="miss"}'], 1)
+        self.assertEqual(samples['cache_hit_ratio{cache="chart"}'], 0.5)
+
+    def test_ingest_rows_by_outcome(self):
+        lines = ["year,department,metric_type,value", "2025,computer-science,PAPER,20", "2025,computer-science,BUDGET,70000"]
+        parse_and_save_excel(SimpleUploadedFile("valid.csv", "\n".join(lines).encode("utf-8")))
+
+        samples = self.scrape()
+        self.assertEqual(samples['ingest_rows_total{outcome="saved"}'], 2)
+        self.assertEqual(samples['ingest_uploads_total{status="success"}'], 1)
+        self.assertGreater(samples["ingest_seconds_total"], 0)
+        self.assertGreater(samples["ingest_rows_per_second"], 0)
+
+    def test_unmatched_paths_share_one_label(self):
+        self.client.get("/no-such-page/")
+        self.client.get("/another-missing-page/")
+
+        samples = self.scrape()
+        self.assertEqual(samples['http_requests_total{endpoint="unmatched",method="GET",status="404"}'], 2)
+
+    def test_workers_are_summed_and_exited_workers_are_kept(self):
+        """다른 프로세스(fork)의 스냅샷을 합산하고, 종료된 프로세스의 값은 archive로 옮겨 유지"""
+        with tempfile.TemporaryDirectory() as directory, self.settings(METRICS_DIR=directory):
+            metrics.inc("ingest_uploads_total", status="success")
+            pid = os.fork()
+            if pid == 0:  # 자식 프로세스: 기록 후 스냅샷을 쓰고 종료
+                try:
+                    metrics.inc("ingest_uploads_total", 2, status="success")
+                    metrics.flush()
+                finally:
+                    os._exit(0)
+            os.waitpid(pid, 0)
+
+            text = metrics.render()
+            self.assertIn('ingest_uploads_total{status="success"} 3', text)
+            self.assertIn(metrics.ARCHIVE_FILE, os.listdir(directory))
+            self.assertFalse(any(name.startswith(f"{pid}-") for name in os.listdir(directory)))
+            # 두 번째 수집에서도 종료된 프로세스의 값이 그대로 남음
+            self.assertIn('ingest_uploads_total{status="success"} 3', metrics.render())
+
+    def test_anonymous_internal_address_is_allowed(self):
+        self.assertIn("# TYPE http_request_duration_seconds histogram", Client().get("/metrics").content.decode())
+
+    def test_external_address_requires_staff(self):
+        external = {"REMOTE_ADDR": "203.0.113.5"}
+        self.assertEqual(Client().get("/metrics", **external).status_code, 403)
+        self.assertEqual(self.client.get("/metrics", **external).status_code, 403)
+
+        User.objects.create_user(username="staff", password="testpass123", is_staff=True)
+        staff = Client()
+        staff.login(username="staff", password="testpass123")
+        self.assertEqual(staff.get("/metrics", **external).status_code, 200)
+
+    def test_label_values_are_escaped(self):
+        metrics.inc("cache_lookups_total", cache='a"b\\c', result="hit")
+
+        self.assertIn('cache_lookups_total{cache="a\\"b\\\\c",result="hit"} 1', metrics.render())
+
+    def test_recording_costs_microseconds(self):
+        """요청당 기록 비용: 평균 50µs 미만 (실제로는 수 µs)"""
+        rounds = 10000
+        started = time.perf_counter()
+        for _ in range(rounds):
+            metrics.observe_request("api/dashboard/chart-data/", "GET", 200, 0.012, 4)
+        per_request = (time.perf_counter() - started) / rounds
+
+        self.assertLess(per_request, 50e-6)
@@ -0,0 +1,217 @@
+"""Request Timing - Server-Timing header and structured access log
+
+ServerTimingMiddleware samples SERVER_TIMING_SAMPLE_RATE of the requests
+and, for those, adds up where the time went:
+
+- db:        SQL time and query count, measured by an execute wrapper that
+             every database connection gets when it is created
+- session:   the part of db spent on django_session / auth_user queries
+             (sessions served from the cache cost no SQL)
+- service:   data retrieval in the views (timing("service") blocks)
+- serialize: chart building and JSON encoding (timing("serialize") blocks)
+- render:    TemplateResponse rendering
+- app:       the whole request inside Django
+
+Sampled responses carry them as a Server-Timing header (shown by the
+browser devtools' Timing tab). Every request gets one JSON access log line
+on the "apps.monitoring.access" logger, with the timings when sampled, and
+is recorded in the Prometheus metrics (latency and query count by URL
+route, apps/monitoring/metrics.py). Unsampled requests only count their
+queries: one context variable lookup and an increment per query.
+
+Example (a view):
+    from apps.monitoring.timing import timing
+
+    with timing("service"):
+        records = get_dashboard_data(year=2024)
+"""
+
+import json
+import logging
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from . import metrics
+
+access_logger = logging.getLogger("apps.monitoring.access")
+
+# Server-Timing metric order; names not listed here follow in insertion order
+METRIC_ORDER = ("app", "db", "session", "service", "serialize", "render")
+
+# Tables whose queries are counted as session time
+SESSION_TABLES = ('"django_session"', '"auth_user"')
+
+
+class RequestTiming:
+    """Durations (seconds) by metric name and the SQL query count of one request.
+
+    Every request has one; durations are only measured when it is sampled.
+    """
+
+    __slots__ = ("durations", "queries", "sampled")
+
+    def __init__(self, sampled: bool = True) -> None:
+        self.durations: Dict[str, float] = defaultdict(float)
+        self.queries = 0
+        self.sampled = sampled
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] += seconds
+
+    def header(self) -> str:
+        """Server-Timing header value, e.g. 'app;dur=12.3, db;dur=4.1;desc="3 queries"'."""
+        parts = []
+        for name in _ordered(self.durations):
+            part = f"{name};dur={self.durations[name] * 1000:.1f}"
+            if name == "db":
+                part += f';desc="{self.queries} queries"'
+            parts.append(part)
+        return ", ".join(parts)
+
+    def fields(self) -> Dict[str, Any]:
+        """Access log fields: '<metric>_ms' per metric and 'db_queries'."""
+        fields = {f"{name}_ms": round(self.durations[name] * 1000, 2) for name in _ordered(self.durations)}
+        fields["db_queries"] = self.queries
+        return fields
+
+
+def _ordered(durations: Dict[str, float]) -> list:
+    return [name for name in METRIC_ORDER if name in durations] + [
+        name for name in durations if name not in METRIC_ORDER
+    ]
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+def current_timing() -> Optional[RequestTiming]:
+    """The timing of the current request, or None when it is not sampled."""
+    current = _current.get()
+    return current if current is not None and current.sampled else None
+
+
+@contextmanager
+def timing(name: str) -> Iterator[None]:
+    """Add the time spent in the block to a metric of the current (sampled) request."""
+    current = _current.get()
+    if current is None or not current.sampled:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        current.add(name, time.perf_counter() - started)
+
+
+def db_execute_wrapper(execute: Callable, sql: str, params: Any, many: bool, context: Dict[str, Any]) -> Any:
+    """connection.execute_wrapper function counting the queries of requests (timing sampled ones)."""
+    current = _current.get()
+    if current is None:
+        return execute(sql, params, many, context)
+    if not current.sampled:
+        current.queries += 1
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = time.perf_counter() - started
+        current.add("db", elapsed)
+        current.queries += 1
+        if any(table in sql for table in SESSION_TABLES):
+            current.add("session", elapsed)
+
+
+def install_execute_wrapper(sender, connection, **kwargs) -> None:
+    """Receiver for connection_created: wrap every query of the connection.
+
+    Installed for the connection's lifetime rather than per request, so
+    queries that async views run in worker threads are measured too (the
+    request's timing follows them through the context variable).
+    """
+    if db_execute_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(db_execute_wrapper)
+
+
+class ServerTimingMiddleware:
+    """Sample requests, emit Server-Timing, write the access log line and record the metrics."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Callable) -> None:
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request: Any) -> Any:
+        if self.async_mode:
+            return self.__acall__(request)
+        current, token, started = self._start()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, current, started)
+
+    async def __acall__(self, request: Any) -> Any:
+        current, token, started = self._start()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, current, started)
+
+    def process_template_response(self, request: Any, response: Any) -> Any:
+        """Time the render that follows (TemplateResponse renders after the view)."""
+        current = current_timing()
+        if current is not None:
+            started = time.perf_counter()
+            response.add_post_render_callback(
+                lambda rendered: current.add("render", time.perf_counter() - started)
+            )
+        return response
+
+    def _start(self) -> tuple:
+        rate = getattr(settings, "SERVER_TIMING_SAMPLE_RATE", 0.0)
+        sampled = rate >= 1 or (rate > 0 and random.random() < rate)
+        current = RequestTiming(sampled)
+        return current, _current.set(current), time.perf_counter()
+
+    def _finish(self, request: Any, response: Any, current: RequestTiming, started: float) -> Any:
+        elapsed = time.perf_counter() - started
+        entry = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(elapsed * 1000, 2),
+        }
+        if not response.streaming:
+            entry["bytes"] = len(response.content)
+        if current.sampled:
+            current.add("app", elapsed)
+            response["Server-Timing"] = current.header()
+            entry.update(current.fields())
+        metrics.observe_request(
+            _endpoint(request), request.method, response.status_code, elapsed, current.queries
+        )
+        if access_logger.isEnabledFor(logging.INFO):
+            access_logger.info(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+        return response
+
+
+def _endpoint(request: Any) -> str:
+    """Metric label of a request: its URL route (bounded, unlike the path)."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unmatched"
+    return match.route or match.view_name or "unmatched"
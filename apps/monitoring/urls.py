@@ -0,0 +1,15 @@
+"""Monitoring URL Configuration
+
+URL Patterns:
+    - GET /api/monitoring/db-pool/ → DatabasePoolAPIView (staff only)
+"""
+
+from django.urls import path
+
+from .views import DatabasePoolAPIView
+
+app_name = "monitoring"
+
+urlpatterns = [
+    path("db-pool/", DatabasePoolAPIView.as_view(), name="db-pool-api"),
+]
@@ -0,0 +1,62 @@
+"""Monitoring Views - Staff-only runtime introspection endpoints"""
+
+import ipaddress
+from functools import lru_cache
+from typing import Any, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.decorators import method_decorator
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from . import metrics
+from .db import connection_stats
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class DatabasePoolAPIView(APIView):
+    """Staff-only connection and pool statistics of the worker that answers.
+
+    Counters are per worker process; each entry includes the pid.
+
+    URL: GET /api/monitoring/db-pool/
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request: Any) -> Response:
+        return Response({"databases": connection_stats()}, status=status.HTTP_200_OK)
+
+
+@lru_cache(maxsize=8)
+def _networks(allowed: Tuple[str, ...]) -> Tuple[Any, ...]:
+    return tuple(ipaddress.ip_network(network, strict=False) for network in allowed)
+
+
+def _internal_address(request: Any) -> bool:
+    """Whether the client address is in METRICS_ALLOWED_NETWORKS."""
+    try:
+        address = ipaddress.ip_address(request.META.get("REMOTE_ADDR", ""))
+    except ValueError:
+        return False
+    networks = _networks(tuple(getattr(settings, "METRICS_ALLOWED_NETWORKS", ())))
+    return any(address in network for network in networks)
+
+
+@transaction.non_atomic_requests
+def metrics_view(request: Any) -> HttpResponse:
+    """Prometheus metrics of all worker processes, for staff users or internal addresses.
+
+    A scraper on the internal network needs no session; see METRICS_ALLOWED_NETWORKS.
+
+    URL: GET /metrics
+    """
+    if not (_internal_address(request) or request.user.is_staff):
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
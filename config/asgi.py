@@ -3,6 +3,17 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Serving under ASGI (instead of the gunicorn WSGI command in Procfile):
+
+    uvicorn config.asgi:application --host 0.0.0.0 --port $PORT --workers 2
+
+The async views (AsyncChartDataView at /api/dashboard/chart-data-async/)
+then run on each worker's event loop, so slow chart queries no longer hold
+a whole worker; sync views keep working in Django's thread pool. Set
+DB_POOL=true with it: each ASGI request runs its ORM calls in its own
+thread, so persistent connections (CONN_MAX_AGE) are never reused and
+Django recommends a pool instead.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -0,0 +1,135 @@
+"""Authentication Backends - Per-process cache of authenticated users
+
+Every authenticated request loads its user with django.contrib.auth's
+get_user(), which is one auth_user SELECT per request on top of the session
+lookup. CachedModelBackend keeps the loaded users in a small per-process
+dict for AUTH_USER_CACHE_TIMEOUT seconds, so repeated chart API calls from
+the same user skip that query.
+
+Invalidation:
+    - Saving or deleting a user (password change, deactivation, admin edits)
+      writes a new version token for that user to the AUTH_USER_CACHE_ALIAS
+      cache. Every hit compares the token the entry was loaded under with
+      the current one (one cache GET), so a password change in any worker
+      ends the old sessions in all of them on their next request.
+    - Logging out also drops the entry in the process that did it.
+    - The token is only shared when AUTH_USER_CACHE_ALIAS is a shared cache
+      (Redis). Without one (None) the user cache is off, since a per-process
+      LocMem token would only be correct with a single process (runserver).
+
+Example (config/settings.py):
+    AUTHENTICATION_BACKENDS = ["config.auth_backends.CachedModelBackend"]
+    AUTH_USER_CACHE_TIMEOUT = 30  # seconds, 0 disables the cache
+    AUTH_USER_CACHE_ALIAS = "sessions"  # shared cache holding the version tokens
+"""
+
+import copy
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.contrib.auth.signals import user_logged_out
+from django.core.cache import caches
+from django.db.models.signals import post_delete, post_save
+
+from apps.monitoring import metrics
+
+# user_id -> (expires_at on time.monotonic(), version token, user)
+_users: Dict[Any, Tuple[float, Optional[str], Any]] = {}
+_lock = threading.Lock()
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose get_user() / aget_user() are served from a short-lived per-process cache."""
+
+    def get_user(self, user_id: Any) -> Optional[Any]:
+        timeout = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 0)
+        alias = _version_alias()
+        if timeout <= 0 or alias is None:
+            return super().get_user(user_id)
+        # The token is read before the user, so a change during the load is seen on the next request
+        version = caches[alias].get(_version_key(user_id))
+        user = _cached_user(user_id, version)
+        if user is None:
+            user = _remember(user_id, version, super().get_user(user_id), timeout)
+        return user
+
+    async def aget_user(self, user_id: Any) -> Optional[Any]:
+        """Async views (request.auser()) share the same cache."""
+        timeout = getattr(settings, "AUTH_USER_CACHE_TIMEOUT", 0)
+        alias = _version_alias()
+        if timeout <= 0 or alias is None:
+            return await super().aget_user(user_id)
+        version = await caches[alias].aget(_version_key(user_id))
+        user = _cached_user(user_id, version)
+        if user is None:
+            user = _remember(user_id, version, await super().aget_user(user_id), timeout)
+        return user
+
+
+def _version_alias() -> Optional[str]:
+    return getattr(settings, "AUTH_USER_CACHE_ALIAS", None)
+
+
+def _version_key(user_id: Any) -> str:
+    return f"auth_user_version:{user_id}"
+
+
+def _cached_user(user_id: Any, version: Optional[str]) -> Optional[Any]:
+    entry = _users.get(user_id)
+    if entry is not None and entry[0] > time.monotonic() and entry[1] == version:
+        metrics.inc("cache_lookups_total", cache="auth_user", result="hit")
+        # A copy, so attributes set during one request (permission caches) stay with it
+        return copy.copy(entry[2])
+    metrics.inc("cache_lookups_total", cache="auth_user", result="miss")
+    return None
+
+
+def _remember(user_id: Any, version: Optional[str], user: Optional[Any], timeout: float) -> Optional[Any]:
+    if user is None:
+        return None
+    with _lock:
+        if len(_users) >= getattr(settings, "AUTH_USER_CACHE_SIZE", 1000):
+            _users.clear()
+        _users[user_id] = (time.monotonic() + timeout, version, user)
+    return copy.copy(user)
+
+
+def invalidate_user(user_id: Any) -> None:
+    """Drop a user from every process: a new version token makes all cached copies stale."""
+    forget_user(user_id)
+    alias = _version_alias()
+    if alias is not None:
+        # A random token rather than a counter, so an evicted key can never come back with an old value
+        caches[alias].set(_version_key(user_id), uuid.uuid4().hex, None)
+
+
+def forget_user(user_id: Any) -> None:
+    """Drop a user from this process's cache."""
+    with _lock:
+        _users.pop(user_id, None)
+
+
+def clear_user_cache() -> None:
+    """Drop every cached user of this process."""
+    with _lock:
+        _users.clear()
+
+
+def _on_user_changed(sender, instance, **kwargs) -> None:
+    invalidate_user(instance.pk)
+
+
+def _on_logged_out(sender, request, user, **kwargs) -> None:
+    if user is not None:
+        forget_user(user.pk)
+
+
+# Connected on import: a process that never loaded this module has nothing cached
+post_save.connect(_on_user_changed, sender=get_user_model(), dispatch_uid="auth_user_cache_save")
+post_delete.connect(_on_user_changed, sender=get_user_model(), dispatch_uid="auth_user_cache_delete")
+user_logged_out.connect(_on_logged_out, dispatch_uid="auth_user_cache_logout")
@@ -0,0 +1,150 @@
+"""Database Router - Dashboard reads on a read replica, everything else on the primary
+
+Views decorated with read_from_replica (dashboard page, chart API, export)
+read the ingest / dashboard tables from the READ_REPLICA_ALIAS database, so
+a long ingest transaction on the primary does not slow them down. Every
+write, every read outside those views (ingest, admin, sessions, users) and
+every read inside a transaction stays on the primary ("default").
+
+Read-your-writes:
+    A successful write request (POST / PUT / PATCH / DELETE, e.g. an admin
+    upload) sets a short-lived cookie, and for REPLICA_PIN_SECONDS that
+    browser session reads from the primary, so the uploading admin sees the
+    new data before the replica has replayed it. Other users may see the
+    previous data version for up to the replication lag; chart caches are
+    keyed by the data version read from the same replica, so they stay
+    consistent with it.
+
+Example (config/settings.py):
+    DATABASE_ROUTERS = ["config.db_router.PrimaryReplicaRouter"]
+    READ_REPLICA_ALIAS = "replica"  # None disables the routing
+    REPLICA_PIN_SECONDS = 15
+    MIDDLEWARE = [..., "config.db_router.primary_pinning_middleware", ...]
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Iterator, Optional
+
+from asgiref.sync import iscoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.utils.decorators import sync_and_async_middleware
+
+# Apps whose tables are read from the replica inside read_from_replica views
+REPLICA_APPS = {"ingest", "dashboard"}
+
+# Cookie marking a browser session that wrote recently (value is irrelevant)
+PIN_COOKIE = "db_primary"
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+_replica_reads: ContextVar[bool] = ContextVar("replica_reads", default=False)
+_pinned: ContextVar[bool] = ContextVar("pinned_to_primary", default=False)
+
+
+def replica_alias() -> Optional[str]:
+    """The configured read replica alias, or None when routing is disabled."""
+    alias = getattr(settings, "READ_REPLICA_ALIAS", None)
+    return alias if alias and alias in settings.DATABASES else None
+
+
+@contextmanager
+def replica_reads() -> Iterator[None]:
+    """Route the ingest / dashboard reads made inside the block to the replica."""
+    token = _replica_reads.set(True)
+    try:
+        yield
+    finally:
+        _replica_reads.reset(token)
+
+
+def read_from_replica(view: Callable) -> Callable:
+    """Decorator for (sync or async) view functions and methods: see replica_reads()."""
+    if iscoroutinefunction(view):
+
+        @wraps(view)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            with replica_reads():
+                return await view(*args, **kwargs)
+
+        return async_wrapper
+
+    @wraps(view)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with replica_reads():
+            return view(*args, **kwargs)
+
+    return wrapper
+
+
+class PrimaryReplicaRouter:
+    """Reads inside replica_reads() go to the replica unless pinned or in a transaction."""
+
+    def db_for_read(self, model: Any, **hints: Any) -> str:
+        alias = replica_alias()
+        if (
+            alias is not None
+            and _replica_reads.get()
+            and not _pinned.get()
+            and model._meta.app_label in REPLICA_APPS
+            # A transaction must see its own writes
+            and not connections[DEFAULT_DB_ALIAS].in_atomic_block
+        ):
+            return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any) -> bool:
+        # The replica receives the schema through replication
+        return db == DEFAULT_DB_ALIAS
+
+
+@sync_and_async_middleware
+def primary_pinning_middleware(get_response: Callable) -> Callable:
+    """Pin a browser session to the primary for REPLICA_PIN_SECONDS after it wrote."""
+
+    def process_response(request: Any, response: Any) -> Any:
+        if (
+            replica_alias() is not None
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+        ):
+            response.set_cookie(
+                PIN_COOKIE,
+                "1",
+                max_age=getattr(settings, "REPLICA_PIN_SECONDS", 15),
+                httponly=True,
+                samesite="Lax",
+                secure=request.is_secure(),
+            )
+        return response
+
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request: Any) -> Any:
+            token = _pinned.set(PIN_COOKIE in request.COOKIES)
+            try:
+                response = await get_response(request)
+            finally:
+                _pinned.reset(token)
+            return process_response(request, response)
+
+        return middleware
+
+    def middleware(request: Any) -> Any:
+        token = _pinned.set(PIN_COOKIE in request.COOKIES)
+        try:
+            response = get_response(request)
+        finally:
+            _pinned.reset(token)
+        return process_response(request, response)
+
+    return middleware
@@ -79,6 +79,8 @@ INSTALLED_APPS = [
 
     'apps.dashboard',
 
+    'apps.monitoring',
+
     'apps.ingest',
 
 ]
@@ -91,8 +93,13 @@ MIDDLEWARE = [
 
     'whitenoise.middleware.WhiteNoiseMiddleware',  # Whitenoise for static files
 
+    # Server-Timing header + JSON access log (apps/monitoring/timing.py); static files are served above it
+    'apps.monitoring.timing.ServerTimingMiddleware',
+
     'django.contrib.sessions.middleware.SessionMiddleware',
 
+    'config.db_router.primary_pinning_middleware',  # read-your-writes for the read replica
+
     'django.middleware.common.CommonMiddleware',
 
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -162,7 +169,14 @@ if os.getenv('USE_SQLITE', 'false').lower() == 'true' or 'test' in sys.argv:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
-        }
+        },
+        # 같은 파일을 가리키는 두 번째 별칭: 복제본 라우팅(config/db_router.py)을 로컬에서 시험할 때 사용
+        # READ_REPLICA=true 일 때만 라우팅됨. 테스트에서는 default의 미러
+        'replica': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'TEST': {'MIRROR': 'default'},
+        },
     }
 else:
     # Supabase PostgreSQL 연결 설정
@@ -206,6 +220,62 @@ else:
             }
         }
 
+    # Read replica (읽기 전용 복제본): 대시보드 조회만 라우팅, 쓰기와 인제스트는 primary
+    replica_url = os.getenv('DATABASE_REPLICA_URL')
+    if replica_url:
+        DATABASES['replica'] = dj_database_url.parse(
+            replica_url,
+            conn_max_age=DATABASES['default'].get('CONN_MAX_AGE', 600),
+            conn_health_checks=True,
+        )
+        DATABASES['replica']['OPTIONS'] = {
+            'sslmode': 'require',
+            'connect_timeout': 10,
+        }
+        DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+    # Connection pool (psycopg 3 + psycopg_pool, Django 5.1+)
+    # 워커 프로세스마다 풀 하나. max_size는 워커당 동시 요청 수(gunicorn threads) 이상이면 충분
+    # 풀을 쓰면 CONN_MAX_AGE 영구 연결은 꺼야 함. 상태는 /api/monitoring/db-pool/ 에서 확인
+    # psycopg 3는 requirements-pool.txt로만 설치 (설치되면 Django가 psycopg2 대신 사용, docs/database.md)
+    if os.getenv('DB_POOL', 'false').lower() == 'true':
+        try:
+            from psycopg_pool import ConnectionPool
+        except ImportError:
+            from django.core.exceptions import ImproperlyConfigured
+
+            raise ImproperlyConfigured(
+                'DB_POOL=true needs psycopg 3 and psycopg_pool: pip install -r requirements-pool.txt'
+            )
+
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        DATABASES['default']['CONN_HEALTH_CHECKS'] = False
+        DATABASES['default']['OPTIONS']['pool'] = {
+            'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '1')),
+            'max_size': int(os.getenv('DB_POOL_MAX_SIZE', os.getenv('GUNICORN_THREADS', '4'))),
+            # Seconds a request waits for a free connection before failing
+            'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            # Idle connections above min_size are closed after this many seconds
+            'max_idle': float(os.getenv('DB_POOL_MAX_IDLE', '300')),
+            # Replaces CONN_HEALTH_CHECKS: checked when handed out
+            'check': ConnectionPool.check_connection,
+        }
+        if 'replica' in DATABASES:
+            DATABASES['replica']['CONN_MAX_AGE'] = 0
+            DATABASES['replica']['CONN_HEALTH_CHECKS'] = False
+            DATABASES['replica']['OPTIONS']['pool'] = dict(DATABASES['default']['OPTIONS']['pool'])
+
+# Read replica routing (config/db_router.py)
+# 대시보드/차트/내보내기 조회는 replica, 쓰기 후 REPLICA_PIN_SECONDS 동안 해당 브라우저는 primary
+DATABASE_ROUTERS = ['config.db_router.PrimaryReplicaRouter']
+READ_REPLICA_ALIAS = (
+    'replica'
+    if 'replica' in DATABASES
+    and os.getenv('READ_REPLICA', 'true' if os.getenv('DATABASE_REPLICA_URL') else 'false').lower() == 'true'
+    else None
+)
+REPLICA_PIN_SECONDS = int(os.getenv('REPLICA_PIN_SECONDS', '15'))
+
 
 
 
@@ -301,3 +371,110 @@ LOGIN_REDIRECT_URL = '/dashboard/'
 LOGIN_URL = '/login/'
 
 
+
+# Ingest instrumentation (apps/ingest/instrumentation.py)
+# 업로드 단계별 시간/메모리 측정. 느린 단계는 상위 메모리 할당 위치도 기록
+# tracemalloc은 추적 중 프로세스의 모든 스레드를 느리게 하므로 운영 기본값은 꺼짐
+
+INGEST_TRACE_MEMORY = os.getenv('INGEST_TRACE_MEMORY', 'true' if DEBUG else 'false').lower() == 'true'
+
+INGEST_SLOW_STAGE_SECONDS = float(os.getenv('INGEST_SLOW_STAGE_SECONDS', '2.0'))
+
+INGEST_TOP_ALLOCATIONS = 10
+
+
+
+# Chart API response cache (apps/dashboard/cache.py)
+# 키에 데이터 버전이 포함되므로 워커별 LocMem 캐시여도 업로드 직후 stale 응답이 없음
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'vms-default',
+    },
+}
+
+CHART_CACHE_ALIAS = 'default'
+
+CHART_CACHE_TIMEOUT = int(os.getenv('CHART_CACHE_TIMEOUT', '3600'))
+
+
+
+# Sessions and authenticated users on the API hot path (config/auth_backends.py)
+# cached_db 세션은 SESSION_CACHE_ALIAS 캐시에서 읽고 DB에는 쓰기만 함.
+# 로그아웃이 모든 워커에 보여야 하므로 공유 캐시(SESSION_CACHE_URL, Redis)가 있을 때만 기본값으로 사용
+
+SESSION_CACHE_URL = os.getenv('SESSION_CACHE_URL')
+
+if SESSION_CACHE_URL:
+    CACHES['sessions'] = {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': SESSION_CACHE_URL,
+    }
+
+SESSION_CACHE_ALIAS = 'sessions' if SESSION_CACHE_URL else 'default'
+
+SESSION_ENGINE = os.getenv(
+    'SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if SESSION_CACHE_URL else 'django.contrib.sessions.backends.db',
+)
+
+# 인증된 사용자를 워커별로 잠시 캐시 (0이면 끔). ModelBackend는 전환 전에 만들어진 세션이 계속 유효하도록 남겨 둠
+# 비밀번호 변경 등은 AUTH_USER_CACHE_ALIAS 캐시의 사용자별 버전으로 모든 워커에 즉시 반영.
+# 공유 캐시(Redis)가 없으면 운영에서는 사용자 캐시를 끔 (LocMem 버전은 단일 프로세스에서만 정확)
+
+AUTHENTICATION_BACKENDS = [
+    'config.auth_backends.CachedModelBackend',
+    'django.contrib.auth.backends.ModelBackend',
+]
+
+AUTH_USER_CACHE_TIMEOUT = int(os.getenv('AUTH_USER_CACHE_TIMEOUT', '30'))
+
+AUTH_USER_CACHE_ALIAS = os.getenv('AUTH_USER_CACHE_ALIAS') or (
+    'sessions' if SESSION_CACHE_URL else 'default' if DEBUG else None
+)
+
+AUTH_USER_CACHE_SIZE = 1000
+
+# Request timing (apps/monitoring/timing.py)
+# 샘플링된 요청에만 Server-Timing 헤더(db, session, service, serialize, render)를 붙임. 0이면 끔
+# 액세스 로그는 모든 요청에 대해 JSON 한 줄 (샘플링된 요청은 타이밍 포함)
+
+SERVER_TIMING_SAMPLE_RATE = float(os.getenv('SERVER_TIMING_SAMPLE_RATE', '1.0' if DEBUG else '0.01'))
+
+# Prometheus metrics (apps/monitoring/metrics.py) - GET /metrics
+# METRICS_DIR: 워커별 스냅샷을 모아 합산하는 디렉터리 (gunicorn.conf.py가 설정). 없으면 현재 프로세스만
+# 스태프가 아니면 METRICS_ALLOWED_NETWORKS의 주소에서만 접근 가능. 프록시 뒤의 REMOTE_ADDR는
+# 프록시 주소이므로 공개 도메인이 아니라 내부 주소로 직접 수집할 것
+
+METRICS_DIR = os.getenv('METRICS_DIR') or None
+
+METRICS_FLUSH_SECONDS = float(os.getenv('METRICS_FLUSH_SECONDS', '5'))
+
+METRICS_ALLOWED_NETWORKS = [
+    network.strip()
+    for network in os.getenv('METRICS_ALLOWED_NETWORKS', '127.0.0.0/8,::1/128').split(',')
+    if network.strip()
+]
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'access': {
+            'class': 'logging.StreamHandler',
+            'stream': 'ext://sys.stdout',
+            'formatter': 'message',
+        },
+    },
+    'loggers': {
+        'apps.monitoring.access': {
+            'handlers': ['access'],
+            'level': os.getenv('ACCESS_LOG_LEVEL', 'INFO'),
+            'propagate': False,
+        },
+    },
+}
@@ -10,6 +10,7 @@ from django.views.generic import RedirectView, TemplateView
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.decorators import login_required
 from apps.dashboard.views import logout_view
+from apps.monitoring.views import metrics_view
 
 urlpatterns = [
     path("admin/", admin.site.urls),
@@ -28,6 +29,10 @@ urlpatterns = [
     # They are differentiated by path, not by separate includes
     path("dashboard/", include("apps.dashboard.urls", namespace="dashboard")),
     path("api/dashboard/", include("apps.dashboard.urls", namespace="api_dashboard")),
+    # Staff-only runtime statistics (connection pool, ...)
+    path("api/monitoring/", include("apps.monitoring.urls", namespace="monitoring")),
+    # Prometheus scrape endpoint (staff or METRICS_ALLOWED_NETWORKS)
+    path("metrics", metrics_view, name="metrics"),
     # Root path - redirect authenticated users to dashboard, others to login
     path("", RedirectView.as_view(url="/dashboard/", permanent=False), name="home"),
 ]
@@ -0,0 +1,116 @@
+"""Process Warmup - Load everything a first request would, before gunicorn forks
+
+With preload_app (see gunicorn.conf.py) the master process imports Django
+once, runs warm_up() and then forks the workers, so every worker starts
+with the URL resolvers populated, the templates compiled, pandas / numpy
+imported and the ingest lookup tables built. Those pages are shared
+copy-on-write between the workers instead of being rebuilt (and held)
+by each of them, and no user pays for them on a worker's first request.
+
+warm_up() must not touch the database: a connection (or a DB_POOL pool
+and its threads) opened in the master would be inherited by every worker.
+
+Example (gunicorn.conf.py):
+    def when_ready(server):
+        from config.warmup import warm_up
+
+        warm_up()
+"""
+
+import gc
+import importlib
+import logging
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable
+
+from django.conf import settings
+from django.db import connections
+from django.template import engines
+from django.urls import URLResolver, get_resolver
+
+logger = logging.getLogger(__name__)
+
+# Heavy imports that request handlers otherwise import lazily on first use
+LAZY_MODULES = (
+    "numpy",
+    "pandas",
+    "openpyxl",  # pandas' xlsx reader, when installed
+    "apps.ingest.services",  # department / metric alias tables
+)
+
+
+def warm_up() -> Dict[str, Any]:
+    """
+    Populate URL resolvers, compile templates and import the lazy modules.
+
+    Returns:
+        dict: Counts of what was loaded and the elapsed seconds (for logging)
+    """
+    started = time.perf_counter()
+    summary = {
+        "url_patterns": _warm_resolver(get_resolver()),
+        "templates": _warm_templates(),
+        "modules": _import_modules(LAZY_MODULES),
+    }
+
+    # Page ETag input, otherwise computed on the first dashboard request
+    from apps.dashboard.views import _page_template_revision
+
+    _page_template_revision()
+
+    # Nothing above should have connected; make sure no socket is inherited by the workers
+    connections.close_all()
+    summary["seconds"] = round(time.perf_counter() - started, 3)
+    logger.info("warm-up done: %s", summary)
+    return summary
+
+
+def freeze_heap() -> None:
+    """Move every object allocated so far out of the collector's reach (gc.freeze).
+
+    The workers' garbage collections then never write to the objects
+    inherited from the master, which would otherwise copy their pages.
+    """
+    gc.collect()
+    gc.freeze()
+
+
+def _warm_resolver(resolver: URLResolver) -> int:
+    """Compile every URL pattern regex and build the reverse lookup tables."""
+    count = 0
+    resolver.reverse_dict  # noqa: B018 (populates the resolver and its namespaces)
+    for pattern in resolver.url_patterns:
+        pattern.pattern.regex  # noqa: B018 (compiled lazily on first access)
+        if isinstance(pattern, URLResolver):
+            count += _warm_resolver(pattern)
+        else:
+            count += 1
+    return count
+
+
+def _warm_templates() -> int:
+    """Compile the project's templates into the cached template loader."""
+    base_dir = Path(settings.BASE_DIR)
+    count = 0
+    for engine in engines.all():
+        for directory in engine.template_dirs:
+            directory = Path(directory)
+            # Project templates only; Django's own (admin) load on the rare requests that use them
+            if base_dir not in directory.parents:
+                continue
+            for path in sorted(directory.rglob("*.html")):
+                engine.get_template(path.relative_to(directory).as_posix())
+                count += 1
+    return count
+
+
+def _import_modules(names: Iterable[str]) -> int:
+    count = 0
+    for name in names:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        count += 1
+    return count
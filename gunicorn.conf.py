@@ -0,0 +1,173 @@
+"""Gunicorn configuration - preloaded, warmed-up app with sized gthread workers
+
+Loaded automatically by gunicorn from the working directory (Procfile:
+``gunicorn config.wsgi:application -c gunicorn.conf.py``).
+
+- preload_app: Django is imported once in the master; config.warmup then
+  populates the URL resolvers, compiles the templates and imports pandas /
+  numpy and the ingest tables before the first fork, and gc.freeze() keeps
+  those pages shared copy-on-write between the workers.
+- 2 workers x GUNICORN_THREADS threads by default (as the old Procfile's
+  --workers 2). WEB_CONCURRENCY=auto sizes the workers from the CPUs and the
+  memory limit of the container (cgroup) instead. Every thread can hold a
+  persistent database connection (CONN_MAX_AGE), so DB_MAX_CONNECTIONS,
+  when set, caps workers x threads.
+- Workers are recycled after GUNICORN_MAX_REQUESTS requests, and right
+  after a request that left them above GUNICORN_MAX_WORKER_RSS_MB (pandas
+  uploads grow the heap and never give it back).
+
+Environment (all optional):
+    PORT                        Listen port (default 8000)
+    WEB_CONCURRENCY             Worker processes (default 2; "auto" = from CPUs and memory)
+    GUNICORN_THREADS            Threads per worker (default 4; 1 = sync workers)
+    DB_MAX_CONNECTIONS          Database connections this server may hold; caps workers x threads
+    GUNICORN_WORKER_CLASS       Override, e.g. uvicorn.workers.UvicornWorker
+    GUNICORN_WORKER_MEMORY_MB   Memory budget per worker for sizing (default 300)
+    GUNICORN_MAX_WORKER_RSS_MB  Recycle a worker above this RSS (default 2x budget)
+    GUNICORN_MAX_REQUESTS       Recycle after this many requests (default 2000, 0 = never)
+    GUNICORN_TIMEOUT            Worker timeout in seconds (default 120, for large uploads)
+    GUNICORN_ACCESS_LOG         gunicorn's own access log (default off, "-" for stdout)
+    METRICS_DIR                 Per-worker metrics snapshots summed by /metrics
+                                (default /dev/shm/vms-metrics, emptied at start)
+"""
+
+import os
+import shutil
+import tempfile
+
+# --- sizing -----------------------------------------------------------------
+
+
+def _cpu_count() -> int:
+    """CPUs this process may run on (cgroup cpu.max quota when lower)."""
+    try:
+        count = len(os.sched_getaffinity(0))
+    except AttributeError:
+        count = os.cpu_count() or 1
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            count = min(count, max(1, int(quota) // int(period)))
+    except (OSError, ValueError):
+        pass
+    return count
+
+
+def _memory_limit_mb() -> int:
+    """Container memory limit (cgroup v2 / v1), else the physical memory."""
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        # "max" and the v1 "no limit" value (close to 2**63) mean unlimited
+        if value.isdigit() and int(value) < 1 << 60:
+            return int(value) // (1024 * 1024)
+    return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") // (1024 * 1024)
+
+
+_worker_memory_mb = int(os.getenv("GUNICORN_WORKER_MEMORY_MB", "300"))
+_cpus = _cpu_count()
+
+DEFAULT_WORKERS = 2
+
+
+def _auto_workers() -> int:
+    """2 x CPUs + 1, but never more than the memory allows (the master counts as one)."""
+    return max(1, min(2 * _cpus + 1, _memory_limit_mb() // _worker_memory_mb - 1))
+
+
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+_web_concurrency = os.getenv("WEB_CONCURRENCY", "").strip().lower()
+if _web_concurrency == "auto":
+    workers = _auto_workers()
+elif _web_concurrency:
+    workers = int(_web_concurrency)
+else:
+    workers = DEFAULT_WORKERS
+
+# 스레드마다 DB 커넥션을 유지하므로 (CONN_MAX_AGE) workers x threads가 DB 한도를 넘지 않게 제한
+_db_max_connections = int(os.getenv("DB_MAX_CONNECTIONS", "0"))
+if _db_max_connections > 0:
+    threads = min(threads, _db_max_connections)
+    workers = max(1, min(workers, _db_max_connections // threads))
+worker_class = os.getenv("GUNICORN_WORKER_CLASS") or ("gthread" if threads > 1 else "sync")
+
+# The DB_POOL max size defaults to the thread count (config/settings.py reads this)
+os.environ.setdefault("GUNICORN_THREADS", str(threads))
+
+# Every worker writes its Prometheus metrics here; /metrics sums them (apps/monitoring/metrics.py)
+_shm = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+os.environ.setdefault("METRICS_DIR", os.path.join(_shm, "vms-metrics"))
+
+# --- server -----------------------------------------------------------------
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+preload_app = True
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = 30
+keepalive = 5
+# Heartbeat file on tmpfs: a slow container disk must not look like a hung worker
+worker_tmp_dir = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "2000"))
+max_requests_jitter = max_requests // 10
+max_worker_rss_mb = int(os.getenv("GUNICORN_MAX_WORKER_RSS_MB", str(2 * _worker_memory_mb)))
+
+# Django writes the structured access log (apps/monitoring/timing.py); set this to "-" for gunicorn's too
+accesslog = os.getenv("GUNICORN_ACCESS_LOG") or None
+errorlog = "-"
+
+# --- hooks ------------------------------------------------------------------
+
+
+def on_starting(server):
+    """Master, before loading the app: drop the metrics of a previous server run."""
+    shutil.rmtree(os.environ["METRICS_DIR"], ignore_errors=True)
+
+
+def when_ready(server):
+    """Master, after the preloaded app is imported and before the first fork."""
+    if not server.cfg.preload_app:
+        return
+    from config.warmup import freeze_heap, warm_up
+
+    server.log.info("warm-up: %s", warm_up())
+    freeze_heap()
+    server.log.info(
+        "%s %s worker(s) x %s thread(s) (%s CPUs, DB_MAX_CONNECTIONS %s)",
+        workers, worker_class, threads, _cpus, _db_max_connections or "unset",
+    )
+
+
+def post_worker_init(worker):
+    """Without preload_app each worker warms itself up before taking requests."""
+    if not worker.cfg.preload_app:
+        from config.warmup import warm_up
+
+        warm_up()
+
+
+def worker_exit(server, worker):
+    """Write the worker's last metrics so a recycled worker's counts are kept."""
+    from apps.monitoring.metrics import flush
+
+    flush()
+
+
+def post_request(worker, req, environ, resp):
+    """Recycle the worker once it is done if a request (an upload) left its heap this large."""
+    if max_worker_rss_mb > 0 and _rss_mb() > max_worker_rss_mb and worker.alive:
+        worker.log.info("worker %s above %s MB RSS, recycling", worker.pid, max_worker_rss_mb)
+        worker.alive = False
+
+
+def _rss_mb() -> int:
+    """Current resident set size of this process (Linux), 0 when unknown."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return 0
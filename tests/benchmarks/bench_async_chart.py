@@ -0,0 +1,134 @@
+"""Load test: sync (WSGI) vs async (ASGI) chart API under many concurrent clients
+
+Not collected by pytest (file name does not match python_files). Opens
+--concurrency simultaneous HTTP clients (asyncio, one connection per
+request) against a running server and prints throughput and the p50 / p95 /
+p99 latency. Requests rotate through --unique distinct filter combinations
+(year ranges x moving average windows), so most of them miss the response
+cache and run a real chart query, like a dashboard under load.
+
+The session cookie is created directly in the configured database, so run
+the script with the same settings / DB_* environment as the server. Start
+one deployment at a time and point the script at its chart endpoint:
+
+    # sync: the Procfile command
+    gunicorn config.wsgi:application --workers 2 --bind 127.0.0.1:8000
+    python -m tests.benchmarks.bench_async_chart --username admin --path /api/dashboard/chart-data/
+
+    # async: see config/asgi.py
+    DB_POOL=true uvicorn config.asgi:application --workers 2 --port 8000
+    python -m tests.benchmarks.bench_async_chart --username admin --path /api/dashboard/chart-data-async/
+
+실행 방법:
+    python -m tests.benchmarks.bench_async_chart --username admin --concurrency 200 --requests 4000
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from itertools import product
+from typing import List, Tuple
+from urllib.parse import urlsplit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.test import Client  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--username", required=True, help="Existing user the requests are made as")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--path", default="/api/dashboard/chart-data-async/")
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=4_000)
+    parser.add_argument("--unique", type=int, default=400, help="Distinct filter combinations to rotate through")
+    args = parser.parse_args()
+
+    # force_login stores the session where the server reads it (same SESSION_ENGINE / DB)
+    client = Client()
+    client.force_login(get_user_model().objects.get(username=args.username))
+    cookie = f"{settings.SESSION_COOKIE_NAME}={client.cookies[settings.SESSION_COOKIE_NAME].value}"
+
+    paths = [f"{args.path}?{query}" for query in _queries(args.unique)]
+    statuses, latencies, wall = asyncio.run(
+        _run(urlsplit(args.base_url), paths, cookie, args.concurrency, args.requests)
+    )
+
+    latencies.sort()
+    errors = sum(1 for status in statuses if status != 200)
+    print(f"{args.base_url}{args.path}: {args.concurrency} clients, {len(latencies)} requests, {errors} errors")
+    print(f"throughput: {len(latencies) / wall:.0f} req/s")
+    print(
+        f"p50: {_percentile(latencies, 50) * 1000:.1f} ms, p95: {_percentile(latencies, 95) * 1000:.1f} ms, "
+        f"p99: {_percentile(latencies, 99) * 1000:.1f} ms, max: {latencies[-1] * 1000:.1f} ms"
+    )
+
+
+def _queries(count: int) -> List[str]:
+    """Distinct chart filters: year ranges of the default chart and of moving averages."""
+    ranges = [(first, last) for first, last in product(range(2000, 2031), repeat=2) if first <= last]
+    queries = []
+    for (first, last), derive in product(ranges, ("", "&derive=moving_avg&window=3", "&shape=grid")):
+        queries.append(f"year_from={first}&year_to={last}{derive}")
+        if len(queries) == count:
+            break
+    return queries
+
+
+async def _run(
+    url, paths: List[str], cookie: str, concurrency: int, total: int
+) -> Tuple[List[int], List[float], float]:
+    """Keep `concurrency` requests in flight until `total` have completed."""
+    statuses: List[int] = []
+    latencies: List[float] = []
+    counter = iter(range(total))
+
+    async def client() -> None:
+        for index in counter:
+            started = time.perf_counter()
+            statuses.append(await _get(url, paths[index % len(paths)], cookie))
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    return statuses, latencies, time.perf_counter() - started
+
+
+async def _get(url, path: str, cookie: str) -> int:
+    """One HTTP/1.1 GET on a fresh connection; returns the status code (0 on connection errors)."""
+    try:
+        reader, writer = await asyncio.open_connection(url.hostname, url.port or 80)
+    except OSError:
+        return 0
+    try:
+        writer.write(
+            (
+                f"GET {path} HTTP/1.1\r\nHost: {url.hostname}\r\nCookie: {cookie}\r\n"
+                "Accept-Encoding: gzip\r\nConnection: close\r\n\r\n"
+            ).encode("ascii")
+        )
+        await writer.drain()
+        status_line = await reader.readline()
+        await reader.read()
+        return int(status_line.split()[1]) if status_line else 0
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+
+def _percentile(ordered, percent: int) -> float:
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+if __name__ == "__main__":
+    main()
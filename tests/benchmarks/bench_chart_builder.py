@@ -0,0 +1,55 @@
+"""Microbenchmark for build_chart
+
+Not collected by pytest (file name does not match python_files). Builds each
+chart shape from synthetic records at increasing sizes and prints the time
+per record, which should stay flat if the builder scales linearly.
+
+실행 방법:
+    python -m tests.benchmarks.bench_chart_builder
+    python -m tests.benchmarks.bench_chart_builder --sizes 10000 100000 1000000
+"""
+
+import argparse
+import random
+import time
+from decimal import Decimal
+
+from apps.dashboard.utils.chart_builder import SHAPES, build_chart
+
+
+def make_records(count: int, years: int = 20, departments: int = 50, metric_types: int = 12):
+    """Synthetic get_dashboard_data() rows with Decimal values."""
+    rng = random.Random(count)
+    return [
+        {
+            "year": 2000 + rng.randrange(years),
+            "department": f"dept-{rng.randrange(departments)}",
+            "metric_type": f"METRIC_{rng.randrange(metric_types)}",
+            "metric_value": Decimal(rng.randrange(100000)) / 100,
+        }
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'records':>10} {'shape':>22} {'best ms':>10} {'ns/record':>10}")
+    for size in args.sizes:
+        records = make_records(size)
+        for shape in SHAPES:
+            best = min(_timed(records, shape) for _ in range(args.repeat))
+            print(f"{size:>10} {shape:>22} {best * 1000:>10.1f} {best * 1e9 / size:>10.0f}")
+
+
+def _timed(records, shape: str) -> float:
+    started = time.perf_counter()
+    build_chart(records, shape)
+    return time.perf_counter() - started
+
+
+if __name__ == "__main__":
+    main()
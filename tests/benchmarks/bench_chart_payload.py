@@ -0,0 +1,103 @@
+"""Benchmark: DRF-rendered chart responses vs pre-encoded payload variants
+
+Not collected by pytest (file name does not match python_files). Builds a
+chart payload once, then serves it repeatedly through
+- drf:       an APIView returning Response(payload) (content negotiation,
+             JSONRenderer, no compression), the chart API before pre-encoding
+- identity / gzip / br: views._encoded_response with the variants from
+             encoding.encode_variants (br only when brotli is installed)
+and prints bytes sent, CPU time per request and p50 / p99 latency. No
+database access is involved; the cost of producing the payload itself is
+the same for both paths and excluded.
+
+실행 방법:
+    python -m tests.benchmarks.bench_chart_payload
+    python -m tests.benchmarks.bench_chart_payload --records 50000 --requests 5000
+"""
+
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.test import RequestFactory  # noqa: E402
+from rest_framework.response import Response  # noqa: E402
+from rest_framework.views import APIView  # noqa: E402
+
+from apps.dashboard.encoding import ENCODING_BROTLI, encode_variants  # noqa: E402
+from apps.dashboard.utils.chart_builder import SHAPE_DEPARTMENT_BY_YEAR, build_chart  # noqa: E402
+from apps.dashboard.views import _encoded_response  # noqa: E402
+
+from .bench_chart_builder import make_records  # noqa: E402
+
+
+class RenderedChartView(APIView):
+    """The previous response path: the payload dict rendered by DRF per request."""
+
+    authentication_classes = []
+    permission_classes = []
+    payload = None
+
+    def get(self, request):
+        return Response(self.payload)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=2_000)
+    args = parser.parse_args()
+
+    payload = build_chart(make_records(args.records), SHAPE_DEPARTMENT_BY_YEAR)
+    variants = encode_variants(payload)
+    factory = RequestFactory()
+
+    drf_view = RenderedChartView.as_view(payload=payload)
+
+    def drf(request):
+        response = drf_view(request)
+        response.render()
+        return response
+
+    def encoded(request):
+        return _encoded_response(request, variants, "HIT", '"bench"', None)
+
+    cases = [("drf", drf, ""), ("identity", encoded, ""), ("gzip", encoded, "gzip")]
+    if ENCODING_BROTLI in variants:
+        cases.append(("br", encoded, "br, gzip"))
+
+    print(f"payload: {len(payload['datasets'])} datasets, {len(payload['labels'])} labels")
+    print(f"{'path':>10} {'bytes':>10} {'cpu us/req':>11} {'p50 us':>9} {'p99 us':>9}")
+    for name, serve, accept_encoding in cases:
+        request = factory.get("/api/dashboard/chart-data/", HTTP_ACCEPT_ENCODING=accept_encoding)
+        size, cpu, latencies = _measure(serve, request, args.requests)
+        print(
+            f"{name:>10} {size:>10} {cpu * 1e6:>11.1f} "
+            f"{_percentile(latencies, 50) * 1e6:>9.1f} {_percentile(latencies, 99) * 1e6:>9.1f}"
+        )
+
+
+def _measure(serve, request, count: int):
+    """Bytes of one response, CPU seconds per request and the sorted wall-clock latencies."""
+    size = len(serve(request).content)
+    latencies = []
+    cpu_started = time.process_time()
+    for _ in range(count):
+        started = time.perf_counter()
+        serve(request)
+        latencies.append(time.perf_counter() - started)
+    cpu = (time.process_time() - cpu_started) / count
+    latencies.sort()
+    return size, cpu, latencies
+
+
+def _percentile(ordered, percent: int) -> float:
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+if __name__ == "__main__":
+    main()
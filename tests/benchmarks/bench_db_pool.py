@@ -0,0 +1,104 @@
+"""Load test: connection setups and latency with and without the connection pool
+
+Not collected by pytest (file name does not match python_files). Runs
+concurrent chart API requests through the Django test client against the
+configured database, the way gunicorn gthread workers would, and prints the
+number of physical connection setups and the p50 / p99 latency. Run it
+once per mode against a local PostgreSQL with data loaded:
+
+    DB_HOST=localhost DB_PORT=5432 ... python -m tests.benchmarks.bench_db_pool --username admin
+    DB_POOL=true DB_POOL_MAX_SIZE=4 DB_HOST=localhost ... python -m tests.benchmarks.bench_db_pool --username admin
+
+Without a pool each request thread holds its own connection (CONN_MAX_AGE)
+or opens one per request (--conn-max-age 0); with DB_POOL=true the threads
+share the pool's connections.
+
+실행 방법:
+    python -m tests.benchmarks.bench_db_pool --username admin --threads 8 --requests 2000
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.db import close_old_connections, connections  # noqa: E402
+from django.test import Client  # noqa: E402
+
+from apps.monitoring.db import connection_stats  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--username", required=True, help="Existing user the requests are made as")
+    parser.add_argument("--url", default="/api/dashboard/chart-data/?metric_type=PAPER")
+    parser.add_argument("--host", default="localhost", help="Host header (must be in ALLOWED_HOSTS)")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=2_000)
+    parser.add_argument("--conn-max-age", type=int, default=None, help="Override CONN_MAX_AGE (unpooled)")
+    args = parser.parse_args()
+
+    if args.conn_max_age is not None:
+        settings.DATABASES["default"]["CONN_MAX_AGE"] = args.conn_max_age
+        connections["default"].settings_dict["CONN_MAX_AGE"] = args.conn_max_age
+
+    user = get_user_model().objects.get(username=args.username)
+    local = threading.local()
+    latencies = []
+    lock = threading.Lock()
+
+    def request(_):
+        client = getattr(local, "client", None)
+        if client is None:
+            client = local.client = Client(HTTP_HOST=args.host)
+            client.force_login(user)
+        started = time.perf_counter()
+        response = client.get(args.url)
+        # The test client skips the request_finished cleanup; run it like the WSGI handler does
+        close_old_connections()
+        elapsed = time.perf_counter() - started
+        if response.status_code != 200:
+            raise RuntimeError(f"{args.url} answered {response.status_code}")
+        with lock:
+            latencies.append(elapsed)
+
+    before = _setups()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        list(executor.map(request, range(args.requests)))
+    wall = time.perf_counter() - started
+    setups = _setups() - before
+
+    latencies.sort()
+    stats = connection_stats()[0]
+    mode = "pool" if stats["pooled"] else f"CONN_MAX_AGE={stats['conn_max_age']}"
+    print(f"mode: {mode}, threads: {args.threads}, requests: {len(latencies)}")
+    print(f"connection setups: {setups}")
+    print(f"throughput: {len(latencies) / wall:.0f} req/s")
+    print(f"p50: {_percentile(latencies, 50) * 1000:.2f} ms, p99: {_percentile(latencies, 99) * 1000:.2f} ms")
+    if stats["pool"]:
+        print(f"pool: {stats['pool']}")
+
+
+def _setups() -> int:
+    """Physical connections opened so far: the pool's counter, or connection_created without a pool."""
+    stats = connection_stats()[0]
+    if stats["pooled"]:
+        return (stats["pool"] or {}).get("connections_num", 0)
+    return stats["connection_created"]
+
+
+def _percentile(ordered, percent: int) -> float:
+    return ordered[min(len(ordered) - 1, len(ordered) * percent // 100)]
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""Benchmark: memory and cold first-request latency, Procfile command vs gunicorn.conf.py
+
+Not collected by pytest (file name does not match python_files). Starts
+gunicorn twice on a free local port,
+- procfile: ``gunicorn config.wsgi:application --workers N`` (no config
+            module, what Procfile ran before gunicorn.conf.py)
+- conf:     ``gunicorn config.wsgi:application -c gunicorn.conf.py`` with
+            the same number of workers (preload, warm-up, gc.freeze)
+and for each prints the latency of the first request every worker answers
+after start-up, then the total RSS and PSS (proportional set size, shared
+pages split between the processes) of the master and its workers. PSS is the
+number that shows copy-on-write sharing; RSS counts shared pages once per
+process. Linux only (/proc); needs gunicorn and the same environment
+(DB_* / USE_SQLITE) as the app.
+
+실행 방법:
+    python -m tests.benchmarks.bench_server_startup --workers 4
+    python -m tests.benchmarks.bench_server_startup --workers 4 --path /dashboard/
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--path", default="/login/", help="Page requested first (no login needed)")
+    parser.add_argument("--settle", type=float, default=2.0, help="Seconds to wait after the workers boot")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # An empty config module, so the procfile run does not pick up ./gunicorn.conf.py
+        empty_conf = Path(tmp) / "procfile.conf.py"
+        empty_conf.write_text("")
+        modes = {
+            "procfile": ["-c", str(empty_conf), "--workers", str(args.workers)],
+            "conf": ["-c", str(REPO_ROOT / "gunicorn.conf.py")],
+        }
+
+        print(f"{'mode':>9} {'first ms':>9} {'max first ms':>13} {'RSS MB':>8} {'PSS MB':>8} {'procs':>6}")
+        for name, options in modes.items():
+            result = _measure(options, args)
+            print(
+                f"{name:>9} {result['first'] * 1000:>9.1f} {result['max_first'] * 1000:>13.1f} "
+                f"{result['rss']:>8.1f} {result['pss']:>8.1f} {result['processes']:>6}"
+            )
+
+
+def _measure(options: List[str], args) -> Dict[str, float]:
+    port = _free_port()
+    env = {**os.environ, "PORT": str(port), "WEB_CONCURRENCY": str(args.workers)}
+    command = [
+        sys.executable, "-m", "gunicorn", "config.wsgi:application",
+        "--bind", f"127.0.0.1:{port}", *options,
+    ]
+    server = subprocess.Popen(command, cwd=REPO_ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        _wait_for_workers(server.pid, args.workers)
+        _wait_for_port(port)
+        time.sleep(args.settle)
+
+        # One request per worker, all at once, so each worker answers its first request
+        url = f"http://127.0.0.1:{port}{args.path}"
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            latencies = list(executor.map(lambda _: _timed_get(url), range(args.workers)))
+
+        processes = [server.pid, *_children(server.pid)]
+        rss = sum(_memory_kb(pid, "Rss") for pid in processes) / 1024
+        pss = sum(_memory_kb(pid, "Pss") for pid in processes) / 1024
+        return {
+            "first": min(latencies),
+            "max_first": max(latencies),
+            "rss": rss,
+            "pss": pss,
+            "processes": len(processes),
+        }
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def _timed_get(url: str) -> float:
+    started = time.perf_counter()
+    try:
+        with urllib.request.urlopen(url, timeout=60) as response:
+            response.read()
+    except urllib.error.HTTPError as error:  # a redirect or 4xx still measures the worker
+        error.read()
+    return time.perf_counter() - started
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _wait_for_port(port: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"gunicorn did not listen on {port}")
+
+
+def _wait_for_workers(pid: int, count: int, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if len(_children(pid)) >= count:
+            return
+        time.sleep(0.1)
+    raise RuntimeError(f"gunicorn did not start {count} workers")
+
+
+def _children(pid: int) -> List[int]:
+    try:
+        return [int(child) for child in Path(f"/proc/{pid}/task/{pid}/children").read_text().split()]
+    except OSError:
+        return []
+
+
+def _memory_kb(pid: int, field: str) -> int:
+    """A field of /proc/<pid>/smaps_rollup in kB (0 when the process is gone)."""
+    try:
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            if line.startswith(f"{field}:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,16 @@ from django.test import Client
 from tests.factories import UserFactory
 
 
+def pytest_addoption(parser):
+    """tests/performance의 기준선 갱신 옵션 (경로를 지정하지 않은 실행에서도 인식되도록 여기에 등록)"""
+    parser.addoption(
+        "--update-perf-baseline",
+        action="store_true",
+        default=False,
+        help="Write the time budget measurements of this run to tests/performance/baseline.json",
+    )
+
+
 @pytest.fixture
 def authenticated_user(db):
     """인증된 테스트 사용자 반환
@@ -0,0 +1,139 @@
+"""Integration Tests for Session and User Caching
+
+테스트 대상: config/auth_backends.py의 CachedModelBackend와 cached_db 세션 설정
+
+로그인한 사용자의 차트 API 요청이 세션/사용자 조회 없이 처리되는지(쿼리 수),
+로그아웃·비밀번호 변경·비활성화 시 캐시가 즉시 무효화되는지 검증합니다.
+
+실행 방법:
+    pytest tests/integration/test_auth_cache.py -v
+"""
+
+from decimal import Decimal
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+
+from apps.ingest.models import MetricRecord
+from config import auth_backends
+
+CACHED_SESSIONS = "django.contrib.sessions.backends.cached_db"
+CHART_URL = "/api/dashboard/chart-data/?metric_type=PAPER"
+
+
+@override_settings(AUTH_USER_CACHE_ALIAS="default")  # 테스트는 단일 프로세스이므로 LocMem 버전으로 충분
+class AuthCacheTestBase(TestCase):
+    """로그인된 클라이언트와 차트 데이터 준비"""
+
+    def setUp(self):
+        cache.clear()
+        auth_backends.clear_user_cache()
+        self.user = User.objects.create_user(username="testuser", password="testpass123")
+        MetricRecord.objects.create(
+            year=2024, department="컴퓨터공학과", metric_type="PAPER", metric_value=Decimal("10")
+        )
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class CachedChartRequestTests(AuthCacheTestBase):
+    """세션과 사용자가 캐시되면 차트 요청은 DB 쿼리 1개 이하"""
+
+    def test_cached_chart_request_is_one_query(self):
+        """응답 캐시 적중 시 남는 쿼리는 데이터 버전 조회뿐"""
+        self.client.get(CHART_URL)
+
+        with self.assertNumQueries(1):
+            response = self.client.get(CHART_URL)
+        self.assertEqual(response["X-Cache"], "HIT")
+
+    def test_repeated_requests_do_not_reload_the_user(self):
+        self.client.get(CHART_URL)
+
+        with self.assertNumQueries(3):
+            for _ in range(3):
+                self.client.get(CHART_URL)
+
+    @override_settings(SESSION_ENGINE="django.contrib.sessions.backends.db")
+    def test_database_sessions_still_skip_the_user_query(self):
+        """DB 세션이면 세션 조회 1개 + 데이터 버전 조회 1개"""
+        self.client.get(CHART_URL)
+
+        with self.assertNumQueries(2):
+            self.client.get(CHART_URL)
+
+    @override_settings(AUTH_USER_CACHE_TIMEOUT=0)
+    def test_timeout_zero_disables_the_user_cache(self):
+        self.client.get(CHART_URL)
+
+        with self.assertNumQueries(2):  # user + data version
+            self.client.get(CHART_URL)
+
+    @override_settings(AUTH_USER_CACHE_ALIAS=None)
+    def test_no_version_cache_disables_the_user_cache(self):
+        """공유 버전 캐시가 없으면 다른 워커의 변경을 알 수 없으므로 캐시하지 않음"""
+        self.client.get(CHART_URL)
+
+        with self.assertNumQueries(2):  # user + data version
+            self.client.get(CHART_URL)
+
+
+@override_settings(SESSION_ENGINE=CACHED_SESSIONS)
+class UserCacheInvalidationTests(AuthCacheTestBase):
+    """로그아웃, 비밀번호 변경, 비활성화는 캐시된 사용자를 즉시 무효화"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.get(CHART_URL)  # warm the session and user caches
+
+    def test_logout_ends_the_session(self):
+        self.client.post("/logout/")
+
+        self.assertNotIn(self.user.pk, auth_backends._users)
+        self.assertEqual(self.client.get(CHART_URL).status_code, 401)
+
+    def test_password_change_ends_other_sessions(self):
+        self.user.set_password("new-password-456")
+        self.user.save()
+
+        self.assertEqual(self.client.get(CHART_URL).status_code, 401)
+
+    def test_password_change_in_another_worker_ends_the_session(self):
+        """다른 워커의 변경: 이 프로세스의 캐시 항목은 남아 있지만 공유 버전이 바뀌어 다시 조회"""
+        User.objects.filter(pk=self.user.pk).update(password=make_password("new-password-456"))
+        # What the other worker's post_save does to the shared cache (its local forget_user is not seen here)
+        with mock.patch.object(auth_backends, "forget_user"):
+            auth_backends.invalidate_user(self.user.pk)
+        self.assertIn(self.user.pk, auth_backends._users)
+
+        self.assertEqual(self.client.get(CHART_URL).status_code, 401)
+
+    def test_deactivated_user_is_rejected(self):
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.user.refresh_from_db()
+        self.user.save()  # update() sends no signal; admin edits go through save()
+
+        self.assertEqual(self.client.get(CHART_URL).status_code, 401)
+
+    def test_async_lookup_shares_the_cache(self):
+        """비동기 뷰의 request.auser()도 같은 캐시를 사용"""
+        backend = auth_backends.CachedModelBackend()
+
+        with self.assertNumQueries(0):
+            user = async_to_sync(backend.aget_user)(self.user.pk)
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_cached_user_is_a_copy(self):
+        """요청마다 별도 객체이므로 요청 중 설정한 속성이 다른 요청에 남지 않음"""
+        backend = auth_backends.CachedModelBackend()
+        first = backend.get_user(self.user.pk)
+        first.request_only = True
+
+        second = backend.get_user(self.user.pk)
+        self.assertEqual(second.pk, self.user.pk)
+        self.assertFalse(hasattr(second, "request_only"))
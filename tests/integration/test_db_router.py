@@ -0,0 +1,151 @@
+"""Integration Tests for Read Replica Routing
+
+테스트 대상: config/db_router.py의 PrimaryReplicaRouter, read_from_replica,
+primary_pinning_middleware
+
+로컬 SQLite의 두 별칭(default, replica; 테스트에서는 replica가 default의 미러)으로
+대시보드 조회가 replica로, 세션/사용자 조회와 쓰기가 primary로 가는지,
+쓰기 직후 해당 브라우저가 primary에 고정되는지 검증합니다.
+
+실행 방법:
+    pytest tests/integration/test_db_router.py -v
+"""
+
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.test import Client, SimpleTestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from apps.ingest.facets import rebuild_facets
+from apps.ingest.models import MetricRecord
+from apps.ingest.rollups import rebuild_rollups
+from config import db_router
+from config.db_router import PIN_COOKIE, PrimaryReplicaRouter, replica_reads
+
+REPLICA = "replica"
+CHART_URL = "/api/dashboard/chart-data/?department=컴퓨터공학과&metric_type=PAPER&year_from=2023"
+
+
+@override_settings(READ_REPLICA_ALIAS=REPLICA)
+class RouterDecisionTests(SimpleTestCase):
+    """라우팅 결정: 범위, 앱, 고정, 트랜잭션"""
+
+    databases = {DEFAULT_DB_ALIAS, REPLICA}
+
+    def setUp(self):
+        self.router = PrimaryReplicaRouter()
+
+    def test_reads_outside_a_replica_view_use_the_primary(self):
+        self.assertEqual(self.router.db_for_read(MetricRecord), DEFAULT_DB_ALIAS)
+
+    def test_dashboard_reads_use_the_replica(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(MetricRecord), REPLICA)
+
+    def test_sessions_and_users_stay_on_the_primary(self):
+        """갓 로그인한 세션이 복제 지연 때문에 401이 되지 않도록"""
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(User), DEFAULT_DB_ALIAS)
+
+    def test_pinned_session_reads_the_primary(self):
+        token = db_router._pinned.set(True)
+        try:
+            with replica_reads():
+                self.assertEqual(self.router.db_for_read(MetricRecord), DEFAULT_DB_ALIAS)
+        finally:
+            db_router._pinned.reset(token)
+
+    def test_writes_and_migrations_use_the_primary(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_write(MetricRecord), DEFAULT_DB_ALIAS)
+        self.assertTrue(self.router.allow_migrate(DEFAULT_DB_ALIAS, "ingest"))
+        self.assertFalse(self.router.allow_migrate(REPLICA, "ingest"))
+
+    @override_settings(READ_REPLICA_ALIAS=None)
+    def test_routing_is_off_without_a_replica(self):
+        with replica_reads():
+            self.assertEqual(self.router.db_for_read(MetricRecord), DEFAULT_DB_ALIAS)
+
+
+@override_settings(READ_REPLICA_ALIAS=REPLICA)
+class ReplicaRoutingTests(TransactionTestCase):
+    """두 별칭에 대한 실제 요청 (커밋된 데이터가 replica 연결에서도 보이도록 TransactionTestCase)"""
+
+    databases = {DEFAULT_DB_ALIAS, REPLICA}
+
+    def setUp(self):
+        cache.clear()
+        User.objects.create_user(username="testuser", password="testpass123")
+        for year, value in ((2023, "10"), (2024, "15")):
+            MetricRecord.objects.create(
+                year=year, department="컴퓨터공학과", metric_type="PAPER", metric_value=Decimal(value)
+            )
+        rebuild_facets()
+        rebuild_rollups()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+    def _get(self, url):
+        with CaptureQueriesContext(connections[DEFAULT_DB_ALIAS]) as primary:
+            with CaptureQueriesContext(connections[REPLICA]) as replica:
+                response = self.client.get(url)
+                if response.streaming:
+                    b"".join(response.streaming_content)
+        return response, primary, replica
+
+    def _tables(self, queries):
+        return " ".join(query["sql"] for query in queries)
+
+    def test_chart_data_is_read_from_the_replica(self):
+        response, primary, replica = self._get(CHART_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ingest_metricrecord", self._tables(replica))
+        self.assertIn("ingest_dataversion", self._tables(replica))
+        self.assertNotIn("ingest_", self._tables(primary))
+        self.assertIn("django_session", self._tables(primary))
+
+    def test_dashboard_facets_are_read_from_the_replica(self):
+        response, primary, replica = self._get("/dashboard/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ingest_metricfacet", self._tables(replica))
+
+    def test_streamed_export_is_read_from_the_replica(self):
+        """응답 스트리밍은 뷰가 끝난 뒤에 진행되지만 쿼리는 replica에서 실행"""
+        response, primary, replica = self._get("/api/dashboard/export/?file_format=csv")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("ingest_metricrecord", self._tables(replica))
+        self.assertNotIn("ingest_metricrecord", self._tables(primary))
+
+    def test_write_pins_the_browser_to_the_primary(self):
+        """POST 성공 후에는 고정 쿠키가 설정되고 이후 조회는 primary에서 실행"""
+        response = self.client.post("/login/", {"username": "testuser", "password": "testpass123"})
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(PIN_COOKIE, response.cookies)
+
+        response, primary, replica = self._get(CHART_URL)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(replica), 0)
+        self.assertIn("ingest_metricrecord", self._tables(primary))
+
+    def test_failed_write_does_not_pin(self):
+        response = Client(enforce_csrf_checks=True).post("/logout/")
+
+        self.assertEqual(response.status_code, 403)
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    def test_reads_inside_a_transaction_use_the_primary(self):
+        with transaction.atomic(), replica_reads():
+            self.assertEqual(MetricRecord.objects.all().db, DEFAULT_DB_ALIAS)
+
+    @override_settings(READ_REPLICA_ALIAS=None)
+    def test_no_pin_cookie_without_a_replica(self):
+        response = self.client.post("/login/", {"username": "testuser", "password": "testpass123"})
+
+        self.assertNotIn(PIN_COOKIE, response.cookies)
@@ -0,0 +1,121 @@
+"""Performance Suite Fixtures - time budgets against a stored baseline
+
+Tests marked ``performance`` measure a call with the ``time_budget`` fixture.
+The best of several runs is compared with the same entry in baseline.json:
+a run slower than baseline x tolerance fails, and every measurement is
+listed in a table at the end of the session.
+
+The marked tests are deselected by default (pytest.ini: -m "not performance").
+
+실행 방법:
+    pytest tests/performance -m performance
+    pytest tests/performance -m performance --update-perf-baseline   # 현재 측정값을 기준선으로 저장
+    PERF_TOLERANCE=2.0 pytest tests/performance -m performance        # 느린 CI 머신
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+DEFAULT_TOLERANCE = 1.5
+
+# --update-perf-baseline 옵션은 tests/conftest.py에 등록 (pytest는 최상위 conftest의 옵션만 항상 읽음)
+
+# 세션 동안의 측정값 (요약 표와 기준선 갱신에 사용)
+_results: List[Dict[str, Any]] = []
+
+
+def _load_baseline() -> Dict[str, Any]:
+    try:
+        with open(BASELINE_PATH) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"timings_ms": {}}
+
+
+def _tolerance(baseline: Dict[str, Any]) -> float:
+    return float(os.getenv("PERF_TOLERANCE") or baseline.get("tolerance", DEFAULT_TOLERANCE))
+
+
+@pytest.fixture
+def time_budget(request):
+    """Measure fn() (best of repeat runs) and fail when it exceeds baseline x tolerance.
+
+    Example:
+        def test_build(time_budget):
+            time_budget("to_chartjs", 10_000, lambda: to_chartjs(records), repeat=5)
+    """
+    baseline = _load_baseline()
+    tolerance = _tolerance(baseline)
+    updating = request.config.getoption("--update-perf-baseline")
+
+    def measure(name: str, rows: int, fn: Callable[[], Any], repeat: int = 3) -> float:
+        fn()  # warm-up (imports, query compilation, caches)
+        best = float("inf")
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            best = min(best, time.perf_counter() - started)
+
+        key = f"{name}[{rows}]"
+        run_ms = round(best * 1000, 3)
+        baseline_ms = baseline["timings_ms"].get(key)
+        _results.append({"key": key, "baseline_ms": baseline_ms, "run_ms": run_ms, "tolerance": tolerance})
+
+        if baseline_ms is not None and not updating:
+            budget_ms = baseline_ms * tolerance
+            assert run_ms <= budget_ms, (
+                f"{key}: {run_ms:.1f} ms exceeds the budget of {budget_ms:.1f} ms "
+                f"(baseline {baseline_ms:.1f} ms x {tolerance})"
+            )
+        return best
+
+    return measure
+
+
+def _status(result: Dict[str, Any]) -> str:
+    if result["baseline_ms"] is None:
+        return "new"
+    ratio = result["run_ms"] / result["baseline_ms"] if result["baseline_ms"] else 1.0
+    if ratio > result["tolerance"]:
+        return "REGRESSION"
+    if ratio < 1 / result["tolerance"]:
+        return "faster"
+    return "ok"
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Table of this run against the baseline; with --update-perf-baseline, save it."""
+    if not _results:
+        return
+    terminalreporter.section("performance budgets")
+    terminalreporter.write_line(
+        f"{'measurement':<40} {'baseline ms':>12} {'run ms':>10} {'change':>8}  status"
+    )
+    for result in _results:
+        baseline_ms = result["baseline_ms"]
+        change = (
+            f"{(result['run_ms'] / baseline_ms - 1) * 100:+.0f}%" if baseline_ms else "-"
+        )
+        terminalreporter.write_line(
+            f"{result['key']:<40} {baseline_ms if baseline_ms is not None else '-':>12} "
+            f"{result['run_ms']:>10.1f} {change:>8}  {_status(result)}"
+        )
+
+    if config.getoption("--update-perf-baseline"):
+        previous = _load_baseline()
+        timings = dict(previous.get("timings_ms", {}))
+        timings.update((result["key"], result["run_ms"]) for result in _results)
+        baseline = {
+            "tolerance": previous.get("tolerance", DEFAULT_TOLERANCE),
+            "timings_ms": dict(sorted(timings.items())),
+        }
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(baseline, f, indent=2)
+            f.write("\n")
+        terminalreporter.write_line(f"baseline written to {BASELINE_PATH}")
@@ -0,0 +1,66 @@
+"""Synthetic data for the performance suite
+
+Not collected by pytest. seed_records() inserts MetricRecord rows shaped like
+the real uploads (yearly rows per department and metric type, optional
+monthly rows) with bulk_create, and make_records() builds the same rows in
+memory for the chart functions, which do not touch the database.
+"""
+
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List
+
+from apps.ingest.models import MetricRecord
+
+FIRST_YEAR = 2000
+BATCH_SIZE = 5000
+
+
+def _rows(count: int, years: int, departments: int) -> Iterator[Dict[str, Any]]:
+    """count distinct (year, department, metric_type) rows; metric types grow with count."""
+    for index in range(count):
+        yield {
+            "year": FIRST_YEAR + index % years,
+            "department": f"dept-{index // years % departments:03d}",
+            "metric_type": f"METRIC_{index // (years * departments):03d}",
+            "metric_value": Decimal(index % 100000) / 100,
+        }
+
+
+def make_records(count: int, years: int = 25, departments: int = 200) -> List[Dict[str, Any]]:
+    """get_dashboard_data() rows in memory, in the order the query returns them."""
+    return sorted(
+        _rows(count, years, departments),
+        key=lambda row: (row["year"], row["department"], row["metric_type"]),
+    )
+
+
+def seed_records(count: int, years: int = 25, departments: int = 200, monthly_metric_types: int = 0) -> int:
+    """Insert count yearly rows (and monthly rows for the first metric types). Returns the rows inserted."""
+    batch: List[MetricRecord] = []
+    inserted = 0
+
+    def flush() -> None:
+        nonlocal inserted
+        MetricRecord.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+        inserted += len(batch)
+        batch.clear()
+
+    for row in _rows(count, years, departments):
+        batch.append(MetricRecord(**row))
+        if len(batch) >= BATCH_SIZE * 10:
+            flush()
+    for metric in range(monthly_metric_types):
+        for year in range(FIRST_YEAR, FIRST_YEAR + years):
+            for department in range(departments):
+                for month in range(1, 13):
+                    batch.append(
+                        MetricRecord(
+                            year=year,
+                            month=month,
+                            department=f"dept-{department:03d}",
+                            metric_type=f"MONTHLY_{metric:03d}",
+                            metric_value=Decimal(month),
+                        )
+                    )
+    flush()
+    return inserted
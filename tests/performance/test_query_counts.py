@@ -0,0 +1,138 @@
+"""Query-count regression guard for the dashboard page and the chart API
+
+테스트 대상: DashboardView, ChartDataAPIView, AsyncChartDataView
+
+실제 업로드와 비슷한 규모(10개 연도 x 30개 학과 x 12개 지표의 연간 데이터 +
+월별 지표 2개, 약 1만 행)를 넣고, 화면과 필터 조합마다 실행되는 쿼리 수를
+정확히 고정합니다. 쿼리 수는 데이터 양과 무관해야 하므로, N+1 쿼리나 행마다
+실행되는 조회가 추가되면 이 테스트가 실패합니다.
+
+쿼리 수가 바뀌는 변경이라면 숫자와 주석을 함께 갱신하세요.
+
+실행 방법:
+    pytest tests/performance/test_query_counts.py -v
+"""
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+
+from apps.dashboard.documents import rebuild_documents
+from apps.ingest.facets import rebuild_facets
+from apps.ingest.rollups import rebuild_rollups
+from config import auth_backends
+from tests.performance.data import FIRST_YEAR, seed_records
+
+YEARS = 10
+DEPARTMENTS = 30
+METRIC_TYPES = 12
+LAST_YEAR = FIRST_YEAR + YEARS - 1
+
+CHART_URL = "/api/dashboard/chart-data/"
+ASYNC_CHART_URL = "/api/dashboard/chart-data-async/"
+
+# (이름, 쿼리 문자열, X-Cache, 첫 요청 쿼리 수, 반복 요청 쿼리 수)
+# 첫 요청: session, user, data version, chart query (문서는 data version 대신 document 1개)
+# 반복 요청: session, data version (사용자와 응답은 캐시됨; 문서는 document)
+CHART_FILTERS = [
+    ("default", "", "DOCUMENT", 3, 2),
+    ("year_department", f"?year={LAST_YEAR}&department=dept-001", "DOCUMENT", 3, 2),
+    ("metric_year_range", f"?metric_type=METRIC_001&year_from={LAST_YEAR - 2}", "MISS", 4, 2),
+    (
+        "department_comparison",
+        "?department=dept-001&department=dept-002&metric_type=METRIC_001&metric_type=METRIC_002"
+        f"&year_from={LAST_YEAR - 4}&year_to={LAST_YEAR}",
+        "MISS", 4, 2,
+    ),
+    ("monthly", "?resolution=month&department=dept-001&metric_type=MONTHLY_000", "MISS", 4, 2),
+    ("all_departments_avg", "?aggregation=avg", "MISS", 4, 2),
+    ("year_over_year", "?derive=yoy&department=dept-001&metric_type=METRIC_001", "MISS", 4, 2),
+    ("moving_average", "?derive=moving_avg&window=3&department=dept-001", "MISS", 4, 2),
+    ("grid", f"?shape=grid&year={LAST_YEAR}", "MISS", 4, 2),
+    ("department_totals", "?shape=metric_by_department", "MISS", 4, 2),
+]
+
+
+@override_settings(AUTH_USER_CACHE_ALIAS="default")
+class QueryCountTestBase(TestCase):
+    """약 1만 행의 데이터와 로그인된 클라이언트"""
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_records(YEARS * DEPARTMENTS * METRIC_TYPES, years=YEARS, departments=DEPARTMENTS, monthly_metric_types=2)
+        rebuild_facets()
+        rebuild_rollups()
+        rebuild_documents()
+        User.objects.create_user(username="testuser", password="testpass123")
+
+    def setUp(self):
+        cache.clear()
+        auth_backends.clear_user_cache()
+        self.client = Client()
+        self.client.login(username="testuser", password="testpass123")
+
+
+class ChartQueryCountTests(QueryCountTestBase):
+    """차트 API: 필터 조합별 쿼리 수는 데이터 양과 무관하게 고정"""
+
+    def assert_query_counts(self, url):
+        for name, query_string, x_cache, first, repeated in CHART_FILTERS:
+            with self.subTest(filters=name):
+                cache.clear()
+                auth_backends.clear_user_cache()
+
+                with self.assertNumQueries(first):
+                    response = self.client.get(url + query_string)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response["X-Cache"], x_cache)
+
+                with self.assertNumQueries(repeated):
+                    response = self.client.get(url + query_string)
+                self.assertEqual(response["X-Cache"], "DOCUMENT" if x_cache == "DOCUMENT" else "HIT")
+
+    def test_chart_api(self):
+        self.assert_query_counts(CHART_URL)
+
+    def test_async_chart_api(self):
+        """비동기 뷰도 같은 SQL을 실행"""
+        self.assert_query_counts(ASYNC_CHART_URL)
+
+    def test_conditional_request(self):
+        """304: session, data version (차트 쿼리 없음)"""
+        url = f"{CHART_URL}?metric_type=METRIC_001"
+        etag = self.client.get(url)["ETag"]
+
+        with self.assertNumQueries(2):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_invalid_parameters(self):
+        """400: session, user (데이터 조회 없음)"""
+        with self.assertNumQueries(2):
+            response = self.client.get(f"{CHART_URL}?year=abc")
+        self.assertEqual(response.status_code, 400)
+
+    def test_anonymous_request(self):
+        """401: 세션 쿠키가 없으면 쿼리 없음"""
+        with self.assertNumQueries(0):
+            response = Client().get(CHART_URL)
+        self.assertEqual(response.status_code, 401)
+
+
+class DashboardQueryCountTests(QueryCountTestBase):
+    """대시보드 페이지: 학과/연도 수와 무관하게 고정"""
+
+    def test_first_load(self):
+        """session, user, data version, filter options (facet 테이블)"""
+        with self.assertNumQueries(4):
+            response = self.client.get("/dashboard/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.context["default_filters"]["departments"]), DEPARTMENTS)
+
+    def test_repeated_load(self):
+        """session, data version (사용자와 필터 옵션은 캐시됨)"""
+        self.client.get("/dashboard/")
+
+        with self.assertNumQueries(2):
+            response = self.client.get("/dashboard/")
+        self.assertEqual(response.status_code, 200)
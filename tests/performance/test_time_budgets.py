@@ -0,0 +1,57 @@
+"""Time budgets for the chart data path at 10k, 100k and 1M rows
+
+테스트 대상: get_dashboard_data (DB 조회), to_chartjs, format_chart_data
+
+행 수별 호출 시간(여러 번 중 최솟값)을 baseline.json과 비교합니다.
+기준선 x 허용 배율(기본 1.5)을 넘으면 실패하고, 세션 끝에 비교 표를 출력합니다.
+1M 행 시드에는 수십 초가 걸리므로 기본 실행에서는 제외됩니다.
+
+실행 방법:
+    pytest tests/performance -m performance
+    pytest tests/performance -m performance -k "10000 or 100000"
+"""
+
+import pytest
+
+from apps.dashboard.services import get_dashboard_data, to_chartjs
+from apps.dashboard.utils.chart_adapter import format_chart_data
+from tests.performance.data import make_records, seed_records
+
+pytestmark = pytest.mark.performance
+
+SIZES = [10_000, 100_000, 1_000_000]
+
+
+def _repeat(rows: int) -> int:
+    return 5 if rows <= 100_000 else 2
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("rows", SIZES)
+def test_get_dashboard_data(time_budget, rows):
+    """필터 없는 조회: 모든 연간 행을 읽어 dict로 변환"""
+    seed_records(rows)
+
+    records = get_dashboard_data()
+    assert len(records) == rows
+
+    time_budget("get_dashboard_data", rows, get_dashboard_data, repeat=_repeat(rows))
+
+
+@pytest.mark.parametrize("rows", SIZES)
+def test_to_chartjs(time_budget, rows):
+    records = make_records(rows)
+
+    chart = to_chartjs(records)
+    assert chart["labels"]
+
+    time_budget("to_chartjs", rows, lambda: to_chartjs(records), repeat=_repeat(rows))
+
+
+@pytest.mark.parametrize("rows", SIZES)
+def test_format_chart_data(time_budget, rows):
+    records = make_records(rows)
+
+    assert len(format_chart_data(records)["data"]) == rows
+
+    time_budget("format_chart_data", rows, lambda: format_chart_data(records), repeat=_repeat(rows))
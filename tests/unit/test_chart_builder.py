@@ -0,0 +1,105 @@
+"""Unit Tests for Chart Builder
+
+테스트 대상: apps/dashboard/utils/chart_builder.py의 build_chart() 함수
+
+각 차트 형태(metric_by_year, metric_by_department, grid)의 결과와
+기존 to_chartjs() 결과와의 호환성을 검증합니다.
+
+실행 방법:
+    pytest tests/unit/test_chart_builder.py -v
+"""
+
+import pytest
+from decimal import Decimal
+
+from apps.dashboard.utils.chart_builder import (
+    SHAPE_GRID,
+    SHAPE_METRIC_BY_DEPARTMENT,
+    SHAPE_METRIC_BY_YEAR,
+    build_chart,
+)
+
+
+RECORDS = [
+    {"year": 2024, "department": "경영학과", "metric_type": "PAPER", "metric_value": Decimal("8")},
+    {"year": 2023, "department": "컴퓨터공학과", "metric_type": "PAPER", "metric_value": Decimal("10")},
+    {"year": 2023, "department": "컴퓨터공학과", "metric_type": "BUDGET", "metric_value": Decimal("1000")},
+    {"year": 2024, "department": "컴퓨터공학과", "metric_type": "PAPER", "metric_value": Decimal("15")},
+]
+
+
+class TestChartBuilder:
+    """build_chart() 함수의 단위 테스트"""
+
+    def test_metric_by_year_sorts_labels_and_fills_gaps(self):
+        """연도 라벨은 정렬되고, 값이 없는 칸은 0으로 채워짐"""
+        result = build_chart(RECORDS, SHAPE_METRIC_BY_YEAR)
+
+        assert result["labels"] == ["2023", "2024"]
+        datasets = {ds["label"]: ds["data"] for ds in result["datasets"]}
+        assert datasets["BUDGET"] == [1000.0, 0]
+        assert datasets["PAPER"] == [10.0, 23.0], "같은 칸의 학과 값은 합산됨"
+
+    def test_metric_by_year_monthly_labels(self):
+        """월 단위 레코드는 YYYY-MM 라벨을 시간 순서대로 사용"""
+        records = [
+            {"year": 2024, "month": 11, "metric_type": "PUBLICATION", "metric_value": 2},
+            {"year": 2024, "month": 2, "metric_type": "PUBLICATION", "metric_value": 1},
+        ]
+
+        result = build_chart(records)
+
+        assert result["labels"] == ["2024-02", "2024-11"]
+        assert result["datasets"][0]["data"] == [1.0, 2.0]
+
+    def test_metric_by_department(self):
+        """학과별 라벨, 지표별 데이터셋"""
+        records = [r for r in RECORDS if r["year"] == 2024]
+
+        result = build_chart(records, SHAPE_METRIC_BY_DEPARTMENT)
+
+        assert result["labels"] == ["경영학과", "컴퓨터공학과"]
+        assert result["datasets"][0]["label"] == "PAPER"
+        assert result["datasets"][0]["data"] == [8.0, 15.0]
+        assert result["datasets"][0]["backgroundColor"] == "#4A90E2"
+
+    def test_grid(self):
+        """학과 × 지표 행렬, 값이 없는 칸은 None"""
+        records = [r for r in RECORDS if r["year"] == 2023] + [RECORDS[0]]
+
+        result = build_chart(records, SHAPE_GRID)
+
+        assert result["rows"] == ["경영학과", "컴퓨터공학과"]
+        assert result["columns"] == ["BUDGET", "PAPER"]
+        assert result["values"] == [[None, 8.0], [1000.0, 10.0]]
+        assert len(result["colors"]) == 2
+
+    def test_empty_records(self):
+        """빈 입력은 빈 차트를 반환"""
+        assert build_chart([]) == {"labels": [], "datasets": []}
+        assert build_chart([], SHAPE_GRID) == {"rows": [], "columns": [], "values": [], "colors": []}
+
+    def test_unknown_shape_raises(self):
+        """지원하지 않는 형태는 ValueError"""
+        with pytest.raises(ValueError):
+            build_chart(RECORDS, "pie")
+
+    def test_accepts_generators(self):
+        """레코드를 한 번만 순회하므로 제너레이터도 입력 가능"""
+        result = build_chart(r for r in RECORDS)
+        assert result["labels"] == ["2023", "2024"]
+
+    def test_fill_none_keeps_gaps(self):
+        """파생 지표는 fill=None으로 값이 없는 칸과 None 값을 공백(None)으로 유지"""
+        records = [
+            {"year": 2023, "department": "컴퓨터공학과", "metric_type": "PAPER", "metric_value": None},
+            {"year": 2024, "department": "컴퓨터공학과", "metric_type": "PAPER", "metric_value": Decimal("2.5")},
+            {"year": 2024, "department": "컴퓨터공학과", "metric_type": "BUDGET", "metric_value": Decimal("-1")},
+        ]
+
+        result = build_chart(records, SHAPE_METRIC_BY_YEAR, fill=None)
+
+        assert result["labels"] == ["2023", "2024"]
+        datasets = {ds["label"]: ds["data"] for ds in result["datasets"]}
+        assert datasets["PAPER"] == [None, 2.5]
+        assert datasets["BUDGET"] == [None, -1.0]
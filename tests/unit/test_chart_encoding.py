@@ -0,0 +1,85 @@
+"""Unit Tests for Chart Payload Encoding
+
+테스트 대상: apps/dashboard/encoding.py의 encode_json(), compress_variants(),
+choose_encoding() 함수
+
+실행 방법:
+    pytest tests/unit/test_chart_encoding.py -v
+"""
+
+import gzip
+import json
+from decimal import Decimal
+
+import pytest
+
+from apps.dashboard.encoding import (
+    ENCODING_BROTLI,
+    ENCODING_GZIP,
+    ENCODING_IDENTITY,
+    MIN_COMPRESS_SIZE,
+    choose_encoding,
+    compress_variants,
+    encode_json,
+)
+
+ALL = (ENCODING_IDENTITY, ENCODING_GZIP, ENCODING_BROTLI)
+
+
+class TestEncodeJson:
+    """encode_json() 함수의 단위 테스트"""
+
+    def test_compact_utf8(self):
+        """공백 없는 JSON, 한글은 이스케이프하지 않음"""
+        body = encode_json({"labels": ["컴퓨터공학과"], "data": [1.5, None]})
+        assert body == '{"labels":["컴퓨터공학과"],"data":[1.5,null]}'.encode("utf-8")
+
+    def test_decimal_as_number(self):
+        """Decimal 값은 숫자로 직렬화"""
+        assert json.loads(encode_json({"value": Decimal("12.5000")})) == {"value": 12.5}
+
+    def test_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            encode_json({"value": object()})
+
+
+class TestCompressVariants:
+    """compress_variants() 함수의 단위 테스트"""
+
+    def test_small_body_is_identity_only(self):
+        assert compress_variants(b"{}") == {ENCODING_IDENTITY: b"{}"}
+
+    def test_gzip_variant_round_trips(self):
+        body = encode_json({"data": list(range(MIN_COMPRESS_SIZE))})
+        variants = compress_variants(body)
+
+        assert variants[ENCODING_IDENTITY] == body
+        assert gzip.decompress(variants[ENCODING_GZIP]) == body
+        assert len(variants[ENCODING_GZIP]) < len(body)
+
+    def test_gzip_bytes_are_deterministic(self):
+        """mtime=0이므로 같은 입력은 같은 바이트"""
+        body = b"x" * MIN_COMPRESS_SIZE
+        assert compress_variants(body)[ENCODING_GZIP] == compress_variants(body)[ENCODING_GZIP]
+
+
+class TestChooseEncoding:
+    """choose_encoding() 함수의 단위 테스트"""
+
+    @pytest.mark.parametrize(
+        "header, available, expected",
+        [
+            ("", ALL, ENCODING_IDENTITY),
+            ("gzip, deflate, br", ALL, ENCODING_BROTLI),
+            ("gzip, deflate, br", (ENCODING_IDENTITY, ENCODING_GZIP), ENCODING_GZIP),
+            ("gzip, deflate", (ENCODING_IDENTITY,), ENCODING_IDENTITY),
+            ("br;q=0.5, gzip", ALL, ENCODING_GZIP),
+            ("gzip;q=0", ALL, ENCODING_IDENTITY),
+            ("gzip;q=0.5, identity", ALL, ENCODING_IDENTITY),
+            ("*", ALL, ENCODING_BROTLI),
+            ("GZIP", ALL, ENCODING_GZIP),
+            ("gzip;q=abc", ALL, ENCODING_IDENTITY),
+        ],
+    )
+    def test_choose_encoding(self, header, available, expected):
+        assert choose_encoding(header, available) == expected
@@ -0,0 +1,88 @@
+"""Unit Tests for the Production Server Configuration
+
+테스트 대상: gunicorn.conf.py의 워커 수 / 워커 클래스 결정과 config/warmup.py의 warm_up()
+
+실행 방법:
+    pytest tests/unit/test_server_config.py -v
+"""
+
+import os
+import runpy
+from pathlib import Path
+from unittest import mock
+
+from config.warmup import warm_up
+
+CONF_PATH = Path(__file__).resolve().parents[2] / "gunicorn.conf.py"
+
+
+def load_conf(**env):
+    """gunicorn.conf.py를 주어진 환경 변수로 읽은 설정 값"""
+    with mock.patch.dict(os.environ, env, clear=False):
+        for name in ("WEB_CONCURRENCY", "GUNICORN_THREADS", "GUNICORN_WORKER_CLASS", "DB_MAX_CONNECTIONS"):
+            if name not in env:
+                os.environ.pop(name, None)
+        return runpy.run_path(str(CONF_PATH))
+
+
+class TestGunicornConf:
+    """워커 수, 스레드, 재시작 설정"""
+
+    def test_preloads_the_app(self):
+        conf = load_conf()
+        assert conf["preload_app"] is True
+        assert conf["workers"] >= 1
+        assert conf["max_requests"] > 0
+
+    def test_threads_select_gthread_workers(self):
+        assert load_conf(GUNICORN_THREADS="4")["worker_class"] == "gthread"
+        assert load_conf(GUNICORN_THREADS="1")["worker_class"] == "sync"
+
+    def test_environment_overrides(self):
+        conf = load_conf(WEB_CONCURRENCY="3", GUNICORN_WORKER_CLASS="uvicorn.workers.UvicornWorker")
+        assert conf["workers"] == 3
+        assert conf["worker_class"] == "uvicorn.workers.UvicornWorker"
+
+    def test_default_keeps_two_workers(self):
+        """CPU가 많은 호스트에서도 기본값은 이전 Procfile과 같은 2개 (DB 커넥션 수 보호)"""
+        with mock.patch("os.sched_getaffinity", return_value=set(range(64))):
+            assert load_conf()["workers"] == 2
+
+    def test_worker_count_is_bounded_by_memory(self):
+        """WEB_CONCURRENCY=auto: 워커당 메모리 예산이 크면 CPU 수와 상관없이 워커가 줄어듦"""
+        small = load_conf(WEB_CONCURRENCY="auto", GUNICORN_WORKER_MEMORY_MB="100000000")
+        assert small["workers"] == 1
+
+    def test_db_max_connections_caps_workers_times_threads(self):
+        conf = load_conf(WEB_CONCURRENCY="8", GUNICORN_THREADS="4", DB_MAX_CONNECTIONS="10")
+        assert (conf["workers"], conf["threads"]) == (2, 4)
+
+        conf = load_conf(WEB_CONCURRENCY="auto", GUNICORN_THREADS="4", DB_MAX_CONNECTIONS="3")
+        assert (conf["workers"], conf["threads"]) == (1, 3)
+
+    def test_large_rss_recycles_the_worker(self):
+        conf = load_conf(GUNICORN_MAX_WORKER_RSS_MB="1")
+        worker = mock.Mock(alive=True, pid=1)
+
+        conf["post_request"](worker, None, {}, None)
+
+        assert worker.alive is False
+
+
+class TestWarmUp:
+    """warm_up()은 URL, 템플릿, 모듈을 불러오고 DB에는 접근하지 않음
+
+    django_db 마크가 없으므로 DB에 접근하면 pytest-django가 실패시킴
+    """
+
+    def test_loads_urls_templates_and_modules(self):
+        summary = warm_up()
+        assert summary["url_patterns"] > 0
+        assert summary["templates"] > 0
+        assert summary["modules"] > 0
+
+    def test_closes_connections_before_fork(self):
+        """워커에 소켓이 상속되지 않도록 마지막에 연결을 모두 닫음"""
+        with mock.patch("config.warmup.connections") as connections:
+            warm_up()
+        connections.close_all.assert_called_once_with()